@@ -0,0 +1,199 @@
+import os
+import random
+import sys
+import tempfile
+import timeit
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "individ", "lab 1", "Zad 2")
+)
+from geometry import (  # noqa: E402
+    BoundingBox,
+    brute_bounding_box,
+    brute_closest_pair,
+    brute_convex_hull,
+    brute_farthest_pair,
+    closest_pair,
+    convex_hull,
+    farthest_pair,
+)
+from point_file import PointFile  # noqa: E402
+from spatial import KDTree  # noqa: E402
+from zad_2 import Point, PointCloud  # noqa: E402
+
+
+def random_points(rng: random.Random, n: int) -> list:
+    return [Point(rng.uniform(-1e3, 1e3), rng.uniform(-1e3, 1e3)) for _ in range(n)]
+
+
+def best_of(func, number: int, repeat: int = 5) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(title: str, cases: list) -> None:
+    print(f"\n{title} (мс)")
+    base = None
+    for name, func in cases:
+        elapsed = best_of(func, 1, 3)
+        base = base or elapsed
+        print(f"{name:>28}: {elapsed * 1e3:9.2f} ({base / elapsed:.1f}x)")
+
+
+def bench_cloud(n: int = 1_000_000) -> None:
+    print(f"Кадр из {n} точек: цикл по Point против PointCloud")
+    rng = random.Random(22)
+    points = random_points(rng, n)
+    others = points[::-1]
+    cloud = PointCloud(points)
+    other_cloud = PointCloud(others)
+    pairs = list(zip(points, others))
+    target = Point(1.0, 2.0)
+    report("Расстояние до начала координат", [
+        ("p.distance_to_origin()", lambda: [p.distance_to_origin() for p in points]),
+        ("distances_to_origin()", cloud.distances_to_origin),
+    ])
+    report("Расстояние до точки", [
+        ("p.distance_to(q)", lambda: [p.distance_to(target) for p in points]),
+        ("distances_to(Point)", lambda: cloud.distances_to(target)),
+    ])
+    report("Попарные расстояния", [
+        ("p.distance_to(q)", lambda: [p.distance_to(q) for p, q in pairs]),
+        ("distances_to(PointCloud)", lambda: cloud.distances_to(other_cloud)),
+    ])
+    report("Полярные координаты", [
+        ("p.to_polar()", lambda: [p.to_polar() for p in points]),
+        ("to_polar()", cloud.to_polar),
+    ])
+    report("Равенство", [
+        ("p == q", lambda: [p == q for p, q in pairs]),
+        ("cloud == cloud", lambda: cloud == other_cloud),
+    ])
+    xy = np.array([(p.first, p.second) for p in points])
+    report("Преобразования", [
+        ("PointCloud(points)", lambda: PointCloud(points)),
+        ("PointCloud.from_array", lambda: PointCloud.from_array(xy)),
+        ("cloud.tolist()", cloud.tolist),
+    ])
+
+
+def brute_nearest(points: list, p: Point, k: int) -> list:
+    """Прежний способ: distance_to до каждой точки и сортировка."""
+    return sorted(points, key=p.distance_to)[:k]
+
+
+def bench_kdtree(n: int = 1_000_000, queries: int = 100_000, naive: int = 3) -> None:
+    print(f"\nKDTree над {n} точками, пачка из {queries} запросов")
+    rng = random.Random(23)
+    points = random_points(rng, n)
+    cloud = PointCloud(points)
+    probes = random_points(rng, queries)
+    probe_cloud = PointCloud(probes)
+    tree = KDTree(cloud)
+    elapsed = best_of(lambda: KDTree(cloud), 1, 1)
+    print(f"{'построение, с':>28}: {elapsed:9.2f}")
+    print("\nЗапросов в секунду")
+    cases = [
+        ("перебор distance_to, k=1", lambda: brute_nearest(points, probes[0], 1), 1),
+        ("cloud.distances_to, k=1", lambda: cloud.distances_to(probes[0]).argmin(), 1),
+        ("tree.nearest, k=1", lambda: tree.nearest(probes[0]), 1),
+        ("tree.query, k=1", lambda: tree.query(probe_cloud, 1), queries),
+        ("tree.query, k=10", lambda: tree.query(probe_cloud, 10), queries),
+        ("tree.query_radius, r=2", lambda: tree.query_radius(probe_cloud, 2), queries),
+    ]
+    for name, func, count in cases:
+        elapsed = best_of(func, 1, naive if count == 1 else 3)
+        print(f"{name:>28}: {count / elapsed:14,.0f}")
+
+
+def bench_geometry(sizes=(1_000, 10_000, 100_000, 1_000_000, 10_000_000)) -> None:
+    print("\nГеометрия: алгоритм против эталона на Point (мс)")
+    # Эталон запускается, пока n не больше предела.
+    cases = [
+        ("closest_pair", closest_pair, brute_closest_pair, 1_000),
+        ("convex_hull", convex_hull, brute_convex_hull, 100_000),
+        ("farthest_pair", farthest_pair, brute_farthest_pair, 1_000),
+        ("BoundingBox", BoundingBox, brute_bounding_box, 1_000_000),
+    ]
+    header = ("точек", "алгоритм", "быстрый", "эталон", "ускорение")
+    print(f"{header[0]:>10}{header[1]:>16}" + "".join(f"{h:>12}" for h in header[2:]))
+    rng = np.random.default_rng(24)
+    for n in sizes:
+        cloud = PointCloud.from_array(rng.uniform(-1e3, 1e3, (n, 2)))
+        points = cloud.tolist() if n <= max(case[3] for case in cases) else None
+        repeat = 3 if n < 1_000_000 else 1
+        for name, fast, brute, limit in cases:
+            new = best_of(lambda: fast(cloud), 1, repeat)
+            line = f"{n:>10}{name:>16}{new * 1e3:>12.2f}"
+            if n <= limit:
+                old = best_of(lambda: brute(points), 1, 1)
+                line += f"{old * 1e3:>12.2f}{old / new:>11.0f}x"
+            else:
+                line += f"{'—':>12}"
+            print(line)
+
+
+def peak_memory(func) -> float:
+    """Пик выделенной памяти за вызов func, МБ."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def csv_points(path: str) -> tuple:
+    """Прежний способ: Point с проверкой float() на каждую строку."""
+    with open(path) as f:
+        points = [Point(*line.split(",")) for line in f]
+    r = [p.distance_to_origin() for p in points]
+    return min(r), max(r)
+
+
+def bench_mmap(n: int = 20_000_000, naive: int = 1_000_000) -> None:
+    rng = np.random.default_rng(25)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "points.csv")
+        np.savetxt(csv_path, rng.uniform(-1e3, 1e3, (naive, 2)), "%.6f", ",")
+        bin_path = os.path.join(tmp, "points.bin")
+        with open(bin_path, "wb") as f:
+            for start in range(0, n, 1 << 20):
+                rng.uniform(-1e3, 1e3, (min(1 << 20, n - start), 2)).tofile(f)
+        size = os.path.getsize(bin_path) / 2**20
+        print(f"\nPointFile: {naive} строк CSV и {n} точек, {size:.0f} МБ на диске")
+        print(f"{'':>28}{'точек/с':>14}{'пик, МБ':>10}")
+        points = PointFile(bin_path)
+        cases = [
+            ("Point на строку CSV", lambda: csv_points(csv_path), naive),
+            (
+                "PointFile.from_csv",
+                lambda: PointFile.from_csv(csv_path, os.path.join(tmp, "c.bin")),
+                naive,
+            ),
+            ("distance_range", points.distance_range, n),
+            ("distance_histogram", lambda: points.distance_histogram(64, (0, 1500)), n),
+            ("angle_histogram", lambda: points.angle_histogram(64), n),
+        ]
+        for name, func, count in cases:
+            elapsed = best_of(func, 1, 1)
+            print(f"{name:>28}{count / elapsed:>14,.0f}{peak_memory(func):>10.1f}")
+
+
+SECTIONS = {
+    "cloud": bench_cloud,
+    "kdtree": bench_kdtree,
+    "geometry": bench_geometry,
+    "mmap": bench_mmap,
+}
+
+
+def main(names: list[str]) -> None:
+    for name in names or SECTIONS:
+        SECTIONS[name]()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,3 +1,3 @@
-from .zad_2 import Point
+from .zad_2 import Point, PointCloud
 
-__all__ = ["Point"]
+__all__ = ["Point", "PointCloud"]
@@ -0,0 +1,331 @@
+import itertools
+import math
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from spatial import Points, as_array, ranks
+from zad_2 import Point, PointCloud
+
+Pair = Tuple[Point, Point]
+
+# Размер блоков, внутри которых ближайшая пара ищется перебором.
+_LEAF = 16
+# Точку полосы достаточно сравнить со следующими семью по y.
+_STRIP = 7
+
+
+def _point(xy: np.ndarray, i: int) -> Point:
+    return Point(*xy[i].tolist())
+
+
+def closest_pair(points: Points) -> Pair:
+    """Ближайшая пара «разделяй и властвуй».
+
+    Точки сортируются по x и режутся на блоки по _LEAF, внутри которых пары
+    перебираются. Затем соседние блоки сливаются уровень за уровнем, все
+    блоки уровня сразу: точки полосы |x - x_mid| < δ упорядочиваются по y
+    внутри блока и сравниваются со следующими, пока разница по y меньше δ.
+    Полосы быстро сужаются, поэтому на обычных данных время O(n log n).
+    Сравниваются квадраты расстояний.
+    """
+    xy = as_array(points)
+    n = len(xy)
+    if n < 2:
+        raise ValueError("Нужно хотя бы две точки.")
+    xy = xy[np.argsort(xy[:, 0])]
+    x, y = xy[:, 0], xy[:, 1]
+    blocks = -(-n // _LEAF)
+    # Последний блок дополняется точками в бесконечности.
+    pad = np.full((blocks * _LEAF - n, 2), np.inf)
+    leaf = np.concatenate([xy, pad]).reshape(blocks, _LEAF, 2)
+    delta = np.full(blocks, np.inf)
+    best = (np.inf, 0, 0)
+    with np.errstate(invalid="ignore"):
+        for step in range(1, _LEAF):
+            diff = leaf[:, step:] - leaf[:, :-step]
+            dist = np.einsum("ijk,ijk->ij", diff, diff)
+            dist[np.isnan(dist)] = np.inf
+            np.minimum(delta, dist.min(axis=1), out=delta)
+            row, col = divmod(int(dist.argmin()), _LEAF - step)
+            if dist[row, col] < best[0]:
+                i = row * _LEAF + col
+                best = (dist[row, col], i, i + step)
+    shift = _LEAF.bit_length() - 1
+    while blocks > 1 and best[0] > 0:
+        if blocks % 2:
+            delta = np.append(delta, np.inf)
+        blocks = len(delta) // 2
+        shift += 1
+        delta = np.minimum(delta[0::2], delta[1::2])
+        # Полоса ищется бинарным поиском по x вокруг первой точки правой половины.
+        start = np.arange(blocks) << shift
+        split = start + (1 << (shift - 1))
+        rows = np.flatnonzero(split < n)
+        start, split = start[rows], split[rows]
+        mid = x[split]
+        radius = np.sqrt(delta[rows]) * (1 + 1e-12)
+        lo = np.maximum(np.searchsorted(x, mid - radius), start)
+        hi = np.minimum(np.searchsorted(x, mid + radius, "right"), start + (1 << shift))
+        counts = np.maximum(hi - lo, 0)
+        cand = np.repeat(lo, counts) + ranks(counts)
+        rows = np.repeat(rows, counts)
+        dx = x[cand] - x[np.repeat(split, counts)]
+        keep = dx * dx < delta[rows]
+        cand, rows = cand[keep], rows[keep]
+        # Порядок по (блок, y); номера блоков в rows от этого не меняются.
+        if 4 * len(cand) > n:
+            # Полоса занимает почти всё: строки матрицы блоков сортируются по y,
+            # точки вне полосы уходят в конец строки.
+            key = np.full(blocks << shift, np.inf)
+            key[cand] = y[cand]
+            order = np.argsort(key.reshape(blocks, -1), axis=1)
+            order += (np.arange(blocks) << shift)[:, None]
+            counts = np.bincount(rows, minlength=blocks)
+            cand = order[np.arange(1 << shift) < counts[:, None]]
+        else:
+            cand = cand[np.lexsort((y[cand], rows))]
+        cx, cy = x[cand], y[cand]
+        reach = delta[rows]
+        i = np.arange(len(cand))
+        for step in range(1, _STRIP + 1):
+            i = i[i < len(cand) - step]
+            j = i + step
+            dy = cy[j] - cy[i]
+            # Дальше по y у этих точек тоже ничего нет.
+            keep = (rows[j] == rows[i]) & (dy * dy < reach[i])
+            i, j, dy = i[keep], j[keep], dy[keep]
+            if not len(i):
+                break
+            dx = cx[j] - cx[i]
+            dist = dx * dx + dy * dy
+            np.minimum.at(delta, rows[i], dist)
+            k = int(dist.argmin())
+            if dist[k] < best[0]:
+                best = (dist[k], cand[i[k]], cand[j[k]])
+    return _point(xy, best[1]), _point(xy, best[2])
+
+
+def _octagon_filter(xy: np.ndarray) -> np.ndarray:
+    """Точки, не лежащие строго внутри восьмиугольника из крайних точек.
+
+    Крайние точки по направлениям x, x + y, y, y - x, ... перечислены против
+    часовой стрелки; всё строго внутри них в оболочку не входит.
+    """
+    x, y = xy[:, 0], xy[:, 1]
+    extremes = [
+        x.argmax(),
+        (x + y).argmax(),
+        y.argmax(),
+        (y - x).argmax(),
+        x.argmin(),
+        (x + y).argmin(),
+        y.argmin(),
+        (x - y).argmax(),
+    ]
+    corners = [tuple(c) for c in xy[extremes].tolist()]
+    corners = [c for c, d in zip(corners, corners[1:] + corners[:1]) if c != d]
+    if len(corners) < 3:
+        return xy
+    inside = np.ones(len(xy), dtype=bool)
+    for (ax, ay), (bx, by) in zip(corners, corners[1:] + corners[:1]):
+        inside &= (bx - ax) * (y - ay) - (by - ay) * (x - ax) > 0
+    return xy[~inside]
+
+
+def _chain(pts: Iterable[tuple]) -> list:
+    """Половина оболочки: точки с поворотом не влево снимаются со стека."""
+    hull: list = []
+    for px, py in pts:
+        while len(hull) >= 2:
+            (ax, ay), (bx, by) = hull[-2], hull[-1]
+            if (bx - ax) * (py - ay) - (by - ay) * (px - ax) > 0:
+                break
+            hull.pop()
+        hull.append((px, py))
+    return hull
+
+
+def _hull(xy: np.ndarray) -> list:
+    xy = _octagon_filter(xy) if len(xy) > 8 else xy
+    xy = xy[np.lexsort((xy[:, 1], xy[:, 0]))]
+    if len(xy):
+        xy = xy[np.r_[True, (np.diff(xy, axis=0) != 0).any(axis=1)]]
+    pts = xy.tolist()
+    if len(pts) < 3:
+        return pts
+    return _chain(pts)[:-1] + _chain(reversed(pts))[:-1]
+
+
+def convex_hull(points: Points) -> List[Point]:
+    """Выпуклая оболочка монотонной цепью Эндрю за O(n log n).
+
+    Вершины идут против часовой стрелки от самой левой нижней точки, точки
+    на рёбрах и повторы не входят. Перед сортировкой отбрасываются точки
+    внутри восьмиугольника из крайних точек.
+    """
+    return [Point(x, y) for x, y in _hull(as_array(points))]
+
+
+def farthest_pair(points: Points) -> Pair:
+    """Самая удалённая пара: вращающиеся калиперы по выпуклой оболочке."""
+    xy = as_array(points)
+    if len(xy) < 2:
+        raise ValueError("Нужно хотя бы две точки.")
+    hull = _hull(xy)
+    if len(hull) < 3:
+        return Point(*hull[0]), Point(*hull[-1])
+    h = len(hull)
+    best = (-1.0, 0, 0)
+    j = 1
+    for i in range(h):
+        (ax, ay), (bx, by) = hull[i], hull[(i + 1) % h]
+        ex, ey = bx - ax, by - ay
+        # Вершина j движется, пока удаляется от прямой ребра i.
+        while True:
+            (cx, cy), (dx, dy) = hull[j], hull[(j + 1) % h]
+            if ex * (dy - cy) - ey * (dx - cx) <= 0:
+                break
+            j = (j + 1) % h
+        for v in (i, (i + 1) % h):
+            d = math.hypot(hull[v][0] - hull[j][0], hull[v][1] - hull[j][1])
+            if d > best[0]:
+                best = (d, v, j)
+    return Point(*hull[best[1]]), Point(*hull[best[2]])
+
+
+class BoundingBox:
+    """
+    Осевой охватывающий прямоугольник, пополняемый потоком точек.
+
+    Итерируемые Point читаются кусками по CHUNK, PointCloud и массивы
+    обрабатываются целиком; хранятся только границы.
+    """
+
+    CHUNK = 65536
+
+    __slots__ = ("_low", "_high", "_count")
+
+    def __init__(self, points: Points = ()) -> None:
+        self._low = np.full(2, np.inf)
+        self._high = np.full(2, -np.inf)
+        self._count = 0
+        self.extend(points)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _update(self, xy: np.ndarray) -> None:
+        if len(xy):
+            # По столбцам: min(axis=0) по узкому массиву в разы медленнее.
+            x, y = xy[:, 0], xy[:, 1]
+            np.minimum(self._low, (x.min(), y.min()), out=self._low)
+            np.maximum(self._high, (x.max(), y.max()), out=self._high)
+            self._count += len(xy)
+
+    def add(self, p: Point) -> None:
+        if not isinstance(p, Point):
+            raise TypeError("Аргумент должен быть объектом Point.")
+        self._update(np.array([[p.first, p.second]]))
+
+    def extend(self, points: Points) -> None:
+        if isinstance(points, (PointCloud, np.ndarray)):
+            self._update(as_array(points))
+            return
+        it = iter(points)
+        while chunk := list(itertools.islice(it, self.CHUNK)):
+            self._update(PointCloud(chunk).xy)
+
+    def _check(self) -> None:
+        if not self._count:
+            raise ValueError("Прямоугольник пуст.")
+
+    @property
+    def low(self) -> Point:
+        """Левый нижний угол."""
+        self._check()
+        return Point(*self._low.tolist())
+
+    @property
+    def high(self) -> Point:
+        """Правый верхний угол."""
+        self._check()
+        return Point(*self._high.tolist())
+
+    @property
+    def width(self) -> float:
+        self._check()
+        return float(self._high[0] - self._low[0])
+
+    @property
+    def height(self) -> float:
+        self._check()
+        return float(self._high[1] - self._low[1])
+
+    def area(self) -> float:
+        return self.width * self.height
+
+    def __contains__(self, p: object) -> bool:
+        if not isinstance(p, Point) or not self._count:
+            return False
+        return bool(
+            self._low[0] <= p.first <= self._high[0]
+            and self._low[1] <= p.second <= self._high[1]
+        )
+
+    def __str__(self) -> str:
+        if not self._count:
+            return "BoundingBox(пуст)"
+        return f"BoundingBox({self.low}, {self.high})"
+
+
+def _pairs(points: Iterable[Point]) -> Iterable[Pair]:
+    pts = list(points)
+    if len(pts) < 2:
+        raise ValueError("Нужно хотя бы две точки.")
+    return itertools.combinations(pts, 2)
+
+
+def brute_closest_pair(points: Iterable[Point]) -> Pair:
+    """Эталон за O(n²): distance_to для всех пар."""
+    return min(_pairs(points), key=lambda pq: pq[0].distance_to(pq[1]))
+
+
+def brute_farthest_pair(points: Iterable[Point]) -> Pair:
+    """Эталон за O(n²): distance_to для всех пар."""
+    return max(_pairs(points), key=lambda pq: pq[0].distance_to(pq[1]))
+
+
+def brute_convex_hull(points: Iterable[Point]) -> List[Point]:
+    """Эталон — заворачивание подарка за O(nh), в том же порядке, что convex_hull."""
+    pts = list({(p.first, p.second) for p in points})
+    if len(pts) < 3:
+        return [Point(x, y) for x, y in sorted(pts)]
+    start = min(pts)
+    hull = [start]
+    while True:
+        ax, ay = hull[-1]
+        nxt = pts[0] if pts[0] != hull[-1] else pts[1]
+        for rx, ry in pts:
+            bx, by = nxt
+            cross = (bx - ax) * (ry - ay) - (by - ay) * (rx - ax)
+            # Правее текущего кандидата или дальше него на той же прямой.
+            farther = math.hypot(rx - ax, ry - ay) > math.hypot(bx - ax, by - ay)
+            if cross < 0 or cross == 0 and farther:
+                nxt = (rx, ry)
+        if nxt == start:
+            break
+        hull.append(nxt)
+    return [Point(x, y) for x, y in hull]
+
+
+def brute_bounding_box(points: Iterable[Point]) -> Pair:
+    """Эталон: min и max координат в цикле по точкам."""
+    low = [math.inf, math.inf]
+    high = [-math.inf, -math.inf]
+    for p in points:
+        low = [min(low[0], p.first), min(low[1], p.second)]
+        high = [max(high[0], p.first), max(high[1], p.second)]
+    if low[0] > high[0]:
+        raise ValueError("Прямоугольник пуст.")
+    return Point(*low), Point(*high)
@@ -0,0 +1,192 @@
+import itertools
+import math
+import os
+from typing import Iterable, Iterator, Tuple, Union
+
+import numpy as np
+
+from zad_2 import Point, PointCloud
+
+PathLike = Union[str, os.PathLike]
+
+# Формат файла: пары (x, y) little-endian float64 подряд, без заголовка.
+DTYPE = np.dtype("<f8")
+
+
+def _parse_block(lines: list, start: int, delimiter: str) -> tuple:
+    """Разбор строк CSV в массив (N, 2); возвращает (массив, ошибки)."""
+    if not "".join(lines).strip():
+        return np.empty((0, 2)), []
+    try:
+        xy = np.loadtxt(lines, delimiter=delimiter, comments=None, ndmin=2)
+        if xy.shape[1] == 2:
+            return xy, []
+    except ValueError:
+        pass
+    # Медленный путь: построчно, с номерами и причинами ошибок.
+    rows, bad = [], []
+    for i, line in enumerate(lines, start):
+        if not line.strip():
+            continue
+        fields = line.split(delimiter)
+        if len(fields) != 2:
+            bad.append((i, "Ожидалось два поля."))
+            continue
+        try:
+            rows.append((float(fields[0]), float(fields[1])))
+        except ValueError:
+            bad.append((i, "Координаты должны быть числами."))
+    return np.array(rows, dtype=np.float64).reshape(-1, 2), bad
+
+
+class PointFile:
+    """
+    Файл координат Point, отображённый в память (np.memmap).
+
+    Данные читаются кусками по CHUNK точек: кусок — PointCloud поверх
+    памяти файла, без копирования, поэтому свёртки по файлу больше
+    оперативной памяти идут с постоянным расходом. Объекты Point
+    создаются только по запросу: индексом или перебором.
+    """
+
+    CHUNK = 1 << 16
+
+    __slots__ = ("_path", "_data")
+
+    def __init__(self, path: PathLike) -> None:
+        size = os.path.getsize(path)
+        if size % (2 * DTYPE.itemsize):
+            raise ValueError("Размер файла не кратен паре float64.")
+        self._path = os.fspath(path)
+        # Пустой файл np.memmap отобразить не может.
+        if size:
+            self._data = np.memmap(path, dtype=DTYPE, mode="r").reshape(-1, 2)
+        else:
+            self._data = np.empty((0, 2), dtype=DTYPE)
+
+    @classmethod
+    def write(
+        cls, path: PathLike, points: Union[PointCloud, np.ndarray, Iterable[Point]]
+    ) -> "PointFile":
+        """Запись точек; итерируемые Point читаются кусками по CHUNK."""
+        with open(path, "wb") as f:
+            if isinstance(points, PointCloud):
+                points.xy.astype(DTYPE, copy=False).tofile(f)
+            elif isinstance(points, np.ndarray):
+                PointCloud.from_array(points).xy.astype(DTYPE, copy=False).tofile(f)
+            else:
+                it = iter(points)
+                while chunk := list(itertools.islice(it, cls.CHUNK)):
+                    PointCloud(chunk).xy.astype(DTYPE, copy=False).tofile(f)
+        return cls(path)
+
+    @classmethod
+    def from_csv(
+        cls,
+        source: PathLike,
+        path: PathLike,
+        errors: Union[list, None] = None,
+        delimiter: str = ",",
+        skip_header: bool = False,
+    ) -> "PointFile":
+        """Перевод CSV «x,y» в двоичный файл блоками по CHUNK строк.
+
+        Некорректные строки пропускаются, а в errors (если передан)
+        добавляются пары (номер строки с 1, причина).
+        """
+        with open(source) as src, open(path, "wb") as dst:
+            if skip_header:
+                src.readline()
+            line = 1 + skip_header
+            while block := list(itertools.islice(src, cls.CHUNK)):
+                xy, bad = _parse_block(block, line, delimiter)
+                xy.astype(DTYPE).tofile(dst)
+                if errors is not None:
+                    errors.extend(bad)
+                line += len(block)
+        return cls(path)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, index: object) -> Union[Point, PointCloud]:
+        """Номер — отдельный Point, срез — PointCloud поверх файла.
+
+        Список или массив номеров (или булева маска) — PointCloud с копией
+        выбранных точек.
+        """
+        if isinstance(index, slice):
+            return PointCloud.from_array(self._data[index])
+        if isinstance(index, (int, np.integer)):
+            x, y = self._data[index].tolist()
+            return Point(x, y)
+        rows = np.asarray(index)
+        if not rows.size:
+            rows = rows.astype(np.intp)
+        if rows.ndim != 1 or rows.dtype.kind not in "iub":
+            raise TypeError(
+                "Индекс должен быть целым числом, срезом или массивом номеров."
+            )
+        return PointCloud.from_array(self._data[rows])
+
+    def chunks(self, size: Union[int, None] = None) -> Iterator[PointCloud]:
+        """Куски файла по size точек без копирования."""
+        size = self.CHUNK if size is None else size
+        if size <= 0:
+            raise ValueError("Размер куска должен быть положительным.")
+        for start in range(0, len(self), size):
+            yield PointCloud.from_array(self._data[start:start + size])
+
+    def __iter__(self) -> Iterator[Point]:
+        for cloud in self.chunks():
+            yield from cloud
+
+    def _distances(self, origin: Union[Point, None]) -> Iterator[np.ndarray]:
+        for cloud in self.chunks():
+            if origin is None:
+                yield cloud.distances_to_origin()
+            else:
+                yield cloud.distances_to(origin)
+
+    def distance_range(self, origin: Union[Point, None] = None) -> Tuple[float, float]:
+        """Наименьшее и наибольшее расстояние до origin или до начала координат."""
+        low, high = math.inf, -math.inf
+        for r in self._distances(origin):
+            if len(r):
+                low = min(low, float(r.min()))
+                high = max(high, float(r.max()))
+        if low > high:
+            raise ValueError("Файл пуст.")
+        return low, high
+
+    def distance_histogram(
+        self,
+        bins: int = 10,
+        limits: Union[Tuple[float, float], None] = None,
+        origin: Union[Point, None] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(counts, edges) как у np.histogram, но по кускам.
+
+        Без limits границы берутся из distance_range — это лишний проход.
+        """
+        if limits is None:
+            limits = self.distance_range(origin)
+        counts = np.zeros(bins, dtype=np.int64)
+        for r in self._distances(origin):
+            counts += np.histogram(r, bins, limits)[0]
+        return counts, np.histogram_bin_edges(np.empty(0), bins, limits)
+
+    def angle_histogram(self, bins: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+        """Гистограмма углов φ из to_polar на [-π, π]."""
+        limits = (-math.pi, math.pi)
+        counts = np.zeros(bins, dtype=np.int64)
+        for cloud in self.chunks():
+            counts += np.histogram(cloud.to_polar()[1], bins, limits)[0]
+        return counts, np.histogram_bin_edges(np.empty(0), bins, limits)
+
+    def __str__(self) -> str:
+        return f"PointFile({self._path}, {len(self)} точек)"
@@ -0,0 +1,344 @@
+import math
+from typing import Iterable, List, Tuple, Union
+
+import numpy as np
+
+from zad_2 import Point, PointCloud
+
+Points = Union[PointCloud, Iterable[Point], np.ndarray]
+
+# Предел ячеек матрицы групп, выше которого сортировка идёт через lexsort.
+_PAD_LIMIT = 1 << 24
+
+# Двоичный порядок координат, вне которого разности масштабируются перед
+# возведением в квадрат: квадраты float64 живут примерно в 2**±1022.
+_SAFE_EXPONENT = 256
+
+
+def as_array(points: Points) -> np.ndarray:
+    """Координаты набора точек как массив (N, 2) float64."""
+    if isinstance(points, PointCloud):
+        return points.xy
+    if isinstance(points, np.ndarray):
+        return PointCloud.from_array(points).xy
+    return PointCloud(points).xy
+
+
+def ranks(counts: np.ndarray) -> np.ndarray:
+    """Номер элемента внутри своей группы для групп длины counts подряд."""
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(len(offsets)) - offsets
+
+
+def _group_order(counts: np.ndarray, dist: np.ndarray, k: int = 0) -> np.ndarray:
+    """Порядок элементов, идущих группами длины counts, по (группа, dist).
+
+    При k > 0 от каждой группы остаются k первых. Короткие группы
+    раскладываются в матрицу и упорядочиваются по строкам: это быстрее
+    lexsort по всему массиву.
+    """
+    m = len(counts)
+    width = int(counts.max(initial=0))
+    if m * width > _PAD_LIMIT:
+        ranked = np.lexsort((dist, np.repeat(np.arange(m), counts)))
+        return ranked[ranks(counts) < k] if k else ranked
+    rows = np.repeat(np.arange(m), counts)
+    cols = ranks(counts)
+    mat = np.full((m, width), np.inf)
+    mat[rows, cols] = dist
+    ids = np.full((m, width), -1)
+    ids[rows, cols] = np.arange(len(dist))
+    if 0 < k < mat.shape[1]:
+        part = np.argpartition(mat, k - 1, axis=1)[:, :k]
+        mat = np.take_along_axis(mat, part, 1)
+        ids = np.take_along_axis(ids, part, 1)
+    order = np.argsort(mat, axis=1, kind="stable")
+    res = np.take_along_axis(ids, order, 1)
+    return res[res >= 0]
+
+
+class KDTree:
+    """
+    KD-дерево над точками Point для запросов ближайших соседей и радиуса.
+
+    Дерево неявное: узел i имеет детей 2i + 1 и 2i + 2. Листья хранятся
+    блоками по LEAF_SIZE точек, свободные места заполнены inf, поэтому
+    лист просматривается одной векторной операцией. Запросы обрабатываются
+    пачками по QUERY_CHUNK точек: точки пачки спускаются по дереву
+    одновременно, а память на пары (запрос, лист) не растёт с числом
+    запросов — на скученных данных таких пар у каждого запроса сотни.
+
+    Отбор идёт по квадратам расстояний. Если координаты по модулю больше
+    2**256 или все меньше 2**-256, разности перед возведением в квадрат
+    умножаются на степень двойки: иначе квадраты около 1e-300 обнуляются,
+    а около 1e200 становятся inf, и соседи выбираются неверно. Масштаб
+    точный и порядок не меняет. Не различаются лишь разности меньше
+    примерно 1e-154 от наибольшей координаты.
+    """
+
+    LEAF_SIZE = 32
+    QUERY_CHUNK = 1024
+
+    __slots__ = (
+        "_n",
+        "_depth",
+        "_dim",
+        "_split",
+        "_low",
+        "_high",
+        "_leaf_xy",
+        "_leaf_idx",
+        "_pos",
+        "_extent",
+    )
+
+    def __init__(self, points: Points) -> None:
+        """Построение за O(n log n): медиана каждого узла — np.argpartition."""
+        xy = np.ascontiguousarray(as_array(points))
+        n = len(xy)
+        depth = 0
+        while n > self.LEAF_SIZE << depth:
+            depth += 1
+        internal = (1 << depth) - 1
+        order = np.arange(n)
+        dim = np.zeros(internal, dtype=np.intp)
+        split = np.zeros(internal)
+        bounds = [0, n]
+        for level in range(depth):
+            first = (1 << level) - 1
+            new_bounds = [0]
+            for j in range(1 << level):
+                lo, hi = bounds[j], bounds[j + 1]
+                mid = (lo + hi) // 2
+                seg = order[lo:hi]
+                pts = xy[seg]
+                d = int(np.argmax(np.ptp(pts, axis=0))) if hi > lo else 0
+                if mid > lo:
+                    order[lo:hi] = seg[np.argpartition(pts[:, d], mid - lo)]
+                    split[first + j] = xy[order[mid], d]
+                dim[first + j] = d
+                new_bounds += [mid, hi]
+            bounds = new_bounds
+        counts = np.diff(bounds)
+        leaves = 1 << depth
+        rows = np.repeat(np.arange(leaves), counts)
+        cols = ranks(counts)
+        width = max(int(counts.max(initial=0)), 1)
+        self._leaf_xy = np.full((leaves, width, 2), np.inf)
+        self._leaf_xy[rows, cols] = xy[order]
+        self._leaf_idx = np.full((leaves, width), -1)
+        self._leaf_idx[rows, cols] = order
+        # Позиция каждой исходной точки в развёрнутом массиве листьев.
+        self._pos = np.empty(n, dtype=np.intp)
+        self._pos[order] = rows * width + cols
+        self._n = n
+        self._extent = float(np.abs(xy).max(initial=0.0))
+        self._depth = depth
+        self._dim = dim
+        self._split = split
+        self._low, self._high = self._boxes()
+
+    def _boxes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Охватывающие прямоугольники всех узлов, от листьев к корню."""
+        leaves = 1 << self._depth
+        low = np.full((2 * leaves - 1, 2), np.inf)
+        high = np.full((2 * leaves - 1, 2), -np.inf)
+        real = (self._leaf_idx >= 0)[..., None]
+        low[leaves - 1:] = np.where(real, self._leaf_xy, np.inf).min(axis=1)
+        high[leaves - 1:] = np.where(real, self._leaf_xy, -np.inf).max(axis=1)
+        for level in range(self._depth - 1, -1, -1):
+            nodes = np.arange((1 << level) - 1, (1 << (level + 1)) - 1)
+            low[nodes] = np.minimum(low[2 * nodes + 1], low[2 * nodes + 2])
+            high[nodes] = np.maximum(high[2 * nodes + 1], high[2 * nodes + 2])
+        return low, high
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def points(self) -> PointCloud:
+        """Точки в исходном порядке."""
+        return PointCloud.from_array(self._leaf_xy.reshape(-1, 2)[self._pos])
+
+    def _descend(
+        self, q: np.ndarray, levels: int, ties: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Узлы уровня levels для запросов и признак, что запрос попадал на split.
+
+        Равные split запросы идут вправо при ties и влево иначе.
+        """
+        node = np.zeros(len(q), dtype=np.intp)
+        rows = np.arange(len(q))
+        tied = np.zeros(len(q), dtype=bool)
+        for _ in range(levels):
+            coord, split = q[rows, self._dim[node]], self._split[node]
+            tied |= coord == split
+            right = coord >= split if ties else coord > split
+            node = 2 * node + 1 + right
+        return node, tied
+
+    def _scale(self, q: np.ndarray) -> float:
+        """Множитель разностей координат, при котором квадраты не выходят за float64."""
+        extent = max(self._extent, float(np.abs(q).max(initial=0.0)))
+        exponent = math.frexp(extent)[1]
+        if not extent or abs(exponent) <= _SAFE_EXPONENT:
+            return 1.0
+        return math.ldexp(1.0, -exponent)
+
+    def _block(
+        self, q: np.ndarray, node: np.ndarray, span: int, scale: float = 1.0
+    ) -> np.ndarray:
+        """Квадраты расстояний от запросов до точек их блоков из span листьев."""
+        block = self._leaf_xy[node[:, None] * span + np.arange(span)]
+        delta = block.reshape(len(q), span * block.shape[2], 2) - q[:, None, :]
+        if scale != 1.0:
+            delta *= scale
+        return np.einsum("ijk,ijk->ij", delta, delta)
+
+    def _candidates(
+        self,
+        q: np.ndarray,
+        radius2: np.ndarray,
+        strict: bool = False,
+        scale: float = 1.0,
+    ) -> Tuple[np.ndarray, ...]:
+        """Пары (номер запроса, лист) и квадраты расстояний до точек листа.
+
+        Узел отбрасывается, если квадрат расстояния от запроса до его
+        прямоугольника больше radius2 (при strict — не меньше); разности
+        перед возведением в квадрат умножаются на scale. Спуск
+        сохраняет порядок запросов, поэтому пары сгруппированы по номеру
+        запроса.
+        """
+        close = np.less if strict else np.less_equal
+        qi = np.arange(len(q))
+        nodes = np.zeros(len(q), dtype=np.intp)
+        for level in range(self._depth + 1):
+            p = q[qi]
+            delta = np.maximum(self._low[nodes] - p, 0)
+            delta += np.maximum(p - self._high[nodes], 0)
+            if scale != 1.0:
+                delta *= scale
+            keep = close(np.einsum("ij,ij->i", delta, delta), radius2[qi])
+            qi, nodes = qi[keep], nodes[keep]
+            if level < self._depth:
+                children = np.empty(2 * len(nodes), dtype=np.intp)
+                children[0::2] = 2 * nodes + 1
+                children[1::2] = 2 * nodes + 2
+                qi, nodes = np.repeat(qi, 2), children
+        leaves = nodes - ((1 << self._depth) - 1)
+        delta = self._leaf_xy[leaves] - q[qi, None, :]
+        if scale != 1.0:
+            delta *= scale
+        return qi, leaves, np.einsum("ijk,ijk->ij", delta, delta)
+
+    def query(self, points: Points, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """k ближайших к каждой точке запроса: (расстояния, индексы) формы (m, k).
+
+        Индексы — позиции в исходном наборе; строки упорядочены по расстоянию.
+        """
+        if k < 1:
+            raise ValueError("k должно быть положительным.")
+        if not self._n:
+            raise ValueError("Дерево пусто.")
+        q = as_array(points)
+        k = min(k, self._n)
+        dist = np.empty((len(q), k))
+        idx = np.empty((len(q), k), dtype=np.intp)
+        for start in range(0, len(q), self.QUERY_CHUNK):
+            part = slice(start, start + self.QUERY_CHUNK)
+            dist[part], idx[part] = self._query(q[part], k)
+        return dist, idx
+
+    def _query(self, q: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        # Первая оценка радиуса — k-е расстояние в узле, где не меньше k точек.
+        levels = self._depth
+        while levels and self._n >> levels < k:
+            levels -= 1
+        span = 1 << (self._depth - levels)
+        first = (1 << levels) - 1
+        scale = self._scale(q)
+        node, tied = self._descend(q, levels)
+        node -= first
+        block = self._block(q, node, span, scale)
+        radius2 = np.partition(block, k - 1, axis=1)[:, k - 1]
+        # Точки, равные split, бывают по обе стороны разбиения: для таких
+        # запросов пробуем и другую ветвь и берём блок с меньшей оценкой.
+        t = np.flatnonzero(tied)
+        if len(t):
+            other = self._descend(q[t], levels, ties=False)[0] - first
+            alt = self._block(q[t], other, span, scale)
+            alt_radius2 = np.partition(alt, k - 1, axis=1)[:, k - 1]
+            better = alt_radius2 < radius2[t]
+            t = t[better]
+            node[t], block[t] = other[better], alt[better]
+            radius2[t] = alt_radius2[better]
+        # В блоке уже есть k точек не дальше оценки радиуса, поэтому вне
+        # блока нужны только строго более близкие. Иначе на повторяющихся
+        # точках (радиус 0) запрос просматривал бы все копии.
+        qi, leaves, dist2 = self._candidates(q, radius2, True, scale)
+        # Лист с k точками ближе оценки уточняет её: без этого при неудачном
+        # блоке в отбор попадают тысячи точек.
+        width = self._leaf_idx.shape[1]
+        tight = np.full(len(q), np.inf)
+        if k <= width:
+            np.minimum.at(tight, qi, np.partition(dist2, k - 1, axis=1)[:, k - 1])
+        limit = np.where(tight < radius2, tight, np.nextafter(radius2, -np.inf))
+        outside = leaves // span != node[qi]
+        rows, cols = np.nonzero((dist2 <= limit[qi, None]) & outside[:, None])
+        bi, bcols = np.nonzero(block <= np.minimum(radius2, tight)[:, None])
+        qi = np.concatenate((bi, qi[rows]))
+        dist2 = np.concatenate((block[bi, bcols], dist2[rows, cols]))
+        flat = np.concatenate(
+            (node[bi] * span * width + bcols, leaves[rows] * width + cols)
+        )
+        grouped = np.argsort(qi, kind="stable")
+        counts = np.bincount(qi, minlength=len(q))
+        top = flat[grouped[_group_order(counts, dist2[grouped], k)]]
+        idx = self._leaf_idx.ravel()[top].reshape(-1, k)
+        delta = self._leaf_xy.reshape(-1, 2)[top].reshape(-1, k, 2) - q[:, None, :]
+        return np.hypot(delta[..., 0], delta[..., 1]), idx
+
+    def query_radius(self, points: Points, r: float) -> List[np.ndarray]:
+        """Индексы точек на расстоянии не больше r, по возрастанию расстояния."""
+        if r < 0:
+            raise ValueError("Радиус не может быть отрицательным.")
+        q = as_array(points)
+        if not self._n:
+            return [np.empty(0, dtype=np.intp) for _ in range(len(q))]
+        found: List[np.ndarray] = []
+        for start in range(0, len(q), self.QUERY_CHUNK):
+            found += self._query_radius(q[start:start + self.QUERY_CHUNK], r)
+        return found
+
+    def _query_radius(self, q: np.ndarray, r: float) -> List[np.ndarray]:
+        # Отбор по квадратам с запасом, окончательно — по np.hypot, как в Point.
+        scale = self._scale(q)
+        radius2 = np.full(len(q), (r * scale) * (r * scale) * (1 + 1e-9))
+        qi, leaves, dist2 = self._candidates(q, radius2, scale=scale)
+        rows, cols = np.nonzero(dist2 <= radius2[0])
+        qi, leaves = qi[rows], leaves[rows]
+        delta = self._leaf_xy[leaves, cols] - q[qi]
+        dist = np.hypot(delta[:, 0], delta[:, 1])
+        inside = dist <= r
+        qi, dist = qi[inside], dist[inside]
+        idx = self._leaf_idx[leaves[inside], cols[inside]]
+        counts = np.bincount(qi, minlength=len(q))
+        return np.split(idx[_group_order(counts, dist)], np.cumsum(counts)[:-1])
+
+    def nearest(self, p: Point, k: int = 1) -> List[Point]:
+        """k ближайших к p точек, от ближней к дальней."""
+        if not isinstance(p, Point):
+            raise TypeError("Аргумент должен быть объектом Point.")
+        _, idx = self.query(np.array([[p.first, p.second]]), k)
+        return self._points(idx[0])
+
+    def within(self, p: Point, r: float) -> List[Point]:
+        """Точки на расстоянии не больше r от p, от ближней к дальней."""
+        if not isinstance(p, Point):
+            raise TypeError("Аргумент должен быть объектом Point.")
+        return self._points(self.query_radius(np.array([[p.first, p.second]]), r)[0])
+
+    def _points(self, idx: np.ndarray) -> List[Point]:
+        xy = self._leaf_xy.reshape(-1, 2)[self._pos[idx]]
+        return [Point(x, y) for x, y in xy.tolist()]
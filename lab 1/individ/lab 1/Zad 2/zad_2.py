@@ -1,5 +1,8 @@
 import math
-from typing import Tuple
+from itertools import chain
+from typing import Iterable, Iterator, Tuple, Union
+
+import numpy as np
 
 
 class Point:
@@ -65,6 +68,117 @@ class Point:
         return f"Point({self.first}, {self.second})"
 
 
+class PointCloud:
+    """
+    Набор точек в одном массиве (N, 2) float64:
+    столбец 0 — first (X), столбец 1 — second (Y).
+    Методы Point здесь считаются сразу для всех точек. np.hypot и np.arctan2
+    не обязаны совпадать с math.hypot и math.atan2 побитово: расстояния
+    и углы могут отличаться от результатов Point на 1 ulp.
+    """
+
+    __slots__ = ("_xy",)
+
+    def __init__(self, points: Iterable[Point] = ()) -> None:
+        """Сборка из объектов Point без промежуточного списка пар."""
+        points = points if isinstance(points, (list, tuple)) else list(points)
+        try:
+            coords = chain.from_iterable((p.first, p.second) for p in points)
+            xy = np.fromiter(coords, dtype=np.float64, count=2 * len(points))
+        except AttributeError as e:
+            raise TypeError("Элементы должны быть объектами Point.") from e
+        self._xy = xy.reshape(-1, 2)
+
+    @classmethod
+    def from_array(cls, xy: object) -> "PointCloud":
+        """Облако поверх массива (N, 2); float64-массив не копируется."""
+        try:
+            arr = np.asarray(xy, dtype=np.float64)
+        except (TypeError, ValueError) as e:
+            raise ValueError("Координаты должны быть числами.") from e
+        if arr.ndim != 2 or arr.shape[1] != 2:
+            raise ValueError("Ожидается массив формы (N, 2).")
+        obj = cls.__new__(cls)
+        obj._xy = arr
+        return obj
+
+    @property
+    def xy(self) -> np.ndarray:
+        return self._xy
+
+    @property
+    def first(self) -> np.ndarray:
+        return self._xy[:, 0]
+
+    @property
+    def second(self) -> np.ndarray:
+        return self._xy[:, 1]
+
+    def __len__(self) -> int:
+        return len(self._xy)
+
+    def __getitem__(self, index: object) -> Union[Point, "PointCloud"]:
+        """Целый индекс даёт Point, срез или маска — PointCloud."""
+        if isinstance(index, (int, np.integer)):
+            x, y = self._xy[index].tolist()
+            return Point(x, y)
+        return PointCloud.from_array(self._xy[index])
+
+    def __iter__(self) -> Iterator[Point]:
+        for x, y in self._xy.tolist():
+            yield Point(x, y)
+
+    def tolist(self) -> list:
+        """Преобразование в список объектов Point."""
+        return list(self)
+
+    def _other(self, other: object) -> np.ndarray:
+        if isinstance(other, Point):
+            return np.array((other.first, other.second))
+        if isinstance(other, PointCloud):
+            if len(other) != len(self):
+                raise ValueError("Число точек в облаках не совпадает.")
+            return other._xy
+        raise TypeError("Аргумент должен быть объектом Point или PointCloud.")
+
+    def distances_to_origin(self) -> np.ndarray:
+        """Расстояния от всех точек до начала координат."""
+        return np.hypot(self._xy[:, 0], self._xy[:, 1])
+
+    def distances_to(self, other: Union[Point, "PointCloud"]) -> np.ndarray:
+        """Расстояния до одной точки или попарно до точек другого облака."""
+        d = self._xy - self._other(other)
+        return np.hypot(d[:, 0], d[:, 1])
+
+    def to_polar(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Полярные координаты (r, φ) всех точек. φ в радианах."""
+        x, y = self._xy[:, 0], self._xy[:, 1]
+        return np.hypot(x, y), np.arctan2(y, x)
+
+    def align_to(self, other: Union[Point, "PointCloud"]) -> None:
+        """Выравнивание на месте: все точки к одной или попарно к другому облаку."""
+        self._xy[...] = self._other(other)
+
+    def __eq__(self, other: object) -> np.ndarray:  # type: ignore[override]
+        """Поэлементное сравнение с точкой или облаком той же длины."""
+        try:
+            xy = self._other(other)
+        except TypeError:
+            return np.zeros(len(self), dtype=bool)
+        return (self._xy == xy).all(axis=1)
+
+    def __ne__(self, other: object) -> np.ndarray:  # type: ignore[override]
+        return ~self.__eq__(other)
+
+    def display(self) -> None:
+        """Вывод координат всех точек."""
+        for x, y in self._xy.tolist():
+            print(f"Координаты точки: ({x}, {y})")
+
+    def __str__(self) -> str:
+        return f"PointCloud({len(self)} точек)"
+
+
 if __name__ == "__main__":
     p1 = Point(3.0, 4.0)
     p1.display()
@@ -0,0 +1,108 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+BASE_DIR = os.path.dirname(__file__)
+ZAD2_DIR = os.path.abspath(
+    os.path.join(BASE_DIR, "..", "individ", "lab 1", "Zad 2")
+)
+sys.path.insert(0, ZAD2_DIR)
+
+from geometry import (
+    BoundingBox,
+    brute_bounding_box,
+    brute_closest_pair,
+    brute_convex_hull,
+    brute_farthest_pair,
+    closest_pair,
+    convex_hull,
+    farthest_pair,
+)
+from zad_2 import Point, PointCloud
+
+
+def random_sets() -> list:
+    """Целые координаты (повторы, точки на одной прямой), окружность и облако."""
+    rng = np.random.default_rng(24)
+    sets = []
+    for n in (2, 3, 17, 40, 150):
+        sets.append(rng.integers(-5, 6, (n, 2)).astype(float))
+        phi = rng.uniform(0, 2 * np.pi, n)
+        sets.append(np.c_[np.cos(phi), np.sin(phi)] * 10)
+        sets.append(rng.normal(size=(n, 2)))
+    return sets
+
+
+def length(pair: tuple) -> float:
+    return pair[0].distance_to(pair[1])
+
+
+class TestGeometry:
+    square = [
+        Point(0.0, 0.0),
+        Point(2.0, 0.0),
+        Point(2.0, 2.0),
+        Point(0.0, 2.0),
+        Point(1.0, 1.0),
+        Point(1.0, 0.0),
+        Point(2.0, 2.0),
+    ]
+
+    def test_known_square(self) -> None:
+        assert convex_hull(self.square) == [
+            Point(0.0, 0.0),
+            Point(2.0, 0.0),
+            Point(2.0, 2.0),
+            Point(0.0, 2.0),
+        ]
+        assert length(closest_pair(self.square)) == 0.0
+        assert length(farthest_pair(self.square)) == pytest.approx(2 * 2**0.5)
+        assert convex_hull([Point(1.0, 1.0)] * 3) == [Point(1.0, 1.0)]
+        line = [Point(float(i), 2.0 * i) for i in range(5)]
+        assert convex_hull(line) == [Point(0.0, 0.0), Point(4.0, 8.0)]
+
+    def test_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            closest_pair([Point()])
+        with pytest.raises(ValueError):
+            farthest_pair([])
+        with pytest.raises(TypeError):
+            convex_hull([Point(), (1.0, 2.0)])  # type: ignore
+
+    @pytest.mark.parametrize("xy", random_sets())
+    def test_matches_brute_force(self, xy: np.ndarray) -> None:
+        points = [Point(x, y) for x, y in xy.tolist()]
+        cloud = PointCloud.from_array(xy)
+        assert length(closest_pair(cloud)) == length(brute_closest_pair(points))
+        assert length(farthest_pair(cloud)) == length(brute_farthest_pair(points))
+        assert convex_hull(cloud) == brute_convex_hull(points)
+        box = BoundingBox(iter(points))
+        assert (box.low, box.high) == brute_bounding_box(points)
+
+
+class TestBoundingBox:
+    def test_streaming(self) -> None:
+        box = BoundingBox()
+        assert len(box) == 0
+        assert Point() not in box
+        with pytest.raises(ValueError):
+            box.low
+        box.add(Point(1.0, -2.0))
+        box.extend(Point(x, -x) for x in range(5))
+        box.extend(np.array([[-3.0, 0.5]]))
+        assert len(box) == 7
+        assert (box.low, box.high) == (Point(-3.0, -4.0), Point(4.0, 0.5))
+        assert (box.width, box.height, box.area()) == (7.0, 4.5, 31.5)
+        assert Point(0.0, 0.0) in box
+        assert Point(5.0, 0.0) not in box
+        with pytest.raises(TypeError):
+            box.add((1.0, 2.0))  # type: ignore
+
+    def test_chunks(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(BoundingBox, "CHUNK", 3)
+        points = [Point(float(i % 7), float(-i)) for i in range(20)]
+        box = BoundingBox(iter(points))
+        assert len(box) == 20
+        assert (box.low, box.high) == brute_bounding_box(points)
@@ -0,0 +1,98 @@
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+BASE_DIR = os.path.dirname(__file__)
+ZAD2_DIR = os.path.abspath(
+    os.path.join(BASE_DIR, "..", "individ", "lab 1", "Zad 2")
+)
+sys.path.insert(0, ZAD2_DIR)
+
+from point_file import PointFile
+from zad_2 import Point, PointCloud
+
+
+class TestPointFile:
+    points = [Point(3.0, 4.0), Point(-1.0, 2.0), Point(0.0, 0.0), Point(1.0, -1.0)]
+
+    def test_roundtrip(self, tmp_path: object) -> None:
+        f = PointFile.write(tmp_path / "p.bin", iter(self.points))
+        assert os.path.getsize(f.path) == 4 * 16
+        assert len(f) == 4
+        assert list(f) == self.points
+        assert f[1] == Point(-1.0, 2.0)
+        assert f[-1] == Point(1.0, -1.0)
+        assert f[1:3].tolist() == self.points[1:3]
+        with pytest.raises(IndexError):
+            f[4]
+        assert f[np.int64(2)] == Point(0.0, 0.0)
+        assert f[[0, -1]].tolist() == [self.points[0], self.points[-1]]
+        assert f[np.array([2, 1])].tolist() == [self.points[2], self.points[1]]
+        mask = np.array([True, False, False, True])
+        assert f[mask].tolist() == [self.points[0], self.points[3]]
+        assert len(f[[]]) == 0
+        with pytest.raises(IndexError):
+            f[[0, 4]]
+        with pytest.raises(TypeError):
+            f[1.5]
+        with pytest.raises(TypeError):
+            f[[[0, 1]]]
+        copy = PointFile.write(tmp_path / "q.bin", PointCloud(self.points))
+        assert list(copy) == self.points
+        empty = PointFile.write(tmp_path / "e.bin", [])
+        assert len(empty) == 0 and list(empty.chunks()) == []
+
+    def test_chunks_are_views(self, tmp_path: object) -> None:
+        xy = np.arange(20, dtype=np.float64).reshape(10, 2)
+        f = PointFile.write(tmp_path / "p.bin", xy)
+        chunks = list(f.chunks(4))
+        assert [len(c) for c in chunks] == [4, 4, 2]
+        assert all(not c.xy.flags.owndata and not c.xy.flags.writeable for c in chunks)
+        assert np.array_equal(np.concatenate([c.xy for c in chunks]), xy)
+        with pytest.raises(ValueError):
+            next(f.chunks(0))
+
+    def test_reductions(
+        self, tmp_path: object, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(PointFile, "CHUNK", 7)
+        xy = np.random.default_rng(25).normal(size=(100, 2))
+        f = PointFile.write(tmp_path / "p.bin", xy)
+        cloud = PointCloud.from_array(xy)
+        r = cloud.distances_to_origin()
+        assert f.distance_range() == (r.min(), r.max())
+        counts, edges = f.distance_histogram(6)
+        expected = np.histogram(r, 6)
+        assert np.array_equal(counts, expected[0])
+        assert np.allclose(edges, expected[1])
+        origin = Point(1.0, 1.0)
+        counts, _ = f.distance_histogram(4, (0.0, 3.0), origin)
+        expected = np.histogram(cloud.distances_to(origin), 4, (0.0, 3.0))
+        assert np.array_equal(counts, expected[0])
+        counts, edges = f.angle_histogram(4)
+        assert counts.sum() == 100 and edges[0] == -math.pi
+        with pytest.raises(ValueError):
+            PointFile.write(tmp_path / "e.bin", []).distance_range()
+
+    def test_from_csv(self, tmp_path: object) -> None:
+        source = tmp_path / "p.csv"
+        source.write_text("x,y\n1,2\n3,abc\n\n4\n5.5,-6\n")
+        errors: list = []
+        f = PointFile.from_csv(source, tmp_path / "p.bin", errors, skip_header=True)
+        assert list(f) == [Point(1.0, 2.0), Point(5.5, -6.0)]
+        assert errors == [
+            (3, "Координаты должны быть числами."),
+            (5, "Ожидалось два поля."),
+        ]
+        source.write_text("1;2\n3;4\n")
+        f = PointFile.from_csv(source, tmp_path / "q.bin", delimiter=";")
+        assert list(f) == [Point(1.0, 2.0), Point(3.0, 4.0)]
+
+    def test_bad_size(self, tmp_path: object) -> None:
+        path = tmp_path / "p.bin"
+        path.write_bytes(b"\0" * 24)
+        with pytest.raises(ValueError):
+            PointFile(path)
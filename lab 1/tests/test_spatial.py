@@ -0,0 +1,113 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+BASE_DIR = os.path.dirname(__file__)
+ZAD2_DIR = os.path.abspath(
+    os.path.join(BASE_DIR, "..", "individ", "lab 1", "Zad 2")
+)
+sys.path.insert(0, ZAD2_DIR)
+
+import spatial
+from spatial import KDTree, as_array, ranks
+from zad_2 import Point, PointCloud
+
+
+def brute_force(xy: np.ndarray, q: np.ndarray) -> np.ndarray:
+    return np.hypot(xy[None, :, 0] - q[:, None, 0], xy[None, :, 1] - q[:, None, 1])
+
+
+def test_helpers() -> None:
+    points = [Point(1.0, 2.0), Point(3.0, 4.0)]
+    expected = np.array([[1.0, 2.0], [3.0, 4.0]])
+    for source in (points, PointCloud(points), expected):
+        assert np.array_equal(as_array(source), expected)
+    assert ranks(np.array([2, 0, 3])).tolist() == [0, 1, 0, 1, 2]
+
+
+class TestKDTree:
+    points = [Point(3.0, 4.0), Point(-1.0, 2.0), Point(0.0, 0.0), Point(1.0, -1.0)]
+
+    def test_nearest_and_within(self) -> None:
+        tree = KDTree(self.points)
+        assert len(tree) == 4
+        assert tree.points.tolist() == self.points
+        assert tree.nearest(Point(0.9, -0.8)) == [Point(1.0, -1.0)]
+        assert tree.nearest(Point(0.0, 0.1), 2) == [Point(0.0, 0.0), Point(1.0, -1.0)]
+        assert len(tree.nearest(Point(), 10)) == 4
+        assert tree.within(Point(), 5.0) == [
+            Point(0.0, 0.0),
+            Point(1.0, -1.0),
+            Point(-1.0, 2.0),
+            Point(3.0, 4.0),
+        ]
+        assert tree.within(Point(10.0, 10.0), 1.0) == []
+
+    def test_invalid(self) -> None:
+        tree = KDTree(self.points)
+        with pytest.raises(TypeError):
+            tree.nearest((0.0, 0.0))  # type: ignore
+        with pytest.raises(ValueError):
+            tree.nearest(Point(), 0)
+        with pytest.raises(ValueError):
+            tree.within(Point(), -1.0)
+        with pytest.raises(ValueError):
+            KDTree([]).nearest(Point())
+        assert KDTree([]).within(Point(), 1.0) == []
+
+    @pytest.mark.parametrize("pad_limit", [spatial._PAD_LIMIT, 0])
+    @pytest.mark.parametrize("n", [1, 33, 2000])
+    def test_matches_brute_force(
+        self, n: int, pad_limit: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(spatial, "_PAD_LIMIT", pad_limit)
+        rng = np.random.default_rng(n)
+        xy = rng.uniform(-10, 10, (n, 2))
+        # Повторяющиеся точки дают пустые отрезки при разбиении.
+        xy[: n // 4] = xy[0]
+        tree = KDTree(PointCloud.from_array(xy))
+        q = rng.uniform(-12, 12, (50, 2))
+        expected = brute_force(xy, q)
+        for k in (1, 5):
+            dist, idx = tree.query(q, k)
+            assert np.allclose(dist, np.sort(expected, axis=1)[:, : min(k, n)])
+            assert np.array_equal(np.take_along_axis(expected, idx, 1), dist)
+        for row, found in zip(expected, tree.query_radius(q, 3.0)):
+            assert sorted(found.tolist()) == np.flatnonzero(row <= 3.0).tolist()
+            assert (np.diff(row[found]) >= 0).all()
+
+    @pytest.mark.parametrize("grid", [True, False])
+    def test_clustered(self, grid: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+        # x ∈ {0, 1, 2}: тысячи точек на равных расстояниях и на split.
+        monkeypatch.setattr(KDTree, "QUERY_CHUNK", 7)
+        rng = np.random.default_rng(23)
+        x = rng.integers(0, 3, 3000)
+        y = rng.integers(0, 3, 3000) if grid else rng.uniform(0, 1, 3000)
+        xy = np.c_[x, y].astype(float)
+        tree = KDTree(xy)
+        q = np.r_[xy[:40], rng.uniform(-1, 3, (20, 2))]
+        expected = brute_force(xy, q)
+        for k in (1, 2, 40):
+            dist, idx = tree.query(q, k)
+            assert np.array_equal(dist, np.sort(expected, axis=1)[:, :k])
+            assert np.array_equal(np.take_along_axis(expected, idx, 1), dist)
+            assert all(len(set(row)) == k for row in idx.tolist())
+        for row, found in zip(expected, tree.query_radius(q, 0.5)):
+            assert sorted(found.tolist()) == np.flatnonzero(row <= 0.5).tolist()
+
+    @pytest.mark.parametrize("magnitude", [1e-300, 1e-200, 1e200, 1e300])
+    def test_extreme_coordinates(self, magnitude: float) -> None:
+        # Квадраты таких расстояний обнуляются или становятся inf.
+        rng = np.random.default_rng(7)
+        xy = rng.uniform(-1, 1, (500, 2)) * magnitude
+        q = rng.uniform(-1, 1, (30, 2)) * magnitude
+        tree = KDTree(xy)
+        expected = brute_force(xy, q)
+        dist, idx = tree.query(q, 3)
+        assert np.allclose(dist, np.sort(expected, axis=1)[:, :3], rtol=1e-12, atol=0)
+        assert np.array_equal(np.take_along_axis(expected, idx, 1), dist)
+        r = 0.3 * magnitude
+        for row, found in zip(expected, tree.query_radius(q, r)):
+            assert sorted(found.tolist()) == np.flatnonzero(row <= r).tolist()
@@ -3,6 +3,7 @@ import os
 import sys
 from typing import Any
 
+import numpy as np
 import pytest
 
 BASE_DIR = os.path.dirname(__file__)
@@ -11,7 +12,7 @@ ZAD2_DIR = os.path.abspath(
 )
 sys.path.insert(0, ZAD2_DIR)
 
-from zad_2 import Point
+from zad_2 import Point, PointCloud
 
 
 class TestPoint:
@@ -83,3 +84,66 @@ class TestPointEdgeCases:
         r = p.distance_to_origin()
         expected = math.sqrt(0.01 + 0.04)
         assert math.isclose(r, expected)
+
+
+class TestPointCloud:
+    points = [Point(3.0, 4.0), Point(-1.0, 2.0), Point(0.0, 0.0), Point(1.0, -1.0)]
+
+    def test_roundtrip(self) -> None:
+        cloud = PointCloud(self.points)
+        assert cloud.xy.shape == (4, 2)
+        assert len(cloud) == 4
+        assert cloud.tolist() == self.points
+        assert cloud[1] == Point(-1.0, 2.0)
+        assert PointCloud(iter(self.points)).tolist() == self.points
+        assert len(PointCloud()) == 0
+
+    def test_from_array_shares_memory(self) -> None:
+        xy = np.array([[1.0, 2.0], [3.0, 4.0]])
+        cloud = PointCloud.from_array(xy)
+        assert np.shares_memory(cloud.xy, xy)
+        with pytest.raises(ValueError):
+            PointCloud.from_array([1.0, 2.0])
+        with pytest.raises(ValueError):
+            PointCloud.from_array([["a", "b"]])
+        with pytest.raises(TypeError):
+            PointCloud([Point(), (1, 2)])  # type: ignore
+
+    def test_matches_point_methods(self) -> None:
+        # np.hypot и np.arctan2 могут расходиться с math.hypot и math.atan2
+        # в последнем бите, поэтому сравнение — с допуском в 1 ulp.
+        rng = np.random.default_rng(22)
+        xy = rng.normal(size=(2000, 2)) * np.exp(rng.uniform(-20, 20, (2000, 1)))
+        points = [Point(x, y) for x, y in xy.tolist()] + self.points
+        cloud = PointCloud(points)
+        other = Point(2.0, -3.0)
+        r, phi = cloud.to_polar()
+        actual = np.column_stack(
+            [
+                cloud.distances_to_origin(),
+                cloud.distances_to(other),
+                cloud.distances_to(PointCloud(points[::-1])),
+                r,
+                phi,
+            ]
+        )
+        expected = [
+            (p.distance_to_origin(), p.distance_to(other), p.distance_to(q))
+            + p.to_polar()
+            for p, q in zip(points, points[::-1])
+        ]
+        assert np.allclose(actual, expected, rtol=2.0**-52, atol=0.0)
+        with pytest.raises(ValueError):
+            cloud.distances_to(cloud[:2])
+        with pytest.raises(TypeError):
+            cloud.distances_to((1.0, 2.0))  # type: ignore
+
+    def test_equality_and_align(self) -> None:
+        cloud = PointCloud(self.points)
+        assert list(cloud == Point(0.0, 0.0)) == [False, False, True, False]
+        assert list(cloud != PointCloud(self.points)) == [False] * 4
+        assert list(cloud == "x") == [False] * 4
+        cloud[:2].align_to(Point(5.0, 5.0))
+        assert cloud.tolist()[:2] == [Point(5.0, 5.0)] * 2
+        cloud.align_to(PointCloud(self.points))
+        assert cloud.tolist() == self.points
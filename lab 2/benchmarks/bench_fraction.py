@@ -0,0 +1,493 @@
+import functools
+import operator
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from decimal import Decimal, localcontext
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from individ.Zad import zad_2  # noqa: E402
+from individ.Zad.zad_2 import (  # noqa: E402
+    Fraction,
+    FractionArray,
+    FractionStore,
+)
+
+OPS = {"+": operator.add, "-": operator.sub, "*": operator.mul}
+
+
+def random_digits(rng: random.Random, n: int) -> str:
+    return "".join(rng.choice("123456789") for _ in range(n))
+
+
+def random_fraction(rng: random.Random, n: int) -> Fraction:
+    # Одна цифра в целой части: произведение таких чисел всегда укладывается в MAX_SIZE.
+    return Fraction(random_digits(rng, 1) + "." + random_digits(rng, n - 1))
+
+
+def decimal_path(op: str, a: Fraction, b: Fraction) -> Fraction:
+    with localcontext(prec=Fraction.max_size()):
+        return Fraction.from_decimal(OPS[op](a.to_decimal(), b.to_decimal()))
+
+
+def best_of(func, number: int, repeat: int = 5) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def bench_arithmetic(sizes=(10, 50, 100), number: int = 2000) -> None:
+    # +, - и * считаются на целых Python (Fraction._to_int), а не на буфере цифр.
+    print("Арифметика: путь через int против пути через Decimal (мкс на операцию)")
+    print(f"{'цифр':>6} {'оп':>3} {'Decimal':>10} {'int':>10} {'ускорение':>10}")
+    rng = random.Random(1)
+    for n in sizes:
+        a = random_fraction(rng, n)
+        b = random_fraction(rng, n)
+        if a < b:
+            a, b = b, a
+        for op, func in OPS.items():
+            assert str(func(a, b)) == str(decimal_path(op, a, b))
+            old = best_of(lambda: decimal_path(op, a, b), number)
+            new = best_of(lambda: func(a, b), number)
+            print(
+                f"{n:>6} {op:>3} {old * 1e6:>10.2f} {new * 1e6:>10.2f}"
+                f" {old / new:>9.1f}x"
+            )
+
+
+class ListLayoutFraction:
+    """Прежняя раскладка Fraction: атрибуты в __dict__, цифры — списки int."""
+
+    def __init__(self, f: Fraction) -> None:
+        self.int_part = list(f.int_part)
+        self.frac_part = list(f.frac_part)
+        self._size = f.size()
+        self.count = f.count
+
+
+def traced_size(build) -> int:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del objects
+    return after - before
+
+
+def bench_memory(n: int = 1_000_000, digits: int = 12) -> None:
+    print(f"\nПамять на {n} экземпляров ({digits} цифр, tracemalloc)")
+    rng = random.Random(2)
+    strings = [
+        random_digits(rng, digits // 2) + "." + random_digits(rng, digits // 2)
+        for _ in range(1000)
+    ]
+    samples = [Fraction(s) for s in strings]
+    packed = traced_size(lambda: [Fraction(strings[i % 1000]) for i in range(n)])
+    listed = traced_size(
+        lambda: [ListLayoutFraction(samples[i % 1000]) for i in range(n)]
+    )
+    print(f"{'списки int':>14}: {listed / 2**20:8.1f} МиБ ({listed / n:6.1f} Б/шт.)")
+    print(f"{'bytearray':>14}: {packed / 2**20:8.1f} МиБ ({packed / n:6.1f} Б/шт.)")
+    print(f"{'экономия':>14}: {listed / packed:8.2f}x")
+
+
+def bench_large_mul(sizes=(1000, 5000, 20000, 50000)) -> None:
+    print("\nУмножение больших чисел: Decimal и обратно против Fraction (мс)")
+    rng = random.Random(5)
+    for n in sizes:
+        with Fraction.local_max_size(2 * n):
+            a = random_fraction(rng, n)
+            b = random_fraction(rng, n)
+            assert str(a * b) == str(decimal_path("*", a, b))
+            old = best_of(lambda: decimal_path("*", a, b), 5)
+            new = best_of(lambda: a * b, 5)
+        print(f"{n:>6} цифр: Decimal {old * 1e3:8.3f}, Fraction {new * 1e3:8.3f}")
+
+
+def fresh_copies(value: Fraction, n: int) -> list[Fraction]:
+    # Копии без кэша канонической формы: Decimal строится заново.
+    digits, int_len = value._digits, value._int_len
+    return [Fraction._from_digits(bytearray(digits), int_len) for _ in range(n)]
+
+
+def calibrate_mul(
+    sizes=(50, 100, 200, 400, 800, 1600, 3200), number: int = 50
+) -> int | None:
+    """Наименьший размер множителя, с которого умножение через Decimal быстрее int."""
+    print("\nКалибровка Fraction.DECIMAL_MUL_THRESHOLD (мкс на умножение n цифр)")
+    print(f"{'цифр':>6} {'int':>10} {'Decimal':>10}")
+    rng = random.Random(7)
+    saved = Fraction.DECIMAL_MUL_THRESHOLD
+    found = None
+    try:
+        for n in sizes:
+            with Fraction.local_max_size(2 * n):
+                a = random_fraction(rng, n)
+                b = random_fraction(rng, n)
+                times = []
+                for threshold in (sys.maxsize, 0):
+                    Fraction.DECIMAL_MUL_THRESHOLD = threshold
+                    best = float("inf")
+                    for _ in range(5):
+                        pairs = zip(fresh_copies(a, number), fresh_copies(b, number))
+                        pairs = list(pairs)
+                        start = time.perf_counter()
+                        for x, y in pairs:
+                            x * y
+                        best = min(best, (time.perf_counter() - start) / number)
+                    times.append(best)
+            print(f"{n:>6} {times[0] * 1e6:>10.1f} {times[1] * 1e6:>10.1f}")
+            if found is None and times[1] < times[0]:
+                found = n
+    finally:
+        Fraction.DECIMAL_MUL_THRESHOLD = saved
+    print(f"Рекомендуемый порог: Fraction.DECIMAL_MUL_THRESHOLD = {found}")
+    return found
+
+
+def uncached_compare(a: Fraction, b: Fraction) -> int:
+    # Прежний путь сравнения: Decimal заново на каждый вызов.
+    x, y = Decimal(a._to_string()), Decimal(b._to_string())
+    return (x > y) - (x < y)
+
+
+def timed_sort(values: list, **kwargs) -> tuple[list, float]:
+    values = [Fraction._from_digits(bytearray(v._digits), v._int_len) for v in values]
+    start = time.perf_counter()
+    res = sorted(values, **kwargs)
+    return res, time.perf_counter() - start
+
+
+def bench_sort(n: int = 1_000_000) -> None:
+    print(f"\nСортировка {n} значений (с, на свежих объектах без кэша)")
+    rng = random.Random(6)
+    # Разная длина целой части: часть сравнений решается без просмотра цифр.
+    values = [random_fraction(rng, rng.randint(2, 20)) for _ in range(n - n // 10)]
+    values += [Fraction(str(rng.randrange(10**6))) for _ in range(n // 10)]
+    rng.shuffle(values)
+    old, old_time = timed_sort(values, key=functools.cmp_to_key(uncached_compare))
+    expected = [str(f) for f in old]
+    cases = [("__lt__", {}), ("key=sort_key", {"key": Fraction.sort_key})]
+    print(f"{'Decimal':>14}: {old_time:6.2f}")
+    for name, kwargs in cases:
+        res, elapsed = timed_sort(values, **kwargs)
+        assert [str(f) for f in res] == expected
+        print(f"{name:>14}: {elapsed:6.2f} ({old_time / elapsed:.1f}x)")
+
+
+def bench_array(n: int = 100_000, digits: int = 20) -> None:
+    print(f"\nFractionArray против поэлементных операций ({n} значений, {digits} цифр)")
+    rng = random.Random(7)
+    a = [random_fraction(rng, digits) for _ in range(n)]
+    b = [random_fraction(rng, digits) for _ in range(n)]
+    x, y = FractionArray(a), FractionArray(b)
+    cases = [
+        ("+", lambda: [p + q for p, q in zip(a, b)], lambda: x + y),
+        ("*", lambda: [p * q for p, q in zip(a, b)], lambda: x * y),
+        ("<", lambda: [p < q for p, q in zip(a, b)], lambda: x < y),
+        ("argsort", lambda: sorted(range(n), key=a.__getitem__), x.argsort),
+        ("sum", lambda: functools.reduce(operator.add, a), x.sum),
+    ]
+    print(
+        f"{'операция':>9} {'объекты, с':>11} {'массив, с':>10}"
+        f" {'млн/с':>7} {'ускорение':>10}"
+    )
+    for name, per_object, vectorized in cases:
+        old = best_of(per_object, 1, 1)
+        new = best_of(vectorized, 1, 3)
+        print(
+            f"{name:>9} {old:>11.3f} {new:>10.4f}"
+            f" {n / new / 1e6:>7.1f} {old / new:>9.0f}x"
+        )
+
+
+def write_numbers(path: str, n: int, rng: random.Random) -> None:
+    with open(path, "w") as f:
+        for _ in range(n):
+            f.write(f"{rng.randrange(10**9)}.{rng.randrange(10**6):06d}\n")
+
+
+def consume_stream(path: str, as_array: bool = False) -> None:
+    with open(path, "rb") as f:
+        for _ in Fraction.parse_stream(f, as_array=as_array):
+            pass
+
+
+def stream_peak(path: str) -> int:
+    tracemalloc.start()
+    try:
+        consume_stream(path)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_parse(sizes=(200_000, 1_000_000)) -> None:
+    print("\nРазбор файла: построчно Fraction(line) против Fraction.parse_stream")
+    rng = random.Random(8)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            path = os.path.join(tmp, f"numbers_{n}.txt")
+            write_numbers(path, n, rng)
+            start = time.perf_counter()
+            with open(path) as f:
+                for line in f:
+                    Fraction(line)
+            old = time.perf_counter() - start
+            start = time.perf_counter()
+            consume_stream(path)
+            new = time.perf_counter() - start
+            start = time.perf_counter()
+            consume_stream(path, as_array=True)
+            packed = time.perf_counter() - start
+            peak = stream_peak(path)
+            print(
+                f"{n:>9} строк: построчно {old:6.2f} с, parse_stream {new:6.2f} с"
+                f" ({old / new:.1f}x), as_array {packed:6.2f} с ({old / packed:.1f}x),"
+                f" пик памяти {peak / 2**20:.1f} МиБ"
+            )
+
+
+def bench_batch(n: int = 200_000, digits: int = 30) -> None:
+    print(f"\nFraction.evaluate_batch: {n} операций по {digits} цифр")
+    print(f"Доступно процессоров: {os.cpu_count()}")
+    rng = random.Random(9)
+    ops = [
+        (rng.choice("+*"), random_fraction(rng, digits), random_fraction(rng, digits))
+        for _ in range(n)
+    ]
+    expected = None
+    base = {}
+    for processes, name in ((False, "потоки"), (True, "процессы")):
+        for workers in (1, 2, 4, 8):
+            start = time.perf_counter()
+            res = Fraction.evaluate_batch(ops, workers=workers, processes=processes)
+            elapsed = time.perf_counter() - start
+            res = [str(f) for f in res]
+            expected = expected or res
+            assert res == expected
+            base.setdefault(processes, elapsed)
+            print(
+                f"{name:>9}, workers={workers}: {elapsed:6.2f} с"
+                f" ({base[processes] / elapsed:.2f}x)"
+            )
+
+
+def pairwise_unique(values: list) -> list:
+    # Прежний способ без __hash__: попарные сравнения через Decimal, O(n²).
+    unique = []
+    for v in values:
+        dec = Decimal(v._to_string())
+        if all(Decimal(u._to_string()) != dec for u in unique):
+            unique.append(v)
+    return unique
+
+
+def bench_dedup(n: int = 20_000, distinct: int = 500) -> None:
+    print(f"\nДедупликация {n} цен ({distinct} различных значений)")
+    rng = random.Random(10)
+    pool = [f"{rng.randrange(1000)}.{rng.randrange(100):02d}" for _ in range(distinct)]
+    strings = [rng.choice(pool) + "0" * rng.randrange(3) for _ in range(n)]
+    values = [Fraction(s) for s in strings]
+    start = time.perf_counter()
+    old = pairwise_unique(values)
+    old_time = time.perf_counter() - start
+    start = time.perf_counter()
+    new = set(values)
+    new_time = time.perf_counter() - start
+    assert len(old) == len(new)
+    print(
+        f"попарно: {old_time:.2f} с, set(): {new_time:.4f} с"
+        f" ({old_time / new_time:.0f}x)"
+    )
+    Fraction.clear_intern()
+    plain = traced_size(lambda: [Fraction(s) for s in strings])
+    shared = traced_size(lambda: [Fraction.intern(s) for s in strings])
+    info = Fraction.intern_info()
+    print(
+        f"память: без intern {plain / 2**20:.2f} МиБ,"
+        f" с intern {shared / 2**20:.2f} МиБ; попаданий {info['hit_rate']:.1%}"
+    )
+
+
+def bench_sum(n: int = 1_000_000, digits: int = 12) -> None:
+    print(f"\nСумма {n} значений ({digits} цифр)")
+    rng = random.Random(11)
+    pool = [random_fraction(rng, digits) for _ in range(1000)]
+    values = [pool[i % 1000] for i in range(n)]
+    start = time.perf_counter()
+    old = functools.reduce(operator.add, values, Fraction("0"))
+    old_time = time.perf_counter() - start
+    start = time.perf_counter()
+    new = Fraction.sum(values)
+    new_time = time.perf_counter() - start
+    assert new == old
+    tracemalloc.start()
+    try:
+        Fraction.sum(values)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    print(
+        f"reduce(add): {old_time:.2f} с, Fraction.sum: {new_time:.2f} с"
+        f" ({old_time / new_time:.1f}x), пик памяти суммы {peak} Б"
+    )
+
+
+def decimal_divide(a: Fraction, b: Fraction) -> Fraction:
+    # Прежний путь: через Decimal и обратно через from_decimal.
+    with localcontext(prec=Fraction.max_size()):
+        return Fraction.from_decimal(a.to_decimal() / b.to_decimal())
+
+
+def decimal_sqrt(a: Fraction) -> Fraction:
+    with localcontext(prec=Fraction.max_size()):
+        return Fraction.from_decimal(a.to_decimal().sqrt())
+
+
+def bench_divide(sizes=(50, 500, 5000)) -> None:
+    print("\nДеление и корень: Decimal и обратно против Fraction (мс)")
+    print(f"{'цифр':>6} {'оп':>5} {'Decimal':>10} {'Fraction':>10} {'отношение':>10}")
+    rng = random.Random(12)
+    for n in sizes:
+        with Fraction.local_max_size(n):
+            a = random_fraction(rng, n)
+            b = random_fraction(rng, n)
+            cases = [
+                ("/", lambda: decimal_divide(a, b), lambda: a / b),
+                ("sqrt", lambda: decimal_sqrt(a), a.sqrt),
+            ]
+            for name, old_path, new_path in cases:
+                assert str(old_path()) == str(new_path())
+                old = best_of(old_path, 5)
+                new = best_of(new_path, 5)
+                print(
+                    f"{n:>6} {name:>5} {old * 1e3:>10.3f} {new * 1e3:>10.3f}"
+                    f" {old / new:>9.2f}x"
+                )
+    calibrate_newton()
+
+
+def calibrate_newton(sizes=(5000, 10000, 20000, 50000, 100000)) -> int | None:
+    """Наименьший размер делителя, с которого Ньютон быстрее divmod из libmpdec."""
+    print("\nКалибровка Fraction.NEWTON_THRESHOLD (мс на деление 2n цифр на n)")
+    print(f"{'цифр':>6} {'divmod':>10} {'Ньютон':>10}")
+    rng = random.Random(13)
+    found = None
+    for n in sizes:
+        d = Decimal(random_digits(rng, n))
+        x = Decimal(random_digits(rng, 2 * n))
+        school = best_of(lambda: zad_2._EXACT.divmod(x, d), 1, 3)
+        newton = best_of(lambda: zad_2._divmod_newton(x, d), 1, 3)
+        print(f"{n:>6} {school * 1e3:>10.2f} {newton * 1e3:>10.2f}")
+        if found is None and newton < school:
+            found = n
+    print(f"Рекомендуемый порог: Fraction.NEWTON_THRESHOLD = {found}")
+    return found
+
+
+def bench_store(sizes=(100_000, 1_000_000, 5_000_000), probes: int = 100_000) -> None:
+    print("\nFractionStore: произвольный доступ против str() и разбора всего файла")
+    rng = random.Random(14)
+    pool = [random_fraction(rng, rng.randint(2, 20)) for _ in range(1000)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            text = os.path.join(tmp, f"values_{n}.txt")
+            path = os.path.join(tmp, f"values_{n}.frs")
+            with open(text, "w") as f:
+                for i in range(n):
+                    f.write(f"{pool[i % 1000]}\n")
+            FractionStore.write(path, (pool[i % 1000] for i in range(n)))
+            start = time.perf_counter()
+            with open(text) as f:
+                values = [Fraction(line) for line in f]
+            reparse = time.perf_counter() - start
+            del values
+            ks = [rng.randrange(n) for _ in range(probes)]
+            start = time.perf_counter()
+            with FractionStore(path) as store:
+                for k in ks:
+                    store[k]
+            access = (time.perf_counter() - start) / probes
+            print(
+                f"{n:>9} записей: {os.path.getsize(path) / n:5.1f} Б/запись"
+                f" (текст {os.path.getsize(text) / n:5.1f}),"
+                f" разбор всего текста {reparse:6.2f} с,"
+                f" store[k] {access * 1e6:5.2f} мкс"
+            )
+
+
+def bench_slice(n: int = 100_000, window: int = 50_000) -> None:
+    print(f"\nОкно из {window} дробных цифр числа из {n} цифр (мкс)")
+    rng = random.Random(15)
+    with Fraction.local_max_size(n):
+        f = random_fraction(rng, n)
+    start = len(f.int_part)
+    cases = [
+        ("цикл f[i]", lambda: bytes([f[i] for i in range(start, start + window)])),
+        ("f[a:b].tobytes()", lambda: f[start:start + window].tobytes()),
+        ("memoryview", lambda: f[start:start + window].memory),
+    ]
+    base = None
+    for name, func in cases:
+        elapsed = best_of(func, 20)
+        base = base or elapsed
+        print(f"{name:>18}: {elapsed * 1e6:10.2f} ({base / elapsed:.0f}x)")
+
+
+def bench_format(n: int = 1_000_000, spec: str = ">16,.2f") -> None:
+    print(f"\nФорматирование {n} значений для отчёта, format(x, {spec!r}) (с)")
+    rng = random.Random(16)
+    pool = [random_fraction(rng, rng.randint(2, 12)) for _ in range(1000)]
+    values = [pool[i % 1000] for i in range(n)]
+    cases = [
+        ("Decimal(str(f))", lambda: [format(Decimal(str(v)), spec) for v in values]),
+        ("float(str(f))", lambda: [format(float(str(v)), spec) for v in values]),
+        ("format(f)", lambda: [format(v, spec) for v in values]),
+    ]
+    base = None
+    for name, func in cases:
+        elapsed = best_of(func, 1, 3)
+        base = base or elapsed
+        print(f"{name:>16}: {elapsed:6.2f} ({base / elapsed:.1f}x)")
+    conversions = [
+        ("float(str(f))", lambda: [float(str(v)) for v in values]),
+        ("float(f)", lambda: [float(v) for v in values]),
+        ("int(Decimal)", lambda: [int(Decimal(str(v))) for v in values]),
+        ("int(f)", lambda: [int(v) for v in values]),
+    ]
+    for name, func in conversions:
+        print(f"{name:>16}: {best_of(func, 1, 3):6.2f}")
+
+
+SECTIONS = {
+    "arithmetic": bench_arithmetic,
+    "memory": bench_memory,
+    "large": bench_large_mul,
+    "multiply": calibrate_mul,
+    "sort": bench_sort,
+    "array": bench_array,
+    "parse": bench_parse,
+    "batch": bench_batch,
+    "dedup": bench_dedup,
+    "sum": bench_sum,
+    "divide": bench_divide,
+    "store": bench_store,
+    "slice": bench_slice,
+    "format": bench_format,
+}
+
+
+def main(names: list[str]) -> None:
+    for name in names or SECTIONS:
+        SECTIONS[name]()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,311 @@
+import csv
+import functools
+import heapq
+import itertools
+import math
+import operator
+import os
+import random
+import sys
+import tempfile
+import timeit
+from fractions import Fraction as Exact
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from individ.Zad.intake_log import IntakeLog  # noqa: E402
+from individ.Zad.meal_plan import plan_meal  # noqa: E402
+from individ.Zad.zad_1 import (  # noqa: E402
+    Kalor,
+    KalorBatch,
+    KalorIndex,
+    NutrientKalor,
+)
+
+
+def random_catalog(rng: random.Random, n: int) -> list:
+    return [Kalor(rng.randint(10, 900), rng.uniform(0.05, 5.0)) for _ in range(n)]
+
+
+def best_of(func, number: int, repeat: int = 5) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def report(title: str, cases: list) -> None:
+    print(f"\n{title} (мс)")
+    base = None
+    for name, func in cases:
+        elapsed = best_of(func, 1, 3)
+        base = base or elapsed
+        print(f"{name:>24}: {elapsed * 1e3:9.2f} ({base / elapsed:.1f}x)")
+
+
+def bench_catalog(n: int = 1_000_000) -> None:
+    rng = random.Random(15)
+    values = random_catalog(rng, n)
+    others = values[::-1]
+    batch = KalorBatch(values)
+    other_batch = KalorBatch(others)
+    limit = Kalor(300, 1.0)
+    factors = [rng.uniform(0.5, 2.0) for _ in range(n)]
+    print(f"Каталог из {n} продуктов: объекты Kalor против KalorBatch")
+    report("Сумма калорий", [
+        ("sum(v.power())", lambda: sum(v.power() for v in values)),
+        ("KalorBatch.total()", batch.total),
+    ])
+    report("Попарное смешивание", [
+        ("map(add)", lambda: list(map(operator.add, values, others))),
+        ("batch + batch", lambda: batch + other_batch),
+    ])
+    report("Смесь всего каталога", [
+        ("reduce(add)", lambda: functools.reduce(operator.add, values)),
+        ("KalorBatch.mix()", batch.mix),
+    ])
+    report("Масштабирование по строкам", [
+        ("v * f", lambda: [v * f for v, f in zip(values, factors)]),
+        ("batch * factors", lambda: batch * factors),
+    ])
+    report("Фильтр и сортировка", [
+        ("filter + sorted", lambda: sorted(v for v in values if v < limit)),
+        ("batch[mask].sorted()", lambda: batch[batch < limit].sorted()),
+    ])
+    report("Преобразования", [
+        ("KalorBatch(values)", lambda: KalorBatch(values)),
+        ("batch.tolist()", batch.tolist),
+    ])
+
+
+def exact_mix(values: list) -> float:
+    mass = sum(Exact(v.second) for v in values)
+    return float(sum(v.first * Exact(v.second) for v in values) / mass)
+
+
+def bench_mix(sizes=(10, 500, 100_000)) -> None:
+    print("\nСмесь рецепта: цепочка + против Kalor.mix (мс, ошибка ккал/100 г)")
+    header = ("ингр.", "sum(+)", "mix", "ошибка +", "ошибка mix")
+    print("".join(f"{h:>11}" for h in header))
+    rng = random.Random(16)
+    for n in sizes:
+        values = random_catalog(rng, n)
+        exact = exact_mix(values)
+        chained = functools.reduce(operator.add, values)
+        mixed = Kalor.mix(values)
+        old = best_of(lambda: functools.reduce(operator.add, values), 1, 3)
+        new = best_of(lambda: Kalor.mix(iter(values)), 1, 3)
+        print(
+            f"{n:>11} {old * 1e3:>10.2f} {new * 1e3:>10.2f}"
+            f" {abs(chained.first - exact):>10.2f} {abs(mixed.first - exact):>10.2f}"
+        )
+
+
+def bench_index(n: int = 1_000_000, k: int = 10, inserts: int = 20) -> None:
+    print(f"\nКаталог из {n} продуктов: запросы через KalorIndex")
+    rng = random.Random(17)
+    values = random_catalog(rng, n)
+    batch = KalorBatch(values)
+    index = KalorIndex(values)
+    report("Построение", [
+        ("sorted(values)", lambda: sorted(values)),
+        ("KalorIndex(values)", lambda: KalorIndex(values)),
+        ("KalorIndex(batch)", lambda: KalorIndex(batch)),
+    ])
+    report(f"Топ-{k} по общей калорийности", [
+        ("sorted()[:k]", lambda: sorted(values, reverse=True)[:k]),
+        ("heapq.nlargest", lambda: heapq.nlargest(k, values)),
+        ("index.top_k", lambda: index.top_k(k)),
+    ])
+    density = operator.attrgetter("first")
+    report(f"Топ-{k} по ккал/100 г", [
+        ("heapq.nlargest(first)", lambda: heapq.nlargest(k, values, key=density)),
+        ("index.top_k(density)", lambda: index.top_k(k, by="density")),
+    ])
+    report("Диапазон 400–800 ккал", [
+        ("фильтр по power()", lambda: [v for v in values if 400 <= v.power() <= 800]),
+        ("index.between", lambda: index.between(400, 800)),
+    ])
+    extra = random_catalog(rng, inserts)
+
+    def resort() -> None:
+        items = list(values)
+        for v in extra:
+            items.append(v)
+            items.sort()
+
+    def insert_remove() -> None:
+        for v in extra:
+            index.add(v)
+        for v in extra:
+            index.remove(v)
+
+    report(f"{inserts} вставок с сохранением порядка", [
+        ("append + sort", resort),
+        ("KalorIndex.add + remove", insert_remove),
+    ])
+
+def brute_force_plan(products: list, target: float, step: float) -> float:
+    """Прежний способ: перебор всех сочетаний Kalor * scalar."""
+    best = math.inf
+    counts = [range(round(p.second / step) + 1) for p in products]
+    for units in itertools.product(*counts):
+        parts = [p * (u * step / p.second) for p, u in zip(products, units) if u]
+        best = min(best, abs(sum(p.power() for p in parts) - target))
+    return best
+
+
+def bench_plan(n: int = 1000, target: float = 2345.6) -> None:
+    print("\nПлан питания (мс, ошибка ккал)")
+    rng = random.Random(18)
+    small = [Kalor(rng.randint(20, 900), 0.3) for _ in range(4)]
+    old = best_of(lambda: brute_force_plan(small, 900, 0.02), 1, 1)
+    new = best_of(lambda: plan_meal(small, 900, step=0.02), 1, 3)
+    print(f"{'перебор, 4 продукта, 900':>36}: {old * 1e3:9.2f}")
+    print(f"{'plan_meal, 4 продукта, 900':>36}: {new * 1e3:9.2f} ({old / new:.0f}x)")
+    products = random_catalog(rng, n)
+    for step, cells in ((0.01, None), (0.001, None), (0.01, 0)):
+        kwargs = {} if cells is None else {"max_cells": cells}
+        plan = plan_meal(products, target, step=step, **kwargs)
+        run = functools.partial(plan_meal, products, target, step=step, **kwargs)
+        elapsed = best_of(run, 1, 3)
+        name = f"{n} продуктов, {target}, шаг {step}, {plan.method}"
+        print(f"{name:>36}: {elapsed * 1e3:9.2f} ({plan.error():+.3f})")
+
+
+def csv_rows(path: str) -> list:
+    """Прежний способ: csv.reader и конструктор Kalor на каждую строку."""
+    values = []
+    with open(path, newline="") as f:
+        for first, second in csv.reader(f):
+            try:
+                values.append(Kalor(first, second))
+            except ValueError:
+                pass
+    return values
+
+
+def bench_load(n: int = 2_000_000, workers: int = 2) -> None:
+    rng = random.Random(19)
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as f:
+        for _ in range(n):
+            f.write(f"{rng.randint(10, 900)},{rng.uniform(0.05, 5.0):.3f}\n")
+        path = f.name
+    try:
+        size = os.path.getsize(path) / 2**20
+        print(f"\nЗагрузка CSV: {n} строк, {size:.0f} МБ (с)")
+        cases = [
+            ("csv.reader + Kalor", lambda: csv_rows(path)),
+            ("Kalor.load_csv", lambda: list(Kalor.load_csv(path))),
+            ("KalorBatch.load_csv", lambda: list(KalorBatch.load_csv(path))),
+            (
+                f"KalorBatch, {workers} процесса",
+                lambda: list(KalorBatch.load_csv(path, workers=workers)),
+            ),
+        ]
+        base = None
+        for name, func in cases:
+            elapsed = best_of(func, 1, 3)
+            base = base or elapsed
+            print(f"{name:>24}: {elapsed:6.2f} ({base / elapsed:.1f}x)")
+    finally:
+        os.remove(path)
+
+
+def bench_nutrients(meals: int = 100_000, size: int = 5) -> None:
+    print(f"\nАгрегация {meals} приёмов пищи по {size} продуктов (приёмов в секунду)")
+    rng = random.Random(20)
+    products = []
+    for _ in range(1000):
+        per100 = [rng.randint(20, 900)] + [rng.uniform(0, 40) for _ in range(3)]
+        products.append(NutrientKalor(per100, rng.uniform(0.05, 0.5)))
+    # Прежняя схема: четыре параллельных Kalor на продукт (целые на 100 г).
+    parallel = [
+        [Kalor(max(1, round(x)), p.second) for x in p.per100.tolist()] for p in products
+    ]
+    plan = [[rng.randrange(len(products)) for _ in range(size)] for _ in range(meals)]
+    per100 = np.stack([products[i].per100 for meal in plan for i in meal])
+    masses = np.array([products[i].second for meal in plan for i in meal])
+    ids = np.repeat(np.arange(meals), size)
+
+    def four_kalor() -> None:
+        for meal in plan:
+            for field in range(NutrientKalor.WIDTH):
+                functools.reduce(operator.add, (parallel[i][field] for i in meal))
+
+    def chained() -> None:
+        for meal in plan:
+            functools.reduce(operator.add, (products[i] for i in meal))
+
+    def mixed() -> None:
+        for meal in plan:
+            NutrientKalor.mix([products[i] for i in meal])
+
+    cases = [
+        ("4 × Kalor, +", four_kalor),
+        ("NutrientKalor, +", chained),
+        ("NutrientKalor.mix", mixed),
+        ("aggregate", lambda: NutrientKalor.aggregate(per100, masses, ids)),
+    ]
+    for name, func in cases:
+        elapsed = best_of(func, 1, 3)
+        print(f"{name:>24}: {meals / elapsed:14,.0f}")
+
+
+def intake_entries(rng: random.Random, n: int, lateness: float) -> list:
+    portions = random_catalog(rng, 1000)
+    entries = []
+    t = 0.0
+    for i in range(n):
+        t += rng.expovariate(1 / 5)
+        late = rng.uniform(0, lateness) if rng.random() < 0.1 else 0.0
+        entries.append((t - late, portions[i % 1000]))
+    return entries
+
+
+def resum_totals(entries: list) -> None:
+    """Прежний способ: на каждую запись пересчитать окна по всей истории."""
+    history = []
+    latest = -math.inf
+    for t, portion in entries:
+        history.append((t, portion))
+        latest = max(latest, t)
+        for window in IntakeLog.WINDOWS.values():
+            sum(p.power() for s, p in history if s > latest - window)
+
+
+def bench_intake(n: int = 1_000_000, naive: int = 5_000) -> None:
+    print("\nЖурнал потребления: записей в минуту с окнами 24 ч, 7 и 30 дней")
+    rng = random.Random(21)
+    entries = intake_entries(rng, n, 600)
+    elapsed = best_of(lambda: resum_totals(entries[:naive]), 1, 1)
+    print(f"{'пересчёт истории':>24}: {naive / elapsed * 60:14,.0f} ({naive} записей)")
+
+    def run() -> None:
+        log = IntakeLog(lateness=600)
+        for t, portion in entries:
+            log.add(t, portion)
+            log.totals()
+
+    elapsed = best_of(run, 1, 3)
+    print(f"{'IntakeLog.add + totals':>24}: {n / elapsed * 60:14,.0f}")
+    elapsed = best_of(lambda: IntakeLog(lateness=600).extend(entries), 1, 3)
+    print(f"{'IntakeLog.extend':>24}: {n / elapsed * 60:14,.0f}")
+
+
+SECTIONS = {
+    "catalog": bench_catalog,
+    "mix": bench_mix,
+    "index": bench_index,
+    "plan": bench_plan,
+    "load": bench_load,
+    "nutrients": bench_nutrients,
+    "intake": bench_intake,
+}
+
+
+def main(names: list[str]) -> None:
+    for name in names or SECTIONS:
+        SECTIONS[name]()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,4 +1,19 @@
-from .zad1 import Pair
-from .zad2 import Goods, Receipt
+from .zad_1 import Kalor, KalorBatch, KalorIndex, NutrientKalor, make_Point
+from .intake_log import IntakeLog
+from .meal_plan import MealPlan, plan_meal
+from .zad_2 import Fraction, FractionArray, FractionStore, FractionView
 
-__all__ = ["Pair", "Goods", "Receipt"]
+__all__ = [
+    "Kalor",
+    "KalorBatch",
+    "KalorIndex",
+    "NutrientKalor",
+    "make_Point",
+    "IntakeLog",
+    "MealPlan",
+    "plan_meal",
+    "Fraction",
+    "FractionArray",
+    "FractionStore",
+    "FractionView",
+]
@@ -0,0 +1,168 @@
+import math
+from array import array
+from datetime import datetime
+from typing import Iterable, Union
+
+from .zad_1 import Kalor
+
+Timestamp = Union[int, float, datetime]
+
+
+class IntakeLog:
+    """Журнал съеденных порций со скользящими суммами ккал за несколько окон.
+
+    Время делится на корзины по bucket секунд, суммы корзин лежат в кольцевом
+    буфере, а для каждого окна хранится текущая сумма. Добавление и запрос
+    амортизированно O(1); граница окна точна до одной корзины. Записи
+    со временем не раньше latest - lateness принимаются в свою корзину.
+    """
+
+    WINDOWS = {"24h": 86400.0, "7d": 7 * 86400.0, "30d": 30 * 86400.0}
+
+    __slots__ = (
+        "_bucket",
+        "_lateness",
+        "_names",
+        "_spans",
+        "_ring",
+        "_size",
+        "_head",
+        "_sums",
+        "_latest",
+        "_count",
+    )
+
+    def __init__(
+        self,
+        windows: Union[dict, None] = None,
+        bucket: float = 60.0,
+        lateness: float = 3600.0,
+    ) -> None:
+        windows = dict(self.WINDOWS if windows is None else windows)
+        if not windows or any(w <= 0 for w in windows.values()):
+            raise ValueError("Окна должны быть положительными.")
+        if bucket <= 0:
+            raise ValueError("Размер корзины должен быть положительным.")
+        if lateness < 0:
+            raise ValueError("Допустимое опоздание не может быть отрицательным.")
+        self._bucket = float(bucket)
+        self._lateness = float(lateness)
+        self._names = list(windows)
+        self._spans = [math.ceil(w / bucket) for w in windows.values()]
+        # Корзины старше самого длинного окна и опоздания больше не нужны.
+        self._size = max(self._spans) + math.ceil(lateness / bucket) + 1
+        self._ring = array("d", bytes(8 * self._size))
+        self._head = None
+        self._sums = [0.0] * len(self._spans)
+        self._latest = -math.inf
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def latest(self) -> float:
+        return self._latest
+
+    def _range_sum(self, lo: int, hi: int) -> float:
+        """Сумма корзин с номерами [lo, hi) по кольцу."""
+        size = self._size
+        if hi - lo >= size:
+            return sum(self._ring)
+        a, b = lo % size, hi % size
+        if a < b or hi == lo:
+            return sum(self._ring[a:b])
+        return sum(self._ring[a:]) + sum(self._ring[:b])
+
+    def _advance(self, head: int) -> None:
+        old, size = self._head, self._size
+        if head - old >= size:
+            self._ring = array("d", bytes(8 * size))
+            self._sums = [0.0] * len(self._spans)
+            self._head = head
+            return
+        sums = self._sums
+        for j, span in enumerate(self._spans):
+            # Окно j — корзины (head - span, head]; выпадают (old - span, head - span],
+            # но корзины новее old ещё пусты (в их ячейках старые данные).
+            hi = min(head - span, old) + 1
+            if hi > old - span + 1:
+                sums[j] -= self._range_sum(old - span + 1, hi)
+        a, b = (old + 1) % size, (head + 1) % size
+        if a < b:
+            self._ring[a:b] = array("d", bytes(8 * (b - a)))
+        else:
+            self._ring[a:] = array("d", bytes(8 * (size - a)))
+            self._ring[:b] = array("d", bytes(8 * b))
+        self._head = head
+        if head // size != old // size:
+            # Раз за оборот кольца суммы пересчитываются заново: вычитания
+            # не копят погрешность float.
+            self._sums = [
+                math.fsum(self._ring_window(span)) for span in self._spans
+            ]
+
+    def _ring_window(self, span: int) -> Iterable[float]:
+        size, head = self._size, self._head
+        return (self._ring[b % size] for b in range(head - span + 1, head + 1))
+
+    def add(self, timestamp: Timestamp, portion: Kalor) -> None:
+        if not isinstance(portion, Kalor):
+            raise TypeError("В журнал можно добавлять только объекты Kalor.")
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.timestamp()
+        if not math.isfinite(timestamp):
+            raise ValueError("Время записи должно быть конечным числом.")
+        if timestamp < self._latest - self._lateness:
+            raise ValueError("Запись опоздала больше допустимого.")
+        kcal = portion.power()
+        b = math.floor(timestamp / self._bucket)
+        if self._head is None:
+            self._head = b
+        elif b > self._head:
+            self._advance(b)
+        self._ring[b % self._size] += kcal
+        head = self._head
+        sums = self._sums
+        for j, span in enumerate(self._spans):
+            if b > head - span:
+                sums[j] += kcal
+        if timestamp > self._latest:
+            self._latest = timestamp
+        self._count += 1
+
+    def extend(
+        self, entries: Iterable[tuple], errors: Union[list, None] = None
+    ) -> None:
+        """Добавление пар (время, Kalor); без errors первая ошибка пробрасывается,
+        с errors в него добавляются пары (индекс, причина)."""
+        add = self.add
+        for i, (timestamp, portion) in enumerate(entries):
+            try:
+                add(timestamp, portion)
+            except (TypeError, ValueError) as e:
+                if errors is None:
+                    raise
+                errors.append((i, str(e)))
+
+    def advance(self, timestamp: Timestamp) -> None:
+        """Сдвиг часов без записи, чтобы окна «остыли» к моменту запроса."""
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.timestamp()
+        b = math.floor(timestamp / self._bucket)
+        if self._head is None:
+            self._head = b
+        elif b > self._head:
+            self._advance(b)
+        if timestamp > self._latest:
+            self._latest = timestamp
+
+    def total(self, window: str) -> float:
+        try:
+            j = self._names.index(window)
+        except ValueError:
+            raise KeyError(f"Неизвестное окно: {window}") from None
+        return max(self._sums[j], 0.0)
+
+    def totals(self) -> dict:
+        return {name: max(s, 0.0) for name, s in zip(self._names, self._sums)}
@@ -0,0 +1,166 @@
+import math
+from typing import Any, Iterable, Sequence, Union
+
+import numpy as np
+
+from .zad_1 import Kalor
+
+Bounds = tuple[float, float]
+
+
+class MealPlan:
+    """Выбранные массы продуктов; продукты с нулевой массой не входят в items."""
+
+    __slots__ = ("products", "masses", "target", "method")
+
+    def __init__(
+        self, products: list, masses: list, target: float, method: str
+    ) -> None:
+        self.products = products
+        self.masses = masses
+        self.target = target
+        self.method = method
+
+    @property
+    def items(self) -> list:
+        return [
+            Kalor(p.first, m) for p, m in zip(self.products, self.masses) if m > 0
+        ]
+
+    def total(self) -> float:
+        return sum(p.first * m * 10 for p, m in zip(self.products, self.masses))
+
+    def error(self) -> float:
+        return self.total() - self.target
+
+    def mix(self) -> Kalor:
+        return Kalor.mix(self.items)
+
+    def __repr__(self) -> str:
+        return (
+            f"MealPlan({len(self.items)} продуктов, {self.total():.1f} ккал,"
+            f" цель {self.target}, {self.method})"
+        )
+
+
+def _unit_bounds(
+    products: list, bounds: Union[Bounds, Sequence[Bounds], None], step: float
+) -> tuple:
+    if bounds is None:
+        pairs = [(0.0, p.second) for p in products]
+    elif len(bounds) == 2 and not isinstance(bounds[0], (tuple, list)):
+        pairs = [tuple(bounds)] * len(products)
+    else:
+        pairs = list(bounds)
+        if len(pairs) != len(products):
+            raise ValueError("Число границ массы не совпадает с числом продуктов.")
+    low = np.empty(len(products), dtype=np.int64)
+    high = np.empty(len(products), dtype=np.int64)
+    for i, (lo, hi) in enumerate(pairs):
+        if lo < 0 or hi < lo:
+            raise ValueError("Границы массы должны удовлетворять 0 <= min <= max.")
+        # Допуск на погрешность деления: 0.3 / 0.1 = 2.9999999999999996.
+        low[i] = math.ceil(lo / step - 1e-9)
+        high[i] = math.floor(hi / step + 1e-9)
+        if high[i] < low[i]:
+            raise ValueError("В границах массы нет ни одного шага.")
+    return low, high
+
+
+def _solve_dp(weights: np.ndarray, counts: np.ndarray, goal: int, limit: int) -> Any:
+    """Ограниченный рюкзак по достижимым суммам; None, если таблица больше limit.
+
+    Каждый продукт делится на части 1, 2, 4, ... единиц, и таблица обновляется
+    как для рюкзака 0/1. choose[s] — часть, которой сумма s достигнута впервые:
+    предшественник s достигнут раньше, поэтому восстановление берёт каждую
+    часть не более одного раза и не выходит за границы.
+    """
+    # Перелёт больше чем на одну единицу самого тяжёлого продукта не нужен:
+    # путь к такой сумме проходит через (goal, goal + max(w)].
+    top = goal + int(weights.max(initial=0))
+    pieces = []
+    for i, (w, k) in enumerate(zip(weights.tolist(), counts.tolist())):
+        size = 1
+        while k > 0 and w * size <= top:
+            take = min(size, k)
+            pieces.append((i, take, w * take))
+            k -= take
+            size *= 2
+    if len(pieces) * (top + 1) > limit:
+        return None
+    reach = np.zeros(top + 1, dtype=bool)
+    reach[0] = True
+    choose = np.full(top + 1, -1, dtype=np.int32)
+    for p, (_, _, w) in enumerate(pieces):
+        new = reach[:-w] & ~reach[w:]
+        reach[w:] |= new
+        choose[w:][new] = p
+        if reach[goal]:
+            break
+    sums = np.flatnonzero(reach)
+    best = int(sums[np.argmin(np.abs(sums - goal))])
+    units = np.zeros(len(weights), dtype=np.int64)
+    while best:
+        i, take, w = pieces[choose[best]]
+        units[i] += take
+        best -= w
+    return units
+
+
+def _solve_greedy(weights: np.ndarray, counts: np.ndarray, goal: int) -> np.ndarray:
+    """Запасной путь: сначала самые калорийные единицы, затем добор мелкими."""
+    units = np.zeros(len(weights), dtype=np.int64)
+    rest = goal
+    for i in np.argsort(-weights, kind="stable").tolist():
+        w = int(weights[i])
+        if w <= 0 or rest <= 0:
+            continue
+        take = min(int(counts[i]), rest // w)
+        units[i] = take
+        rest -= take * w
+    if rest > 0:
+        # Одна лишняя единица лучше недобора, если перелёт меньше остатка.
+        free = np.flatnonzero(units < counts)
+        if len(free):
+            i = free[np.argmin(weights[free])]
+            if weights[i] - rest < rest:
+                units[i] += 1
+    return units
+
+
+def plan_meal(
+    products: Iterable[Kalor],
+    target: float,
+    bounds: Union[Bounds, Sequence[Bounds], None] = None,
+    step: float = 0.01,
+    max_cells: int = 2_000_000_000,
+) -> MealPlan:
+    """Массы продуктов с шагом step (кг), дающие сумму power() ближе всего к target.
+
+    bounds — (min, max) в кг для всех продуктов или список пар; по умолчанию
+    от 0 до массы самого продукта. Если таблица динамики больше max_cells,
+    используется жадный алгоритм.
+    """
+    products = list(products)
+    for p in products:
+        if not isinstance(p, Kalor):
+            raise TypeError("Планировать можно только объекты Kalor.")
+    if step <= 0:
+        raise ValueError("Шаг массы должен быть положительным.")
+    if target < 0:
+        raise ValueError("Цель по калориям не может быть отрицательной.")
+    low, high = _unit_bounds(products, bounds, step)
+    # В единицах step·10 ккал вклад одного шага продукта равен его first.
+    weights = np.array([p.first for p in products], dtype=np.int64)
+    goal = round(target / (step * 10)) - int(weights @ low)
+    counts = high - low
+    method = "dp"
+    if goal <= 0 or not len(products):
+        extra = np.zeros(len(products), dtype=np.int64)
+    else:
+        extra = _solve_dp(weights, counts, goal, max_cells)
+        if extra is None:
+            extra = _solve_greedy(weights, counts, goal)
+            method = "greedy"
+    masses = [u * step for u in (low + extra).tolist()]
+    return MealPlan(products, masses, target, method)
@@ -1,5 +1,14 @@
+import bisect
+import io
 import math
-from typing import Any, Iterator, Union
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, BinaryIO, Iterable, Iterator, TextIO, Union
+
+import numpy as np
+
+CsvSource = Union[str, "os.PathLike[str]", BinaryIO, TextIO]
 
 
 class Kalor:
@@ -74,6 +83,50 @@ class Kalor:
         kcal_100g = total_kcal / (total_mass * 10)
         return Kalor(int(round(kcal_100g)), total_mass)
 
+    @classmethod
+    def mix(
+        cls,
+        values: Iterable["Kalor"],
+        weights: Union[Iterable[Union[int, float]], None] = None,
+    ) -> "Kalor":
+        """Смесь за один проход: та же формула, что у +, но округление одно.
+
+        weights масштабируют массу, как умножение; подходят любые итерируемые,
+        включая генераторы — набор не сохраняется в памяти.
+        """
+        if isinstance(values, KalorBatch):
+            if weights is None:
+                return values.mix()
+            # np.asarray не разворачивает генераторы — собираем множители заранее.
+            if isinstance(weights, Iterator):
+                weights = list(weights)
+            return (values * weights).mix()
+        total_mass = 0.0
+        total_kcal = 0.0
+        if weights is None:
+            for v in values:
+                if not isinstance(v, Kalor):
+                    raise TypeError("Складывать можно только объекты Kalor.")
+                total_mass += v.second
+                total_kcal += v.first * v.second
+        else:
+            for v, w in zip(values, weights, strict=True):
+                if not isinstance(v, Kalor):
+                    raise TypeError("Складывать можно только объекты Kalor.")
+                try:
+                    w = float(w)
+                except (ValueError, TypeError):
+                    raise TypeError("Умножать можно только на число.")
+                if w <= 0:
+                    raise ValueError("Множитель должен быть положительным.")
+                mass = v.second * w
+                total_mass += mass
+                total_kcal += v.first * mass
+        if not total_mass:
+            raise ValueError("Смешивать нечего: набор пуст.")
+        # total_kcal здесь уже поделён на 10: ккал/100 г = Σ first·m / Σ m.
+        return cls(int(round(total_kcal / total_mass)), total_mass)
+
     def __sub__(self, other: "Kalor") -> "Kalor":
         if not isinstance(other, Kalor):
             raise TypeError("Вычитать можно только объекты Kalor.")
@@ -161,6 +214,690 @@ class Kalor:
         self.first = obj.first
         self.second = obj.second
 
+    @classmethod
+    def load_csv(
+        cls,
+        source: CsvSource,
+        errors: Union[list, None] = None,
+        delimiter: str = ",",
+        columns: tuple = (0, 1),
+        skip_header: bool = False,
+    ) -> Iterator["Kalor"]:
+        """Построчная загрузка файла поставщика: калорийность 100 г и масса.
+
+        Некорректные строки пропускаются, а в errors (если передан)
+        добавляются пары (номер строки с 1, причина). Память не зависит
+        от размера файла: разбор идёт блоками через KalorBatch.load_csv.
+        """
+        batches = KalorBatch.load_csv(
+            source,
+            errors,
+            delimiter=delimiter,
+            columns=columns,
+            skip_header=skip_header,
+        )
+        for batch in batches:
+            yield from batch
+
+
+class KalorBatch:
+    """Столбцы Kalor: калорийность 100 г (int32) и масса в кг (float64)."""
+
+    __slots__ = ("_first", "_second")
+
+    def __init__(self, values: Iterable[Kalor] = ()) -> None:
+        values = list(values)
+        for v in values:
+            if not isinstance(v, Kalor):
+                raise TypeError("KalorBatch строится только из объектов Kalor.")
+        batch = KalorBatch.from_columns(
+            np.fromiter((v.first for v in values), np.int64, len(values)),
+            np.fromiter((v.second for v in values), np.float64, len(values)),
+        )
+        self._first = batch._first
+        self._second = batch._second
+
+    @classmethod
+    def from_columns(cls, first: Any, second: Any) -> "KalorBatch":
+        try:
+            first_arr = np.asarray(first)
+            second_arr = np.asarray(second, dtype=np.float64)
+            if first_arr.dtype.kind not in "iu":
+                first_arr = first_arr.astype(np.float64).astype(np.int64)
+        except (ValueError, TypeError) as e:
+            raise ValueError("Параметры должны быть числами.") from e
+        if first_arr.ndim != 1 or first_arr.shape != second_arr.shape:
+            raise ValueError("Столбцы должны быть одномерными и одной длины.")
+        if not (np.all(first_arr > 0) and np.all(second_arr > 0)):
+            raise ValueError("Параметры должны быть положительными.")
+        if np.any(first_arr > np.iinfo(np.int32).max):
+            raise ValueError("Калорийность не помещается в int32.")
+        return cls._from_arrays(first_arr.astype(np.int32), second_arr.copy())
+
+    @classmethod
+    def _from_arrays(cls, first: np.ndarray, second: np.ndarray) -> "KalorBatch":
+        obj = cls.__new__(cls)
+        first.flags.writeable = False
+        second.flags.writeable = False
+        obj._first = first
+        obj._second = second
+        return obj
+
+    @classmethod
+    def load_csv(
+        cls,
+        source: CsvSource,
+        errors: Union[list, None] = None,
+        chunk_size: int = 1 << 20,
+        delimiter: str = ",",
+        columns: tuple = (0, 1),
+        skip_header: bool = False,
+        workers: int = 1,
+    ) -> Iterator["KalorBatch"]:
+        """Загрузка CSV блоками по chunk_size байт, по одному KalorBatch на блок.
+
+        Блок разбирается одним вызовом np.loadtxt и проверяется масками;
+        построчный разбор нужен только блокам с нечисловыми полями. При
+        workers > 1 (source — путь; имеет смысл для файлов от гигабайта)
+        блоки разбираются пулом процессов, и в работе не больше 2·workers
+        блоков, поэтому память ограничена. Ошибки собираются как в Kalor.load_csv.
+        """
+        if workers < 1:
+            raise ValueError("workers должен быть положительным")
+        if workers == 1:
+            blocks = _csv_blocks(source, chunk_size, skip_header)
+            parsed = (
+                _parse_csv_block(block, delimiter, columns) for block in blocks
+            )
+        elif isinstance(source, (str, os.PathLike)):
+            parsed = _parse_csv_parallel(
+                source, chunk_size, delimiter, columns, skip_header, workers
+            )
+        else:
+            raise TypeError("Для workers > 1 нужен путь к файлу.")
+        lineno = int(skip_header)
+        for first, second, bad, lines in parsed:
+            if errors is not None:
+                errors.extend((lineno + i, reason) for i, reason in bad)
+            lineno += lines
+            if len(first):
+                yield cls._from_arrays(first, second)
+
+    # Столбцы только для чтения: запись в обход from_columns пропустила бы проверку.
+    @property
+    def first(self) -> np.ndarray:
+        return self._first
+
+    @property
+    def second(self) -> np.ndarray:
+        return self._second
+
+    def __len__(self) -> int:
+        return len(self._first)
+
+    def __getitem__(self, index: Any) -> Union[Kalor, "KalorBatch"]:
+        if isinstance(index, (int, np.integer)):
+            return Kalor(int(self._first[index]), float(self._second[index]))
+        return KalorBatch._from_arrays(self._first[index], self._second[index])
+
+    def __iter__(self) -> Iterator[Kalor]:
+        for first, second in zip(self._first.tolist(), self._second.tolist()):
+            yield Kalor(first, second)
+
+    def tolist(self) -> list:
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"KalorBatch({self.tolist()!r})"
+
+    def power(self) -> np.ndarray:
+        return self._first * self._second * 10
+
+    def total(self) -> float:
+        return float(self.power().sum())
+
+    def _other(self, other: Any) -> tuple:
+        if isinstance(other, KalorBatch):
+            if len(other) != len(self):
+                raise ValueError("Длины KalorBatch не совпадают.")
+            return other._first, other._second
+        if isinstance(other, Kalor):
+            return other.first, other.second
+        return None
+
+    def __add__(self, other: Union[Kalor, "KalorBatch"]) -> "KalorBatch":
+        columns = self._other(other)
+        if columns is None:
+            raise TypeError("Складывать можно только объекты Kalor.")
+        first, second = columns
+        total_mass = self._second + second
+        total_kcal = self.power() + first * second * 10
+        kcal_100g = np.rint(total_kcal / (total_mass * 10))
+        return KalorBatch.from_columns(kcal_100g.astype(np.int64), total_mass)
+
+    def __radd__(self, other: Kalor) -> "KalorBatch":
+        return self + other
+
+    def mix(self) -> Kalor:
+        """Вся партия как одна смесь — формула __add__, применённая к итогам.
+
+        В отличие от свёртки через +, промежуточные калорийности не округляются.
+        """
+        if not len(self):
+            raise ValueError("Пустой KalorBatch нельзя смешать.")
+        total_mass = float(self._second.sum())
+        kcal_100g = self.total() / (total_mass * 10)
+        return Kalor(int(round(kcal_100g)), total_mass)
+
+    def _scalar(self, scalar: Any, error: str) -> Any:
+        if isinstance(scalar, (str, bytes)):
+            raise TypeError(error)
+        try:
+            factor = np.asarray(scalar, dtype=np.float64)
+        except (ValueError, TypeError):
+            raise TypeError(error)
+        if factor.ndim > 1 or (factor.ndim == 1 and len(factor) != len(self)):
+            raise ValueError("Длина множителей не совпадает с KalorBatch.")
+        return factor
+
+    def __mul__(self, scalar: Any) -> "KalorBatch":
+        factor = self._scalar(scalar, "Умножать можно только на число.")
+        if not np.all(factor > 0):
+            raise ValueError("Множитель должен быть положительным.")
+        return KalorBatch._from_arrays(self._first, self._second * factor)
+
+    def __rmul__(self, scalar: Any) -> "KalorBatch":
+        return self.__mul__(scalar)
+
+    def __truediv__(self, scalar: Any) -> "KalorBatch":
+        factor = self._scalar(scalar, "Делить можно только на число.")
+        if not np.all(factor > 0):
+            raise ValueError("Делитель должен быть положительным.")
+        return KalorBatch._from_arrays(self._first, self._second / factor)
+
+    # Сравнения поэлементные, как у Kalor: ==/!= по полям, порядок — по ккал.
+    def _compare_power(self, other: Any) -> Any:
+        if isinstance(other, KalorBatch):
+            if len(other) != len(self):
+                raise ValueError("Длины KalorBatch не совпадают.")
+            return other.power()
+        if isinstance(other, Kalor):
+            return other.power()
+        return None
+
+    def __eq__(self, other: Any) -> Any:
+        columns = self._other(other)
+        if columns is None:
+            return np.zeros(len(self), dtype=bool)
+        first, second = columns
+        close = np.abs(self._second - second) <= 1e-9 * np.maximum(
+            np.abs(self._second), np.abs(second)
+        )
+        return (self._first == first) & close
+
+    def __ne__(self, other: Any) -> Any:
+        return ~self.__eq__(other)
+
+    def __lt__(self, other: Any) -> Any:
+        power = self._compare_power(other)
+        return NotImplemented if power is None else self.power() < power
+
+    def __le__(self, other: Any) -> Any:
+        power = self._compare_power(other)
+        return NotImplemented if power is None else self.power() <= power
+
+    def __gt__(self, other: Any) -> Any:
+        power = self._compare_power(other)
+        return NotImplemented if power is None else self.power() > power
+
+    def __ge__(self, other: Any) -> Any:
+        power = self._compare_power(other)
+        return NotImplemented if power is None else self.power() >= power
+
+    def argsort(self) -> np.ndarray:
+        return np.argsort(self.power(), kind="stable")
+
+    def sorted(self) -> "KalorBatch":
+        return self[self.argsort()]
+
+
+class KalorIndex:
+    """Продукты, упорядоченные по общей калорийности, с кешем ключей.
+
+    power() и first считаются один раз при вставке и хранятся в плоских
+    массивах, поэтому запросы не вызывают методы Kalor. Изменять продукт
+    на месте (+=, set_values) можно только после remove: иначе ключ устареет.
+    """
+
+    __slots__ = ("_totals", "_densities", "_items")
+
+    def __init__(self, values: Iterable[Kalor] = ()) -> None:
+        if isinstance(values, KalorBatch):
+            order = values.argsort()
+            self._totals = array("d", values.power()[order].tobytes())
+            densities = values.first[order].astype(np.int64)
+            self._densities = array("q", densities.tobytes())
+            self._items = values[order].tolist()
+            return
+        items = list(values)
+        for v in items:
+            if not isinstance(v, Kalor):
+                raise TypeError("KalorIndex строится только из объектов Kalor.")
+        totals = [v.power() for v in items]
+        order = sorted(range(len(items)), key=totals.__getitem__)
+        self._totals = array("d", [totals[i] for i in order])
+        self._densities = array("q", [items[i].first for i in order])
+        self._items = [items[i] for i in order]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Kalor]:
+        return iter(self._items)
+
+    def __contains__(self, item: Any) -> bool:
+        return isinstance(item, Kalor) and self._find(item) >= 0
+
+    def _find(self, item: Kalor) -> int:
+        total = item.power()
+        lo = bisect.bisect_left(self._totals, total)
+        hi = bisect.bisect_right(self._totals, total, lo)
+        for i in range(lo, hi):
+            if self._items[i] is item:
+                return i
+        for i in range(lo, hi):
+            if self._items[i] == item:
+                return i
+        return -1
+
+    def add(self, item: Kalor) -> None:
+        if not isinstance(item, Kalor):
+            raise TypeError("В KalorIndex можно добавлять только объекты Kalor.")
+        total = item.power()
+        i = bisect.bisect_right(self._totals, total)
+        self._totals.insert(i, total)
+        self._densities.insert(i, item.first)
+        self._items.insert(i, item)
+
+    def remove(self, item: Kalor) -> None:
+        i = self._find(item) if isinstance(item, Kalor) else -1
+        if i < 0:
+            raise ValueError("Продукт не найден в индексе.")
+        del self._totals[i]
+        del self._densities[i]
+        del self._items[i]
+
+    def top_k(self, k: int, by: str = "total") -> list:
+        """k продуктов с наибольшими ккал (by="total") или ккал/100 г ("density")."""
+        if k <= 0:
+            return []
+        if by == "total":
+            return self._items[: -k - 1 : -1]
+        if by == "density":
+            if k >= len(self._items):
+                best = sorted(
+                    range(len(self._items)),
+                    key=self._densities.__getitem__,
+                    reverse=True,
+                )
+                return [self._items[i] for i in best]
+            # Вид на буфер массива без копии; argpartition — O(n) вместо кучи.
+            densities = np.frombuffer(self._densities, dtype=np.int64)
+            part = np.argpartition(-densities, k - 1)[:k]
+            best = part[np.lexsort((part, -densities[part]))].tolist()
+            del densities
+            return [self._items[i] for i in best]
+        raise ValueError("by должен быть 'total' или 'density'.")
+
+    def between(self, low: float, high: float) -> list:
+        """Продукты с общей калорийностью в отрезке [low, high], по возрастанию."""
+        lo = bisect.bisect_left(self._totals, low)
+        hi = bisect.bisect_right(self._totals, high, lo)
+        return self._items[lo:hi]
+
+    def count_between(self, low: float, high: float) -> int:
+        lo = bisect.bisect_left(self._totals, low)
+        return bisect.bisect_right(self._totals, high, lo) - lo
+
+
+class NutrientKalor:
+    """Kalor с вектором на 100 г: ккал, белки, жиры, углеводы (г); масса в кг.
+
+    Хранится содержимое всей массы (ккал и граммы) одним массивом float64:
+    тогда смесь — сумма векторов, а масштаб — умножение вектора на число,
+    по одной векторной операции, и ничего не округляется. power(), * и /
+    дают то же, что у Kalor. Смесь через + точнее, чем у Kalor: Kalor
+    округляет ккал на 100 г, поэтому power() может разойтись — с + у Kalor
+    совпадает только (a + b).to_kalor().
+    """
+
+    FIELDS = ("kcal", "protein", "fat", "carbs")
+    WIDTH = len(FIELDS)
+
+    __slots__ = ("_totals", "_second")
+
+    def __init__(self, per100: Iterable[float], second: float) -> None:
+        try:
+            vector = np.array(per100, dtype=np.float64)
+            second_float = float(second)
+        except (ValueError, TypeError) as e:
+            raise ValueError("Параметры должны быть числами.") from e
+        if vector.shape != (self.WIDTH,):
+            raise ValueError(f"Ожидается {self.WIDTH} значения на 100 г: {self.FIELDS}")
+        if not (np.isfinite(vector).all() and math.isfinite(second_float)):
+            raise ValueError("Параметры должны быть числами.")
+        if vector[0] <= 0 or second_float <= 0:
+            raise ValueError("Параметры должны быть положительными.")
+        if (vector < 0).any():
+            raise ValueError("Содержание нутриентов не может быть отрицательным.")
+        vector *= second_float * 10
+        vector.flags.writeable = False
+        self._totals = vector
+        self._second = second_float
+
+    @classmethod
+    def _new(cls, totals: np.ndarray, second: float) -> "NutrientKalor":
+        obj = cls.__new__(cls)
+        totals.flags.writeable = False
+        obj._totals = totals
+        obj._second = second
+        return obj
+
+    @classmethod
+    def from_kalor(
+        cls, kalor: Kalor, protein: float = 0.0, fat: float = 0.0, carbs: float = 0.0
+    ) -> "NutrientKalor":
+        return cls((kalor.first, protein, fat, carbs), kalor.second)
+
+    def to_kalor(self) -> Kalor:
+        return Kalor(int(round(self.first)), self.second)
+
+    @property
+    def second(self) -> float:
+        return self._second
+
+    @property
+    def per100(self) -> np.ndarray:
+        vector = self._totals / (self._second * 10)
+        vector.flags.writeable = False
+        return vector
+
+    @property
+    def first(self) -> float:
+        return float(self._totals[0]) / (self._second * 10)
+
+    def __str__(self) -> str:
+        values = self.per100.tolist()
+        parts = ", ".join(f"{name} {v:g}" for name, v in zip(self.FIELDS, values))
+        return f"На 100 г: {parts}; масса: {self.second} кг"
+
+    def __repr__(self) -> str:
+        return f"NutrientKalor({self.per100.tolist()}, {self._second})"
+
+    def power(self) -> float:
+        return float(self._totals[0])
+
+    def totals(self) -> np.ndarray:
+        """Содержимое всей массы: ккал и граммы белков, жиров, углеводов."""
+        return self._totals
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, NutrientKalor):
+            return False
+        if not math.isclose(self._second, other._second):
+            return False
+        return bool(np.allclose(self.per100, other.per100, rtol=1e-9, atol=0.0))
+
+    def __ne__(self, other: Any) -> bool:
+        return not self.__eq__(other)
+
+    def __lt__(self, other: Any) -> bool:
+        if not isinstance(other, NutrientKalor):
+            return NotImplemented
+        return self.power() < other.power()
+
+    def __le__(self, other: Any) -> bool:
+        if not isinstance(other, NutrientKalor):
+            return NotImplemented
+        return self.power() <= other.power()
+
+    def __gt__(self, other: Any) -> bool:
+        if not isinstance(other, NutrientKalor):
+            return NotImplemented
+        return self.power() > other.power()
+
+    def __ge__(self, other: Any) -> bool:
+        if not isinstance(other, NutrientKalor):
+            return NotImplemented
+        return self.power() >= other.power()
+
+    __hash__ = None
+
+    def __add__(self, other: "NutrientKalor") -> "NutrientKalor":
+        if not isinstance(other, NutrientKalor):
+            raise TypeError("Складывать можно только объекты NutrientKalor.")
+        return NutrientKalor._new(
+            self._totals + other._totals, self._second + other._second
+        )
+
+    @classmethod
+    def mix(
+        cls,
+        values: Iterable["NutrientKalor"],
+        weights: Union[Iterable[Union[int, float]], None] = None,
+    ) -> "NutrientKalor":
+        """Смесь набора: сумма векторов одним вызовом, weights масштабируют массы."""
+        values = list(values)
+        for v in values:
+            if not isinstance(v, NutrientKalor):
+                raise TypeError("Складывать можно только объекты NutrientKalor.")
+        if not values:
+            raise ValueError("Смешивать нечего: набор пуст.")
+        totals = np.array([v._totals for v in values])
+        masses = [v._second for v in values]
+        if weights is None:
+            return cls._new(totals.sum(axis=0), math.fsum(masses))
+        factor = np.asarray(list(weights), dtype=np.float64)
+        if factor.shape != (len(values),):
+            raise ValueError("Длина весов не совпадает с набором.")
+        if not np.all(factor > 0):
+            raise ValueError("Множитель должен быть положительным.")
+        return cls._new(factor @ totals, float(factor @ masses))
+
+    @classmethod
+    def aggregate(
+        cls, per100: Any, second: Any, meals: Any, count: Union[int, None] = None
+    ) -> tuple:
+        """Смеси для многих приёмов пищи сразу, без объектов.
+
+        per100 — матрица n×WIDTH, second — массы, meals — номер приёма пищи
+        для каждой строки. Возвращает (векторы на 100 г, массы) по приёмам;
+        приём без продуктов получает нулевую массу и вектор из nan.
+        """
+        per100 = np.asarray(per100, dtype=np.float64)
+        second = np.asarray(second, dtype=np.float64)
+        meals = np.asarray(meals, dtype=np.intp)
+        if per100.ndim != 2 or per100.shape[1] != cls.WIDTH:
+            raise ValueError(f"Ожидается матрица n×{cls.WIDTH}.")
+        if not (len(per100) == len(second) == len(meals)):
+            raise ValueError("Длины столбцов не совпадают.")
+        if count is None:
+            count = int(meals.max(initial=-1)) + 1
+        elif len(meals) and (meals.min() < 0 or meals.max() >= count):
+            raise ValueError("Номера приёмов пищи вне диапазона.")
+        masses = np.bincount(meals, weights=second, minlength=count)
+        weighted = per100 * second[:, None]
+        sums = np.stack(
+            [np.bincount(meals, weights=col, minlength=count) for col in weighted.T],
+            axis=1,
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return sums / masses[:, None], masses
+
+    def __mul__(self, scalar: Union[int, float]) -> "NutrientKalor":
+        try:
+            scalar_float = float(scalar)
+        except (ValueError, TypeError):
+            raise TypeError("Умножать можно только на число.")
+        if scalar_float <= 0:
+            raise ValueError("Множитель должен быть положительным.")
+        totals = self._totals * scalar_float
+        return NutrientKalor._new(totals, self._second * scalar_float)
+
+    def __rmul__(self, scalar: Union[int, float]) -> "NutrientKalor":
+        return self.__mul__(scalar)
+
+    def __truediv__(self, scalar: Union[int, float]) -> "NutrientKalor":
+        try:
+            scalar_float = float(scalar)
+        except (ValueError, TypeError):
+            raise TypeError("Делить можно только на число.")
+        if scalar_float <= 0:
+            raise ValueError("Делитель должен быть положительным.")
+        totals = self._totals / scalar_float
+        return NutrientKalor._new(totals, self._second / scalar_float)
+
+
+def _csv_blocks(source: CsvSource, chunk_size: int, skip_header: bool) -> Iterator:
+    """Блоки целых строк файла или потока; как у Fraction.parse_stream."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            yield from _csv_blocks(f, chunk_size, skip_header)
+        return
+    if skip_header:
+        source.readline()
+    tail = b""
+    while True:
+        chunk = source.read(chunk_size)
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        data = tail + chunk
+        if chunk:
+            cut = data.rfind(b"\n")
+            if cut < 0:
+                tail = data
+                continue
+            block, tail = data[: cut + 1], data[cut + 1:]
+        elif data:
+            block, tail = data, b""
+        else:
+            break
+        yield block
+
+
+def _parse_csv_rows(block: bytes, delimiter: str, columns: tuple) -> tuple:
+    """Медленный путь: построчный разбор блока с причинами ошибок."""
+    sep = delimiter.encode()
+    first, second, rows, bad = [], [], [], []
+    for i, line in enumerate(block.splitlines(), 1):
+        if not line.strip():
+            continue
+        fields = line.split(sep)
+        try:
+            values = [float(fields[c]) for c in columns]
+        except IndexError:
+            bad.append((i, "Ожидалось не меньше двух полей."))
+            continue
+        except ValueError:
+            bad.append((i, "Параметры должны быть числами."))
+            continue
+        first.append(values[0])
+        second.append(values[1])
+        rows.append(i)
+    return (
+        np.array(first, dtype=np.float64),
+        np.array(second, dtype=np.float64),
+        np.array(rows, dtype=np.int64),
+        bad,
+    )
+
+
+def _parse_csv_block(block: bytes, delimiter: str, columns: tuple) -> tuple:
+    """Разбор блока в столбцы Kalor; возвращает (first, second, ошибки, строк)."""
+    lines = block.count(b"\n") + (bool(block) and not block.endswith(b"\n"))
+    rows = None
+    if not block.strip():
+        empty = np.empty(0, dtype=np.float64)
+        return empty.astype(np.int32), empty, [], lines
+    try:
+        table = np.loadtxt(
+            io.BytesIO(block),
+            delimiter=delimiter,
+            usecols=columns,
+            dtype=np.float64,
+            comments=None,
+            ndmin=2,
+        )
+        first, second = table[:, 0], table[:, 1]
+        bad = []
+    except ValueError:
+        first, second, rows, bad = _parse_csv_rows(block, delimiter, columns)
+    # Та же проверка, что в Kalor.__init__, но сразу для всего блока.
+    finite = np.isfinite(first) & np.isfinite(second)
+    positive = (first > 0) & (second > 0)
+    whole = (first == np.floor(first)) & (first <= np.iinfo(np.int32).max)
+    ok = finite & positive & whole
+    if not ok.all():
+        if rows is None:
+            # np.loadtxt пропускает пустые строки: номера восстанавливаются заново.
+            rows = np.array(
+                [i for i, line in enumerate(block.splitlines(), 1) if line.strip()]
+            )
+        for i in np.flatnonzero(~ok).tolist():
+            if not finite[i]:
+                reason = "Параметры должны быть числами."
+            elif not positive[i]:
+                reason = "Параметры должны быть положительными."
+            else:
+                reason = "Калорийность должна быть целым числом в пределах int32."
+            bad.append((int(rows[i]), reason))
+        bad.sort()
+        first, second = first[ok], second[ok]
+    return first.astype(np.int32), second, bad, lines
+
+
+def _parse_csv_range(
+    path: str, start: int, end: int, delimiter: str, columns: tuple
+) -> tuple:
+    """Строки, начинающиеся в [start, end): граница делит файл без перекрытий."""
+    with open(path, "rb") as f:
+        if start:
+            f.seek(start - 1)
+            f.readline()
+        pos = f.tell()
+        block = f.read(max(end - pos, 0)) if pos < end else b""
+        if block and not block.endswith(b"\n"):
+            block += f.readline()
+    return _parse_csv_block(block, delimiter, columns)
+
+
+def _parse_csv_parallel(
+    path: CsvSource,
+    chunk_size: int,
+    delimiter: str,
+    columns: tuple,
+    skip_header: bool,
+    workers: int,
+) -> Iterator[tuple]:
+    path = os.fspath(path)
+    size = os.path.getsize(path)
+    start = 0
+    if skip_header:
+        with open(path, "rb") as f:
+            f.readline()
+            start = f.tell()
+    bounds = [(s, min(s + chunk_size, size)) for s in range(start, size, chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = []
+        for lo, hi in bounds:
+            if len(pending) >= 2 * workers:
+                yield pending.pop(0).result()
+            pending.append(
+                executor.submit(_parse_csv_range, path, lo, hi, delimiter, columns)
+            )
+        for future in pending:
+            yield future.result()
+
 
 def make_Point(first: int, second: float) -> Kalor:
     try:
@@ -1,8 +1,304 @@
-from decimal import Decimal, getcontext
+import mmap
+import operator
+import re
+import shutil
+import struct
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import (
+    MAX_EMAX,
+    MAX_PREC,
+    MIN_EMIN,
+    ROUND_05UP,
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP,
+    Context,
+    Decimal,
+)
+from math import isqrt
+from typing import BinaryIO, Iterable, Iterator, TextIO
+
+import numpy as np
+
+# Предел количества цифр, установленный через Fraction.local_max_size().
+_max_size: ContextVar[int | None] = ContextVar("fraction_max_size", default=None)
+
+# Кэш Fraction.intern(): каноническая строка -> замороженный экземпляр (LRU).
+_interned: OrderedDict[str, "Fraction"] = OrderedDict()
+_intern_lock = threading.Lock()
+
+# Цифры хранятся в одном bytearray по одной в байте: сначала целая часть
+# от младшей цифры к старшей, затем дробная часть — в порядке индексации Fraction.
+_TO_ASCII = bytes.maketrans(bytes(range(10)), b"0123456789")
+_FROM_ASCII = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+# Строка для Fraction.parse_stream: пробелы, "+", цифры, точка, цифры (не пустая).
+_LINE = rb"[ \t\r\f\v]*(?=[+.0-9])\+?([0-9]*)(?:\.([0-9]*))?[ \t\r\f\v]*"
+_LINE_RE = re.compile(_LINE)
+_LINES_RE = re.compile(rb"^" + _LINE + rb"$", re.MULTILINE)
+
+# Поддерживаемое подмножество format(): заполнение и выравнивание, знак, "0",
+# ширина, разделитель групп, точность и тип "f", "F", "%" или пустой.
+_FORMAT_SPEC = re.compile(
+    r"(?:(?P<fill>.)?(?P<align>[<>=^]))?(?P<sign>[-+ ])?(?P<zero>0)?"
+    r"(?P<width>\d+)?(?P<grouping>[,_])?(?:\.(?P<precision>\d+))?(?P<type>[fF%]?)\Z",
+    re.DOTALL,
+)
+
+
+# Двоичная запись Fraction: байт длины заголовка, заголовок из трёх чисел
+# LEB128 (цифр целой части, дробной части, size) и упакованные цифры — по две
+# в байте (BCD), в порядке _digits; нечётное число цифр дополняется нулём.
+def _put_varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append(n & 0x7F | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _get_varint(buf, pos: int) -> tuple[int, int]:
+    n = shift = 0
+    while True:
+        try:
+            b = buf[pos]
+        except IndexError:
+            raise ValueError("Запись Fraction обрезана") from None
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _parse_digits(s: str) -> bytearray:
+    if s.isascii():
+        return bytearray(s, "ascii").translate(_FROM_ASCII)
+    return bytearray(map(int, s))
+
+
+# Арифметика и корень считаются на целых Python: значение Fraction —
+# это целое из его цифр, делённое на 10 ** scale; произведения от
+# Fraction.DECIMAL_MUL_THRESHOLD цифр идут через Decimal. Перевод между
+# цифрами и int делится пополам до кусков по _STR_CHUNK цифр: int(str)
+# и str(int) на них быстрые и не упираются в sys.get_int_max_str_digits()
+# (не меньше 640).
+_STR_CHUNK = 512
+_POW10: dict[int, int] = {}
+
+
+def _pow10(n: int) -> int:
+    p = _POW10.get(n)
+    if p is None:
+        p = _POW10[n] = 10 ** n
+    return p
+
+
+def _ascii_to_int(s: bytes) -> int:
+    if len(s) <= _STR_CHUNK:
+        return int(s) if s else 0
+    m = len(s) // 2
+    return _ascii_to_int(s[:-m]) * _pow10(m) + _ascii_to_int(s[-m:])
+
+
+def _int_to_ascii(x: int, width: int = 0) -> bytes:
+    """Десятичная запись x, дополненная нулями слева до width цифр."""
+    if x.bit_length() <= _STR_CHUNK * 3:
+        return str(x).encode().rjust(width, b"0")
+    m = (x.bit_length() * 1233 >> 12) // 2
+    hi, lo = divmod(x, _pow10(m))
+    return _int_to_ascii(hi, width - m) + _int_to_ascii(lo, m)
+
+
+# Деление и большие произведения идут на Decimal: libmpdec хранит цифры
+# десятичными, поэтому перевод из буфера Fraction и обратно линейный,
+# а у int он квадратичный.
+# Все операции — методами точного контекста _EXACT, текущий контекст не меняется.
+_EXACT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN, rounding=ROUND_FLOOR)
+_ONE = Decimal(1)
+
+
+def _shift_floor(x: Decimal, k: int) -> Decimal:
+    """x // 10 ** k для целого x >= 0."""
+    return _EXACT.to_integral_value(_EXACT.scaleb(x, -k))
+
+
+def _reciprocal(d: Decimal, p: int) -> Decimal:
+    """Приближение 10 ** (m + p) // d, m — число цифр d; ошибка — единицы.
+
+    Шаг Ньютона x += x * (10 ** (m + p) - d * x) / 10 ** (m + p) удваивает
+    число верных цифр, поэтому начальное приближение берётся с половинной
+    точностью, а от d нужны только p + 2 старшие цифры.
+    """
+    m = d.adjusted() + 1
+    if p <= 40:
+        return _EXACT.divide_int(_EXACT.scaleb(_ONE, m + p), d)
+    extra = m - p - 2
+    if extra > 0:
+        return _reciprocal(_shift_floor(d, extra), p)
+    h = p // 2 + 1
+    x = _EXACT.scaleb(_reciprocal(d, h), p - h)
+    e = _EXACT.subtract(_EXACT.scaleb(_ONE, m + p), _EXACT.multiply(d, x))
+    return _EXACT.add(x, _shift_floor(_EXACT.multiply(x, e), m + p))
+
+
+def _divmod_newton(n: Decimal, d: Decimal) -> tuple[Decimal, Decimal]:
+    """divmod(n, d) целых через приближение 1 / d; поправка — пара шагов."""
+    if n < d:
+        return Decimal(0), n
+    m = d.adjusted() + 1
+    p = n.adjusted() - m + 3
+    q = _shift_floor(_EXACT.multiply(n, _reciprocal(d, p)), m + p)
+    r = _EXACT.subtract(n, _EXACT.multiply(q, d))
+    while r < 0:
+        q = _EXACT.subtract(q, _ONE)
+        r = _EXACT.add(r, d)
+    while r >= d:
+        q = _EXACT.add(q, _ONE)
+        r = _EXACT.subtract(r, d)
+    return q, r
+
+
+# Контексты деления и большого умножения по (число значащих цифр, режим).
+_CONTEXTS: dict[tuple[int, str], Context] = {}
+
+
+def _rounding_context(prec: int, rounding: str) -> Context:
+    ctx = _CONTEXTS.get((prec, rounding))
+    if ctx is None:
+        try:
+            ctx = Context(prec=prec, rounding=rounding, Emax=MAX_EMAX, Emin=MIN_EMIN)
+        except TypeError:
+            raise ValueError(f"Неизвестный режим округления: {rounding!r}") from None
+        if len(_CONTEXTS) < 256:
+            _CONTEXTS[prec, rounding] = ctx
+    return ctx
+
+
+def _ascii_increment(s: bytes) -> bytes:
+    """Десятичная запись s плюс один: b"199" -> b"200", b"99" -> b"100"."""
+    head = s.rstrip(b"9")
+    tail = b"0" * (len(s) - len(head))
+    return head[:-1] + bytes((head[-1] + 1,)) + tail if head else b"1" + tail
+
+
+def _rounds_up(last: int, half: int, inexact: bool, rounding: str) -> bool:
+    """Прибавлять ли единицу к оставленной части по режиму rounding из decimal.
+
+    last — последняя оставленная цифра; half — знак сравнения отброшенной
+    части с половиной единицы (-1, 0, 1); inexact — отброшен не ноль.
+    """
+    if rounding == ROUND_HALF_EVEN:
+        return half > 0 or (half == 0 and last % 2 == 1)
+    if rounding == ROUND_HALF_UP:
+        return half >= 0
+    if rounding == ROUND_HALF_DOWN:
+        return half > 0
+    if rounding in (ROUND_DOWN, ROUND_FLOOR):
+        return False
+    if rounding in (ROUND_UP, ROUND_CEILING):
+        return inexact
+    if rounding == ROUND_05UP:
+        return inexact and last % 5 == 0
+    raise ValueError(f"Неизвестный режим округления: {rounding!r}")
+
+
+def _round_int(q: int, drop: int, sticky: bool, rounding: str) -> int:
+    """Отбросить drop младших цифр q; sticky — правее q есть ненулевые цифры."""
+    p = _pow10(drop)
+    q, rest = divmod(q, p)
+    half = p >> 1
+    cmp = 1 if rest > half or (rest == half and sticky) else -(rest < half)
+    return q + _rounds_up(q % 10, cmp, bool(rest or sticky), rounding)
+
+
+def _round_digits(int_s: str, frac_s: str, ndigits: int, rounding: str) -> tuple:
+    """Округлить запись без хвостовых нулей до ndigits знаков после точки.
+
+    Раз frac_s не кончается нулём, отброшенная часть ненулевая и её сравнение
+    с половиной решает первая отброшенная цифра.
+    """
+    if len(frac_s) <= ndigits:
+        return int_s, frac_s + "0" * (ndigits - len(frac_s))
+    digits = int_s + frac_s[:ndigits]
+    dropped = frac_s[ndigits]
+    half = 1 if dropped > "5" else -1 if dropped < "5" else len(frac_s) > ndigits + 1
+    if _rounds_up(ord(digits[-1]) - 48, half, True, rounding):
+        head = digits.rstrip("9")
+        nines = len(digits) - len(head)
+        head = head[:-1] + chr(ord(head[-1]) + 1) if head else "1"
+        digits = head + "0" * nines
+    point = len(digits) - ndigits
+    return digits[:point].lstrip("0") or "0", digits[point:]
+
+
+_FORMAT_CACHE: dict[str, tuple] = {}
+
+
+def _parse_format(spec: str) -> tuple:
+    m = _FORMAT_SPEC.match(spec)
+    if m is None:
+        raise ValueError(f"Неподдерживаемый формат для Fraction: {spec!r}")
+    fill, align = m["fill"] or " ", m["align"] or ">"
+    width = int(m["width"] or 0)
+    zero_width = 0
+    if m["zero"] and not m["align"]:
+        fill, align, zero_width = "0", "=", width
+    precision = None if m["precision"] is None else int(m["precision"])
+    parsed = (
+        fill,
+        align,
+        m["sign"] if m["sign"] in ("+", " ") else "",
+        zero_width,
+        width,
+        m["grouping"],
+        precision,
+        2 if m["type"] == "%" else 0,
+    )
+    if len(_FORMAT_CACHE) < 256:
+        _FORMAT_CACHE[spec] = parsed
+    return parsed
+
+
+def _group_digits(s: str, sep: str) -> str:
+    head = len(s) % 3 or 3
+    return sep.join([s[:head]] + [s[i:i + 3] for i in range(head, len(s), 3)])
 
 
 class Fraction:
+    # _str, _dec, _key — кэш канонической формы; сбрасывается при изменении цифр.
+    # _frozen — экземпляр из Fraction.intern(), изменять его нельзя.
+    __slots__ = ("_digits", "_int_len", "_size", "_str", "_dec", "_key", "_frozen")
+
     MAX_SIZE = 100
+    # Порог (в цифрах делителя), с которого деление идёт через обратное число
+    # по Ньютону, а не делением libmpdec. bench_fraction.py divide находит
+    # переход у 20000-50000 цифр, а выше него выигрыш — около 10%: libmpdec
+    # на больших делителях сам делит по Ньютону. Калибровка при импорте
+    # стоила бы дороже этого выигрыша, поэтому порог постоянный и взят
+    # по верхней границе перехода.
+    NEWTON_THRESHOLD = 50000
+    # Порог (в цифрах большего множителя), с которого умножение идёт через
+    # Decimal, а не int: перевод в int и обратно квадратичный и на больших
+    # числах дороже самого произведения. Калибруется bench_fraction.py multiply.
+    DECIMAL_MUL_THRESHOLD = 400
+    # Наибольшее число значений в кэше Fraction.intern().
+    INTERN_SIZE = 4096
+
+    _cache_hits = 0
+    _cache_misses = 0
+    _intern_hits = 0
+    _intern_misses = 0
 
     def __init__(self, value: str, size: int | None = None):
         s = value.strip()
@@ -28,13 +324,8 @@ class Fraction:
         int_str = int_str.lstrip("0") or "0"
         frac_str = frac_str.rstrip("0")
 
-        int_digits = [int(ch) for ch in reversed(int_str)]
-        frac_digits = [int(ch) for ch in frac_str] if frac_str else []
-
-        count = len(int_digits) + len(frac_digits)
-        if count == 0:
-            int_digits = [0]
-            count = 1
+        digits = _parse_digits(int_str[::-1] + frac_str)
+        count = len(digits)
 
         if size is None:
             size_val = count
@@ -45,22 +336,404 @@ class Fraction:
             if count > size_val:
                 raise ValueError("Количество цифр превышает size")
 
-        if count > Fraction.MAX_SIZE:
+        if count > Fraction.max_size():
             raise ValueError("Превышен максимальный размер Fraction")
 
-        self.int_part = int_digits
-        self.frac_part = frac_digits
+        self._digits = digits
+        self._int_len = len(int_str)
         self._size = size_val
-        self.count = count
+        # Каноническая строка строится лениво в _canonical(): хранить её
+        # с каждого экземпляра — десятки байт на значение.
+        self._str = None
+        self._dec = None
+        self._key = None
+        self._frozen = False
+
+    # Только для чтения: запись в обход __setitem__ не сбросила бы кэш.
+    @property
+    def int_part(self) -> memoryview:
+        return memoryview(self._digits).toreadonly()[:self._int_len]
+
+    @property
+    def frac_part(self) -> memoryview:
+        return memoryview(self._digits).toreadonly()[self._int_len:]
+
+    @property
+    def digits(self) -> memoryview:
+        """Все цифры в порядке индексации без копирования (только чтение)."""
+        return memoryview(self._digits).toreadonly()
+
+    # Протокол буфера для классов на Python появился в 3.12: memoryview(f),
+    # bytes(f), np.frombuffer(f). На 3.11 используйте f.digits.
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.digits
+
+    @property
+    def count(self) -> int:
+        return len(self._digits)
+
+    @classmethod
+    def max_size(cls) -> int:
+        limit = _max_size.get()
+        return cls.MAX_SIZE if limit is None else limit
+
+    @staticmethod
+    @contextmanager
+    def local_max_size(max_size: int) -> Iterator[None]:
+        """Временно изменить MAX_SIZE для текущего потока или задачи asyncio."""
+        max_size = int(max_size)
+        if max_size <= 0:
+            raise ValueError("MAX_SIZE должен быть положительным")
+        token = _max_size.set(max_size)
+        try:
+            yield
+        finally:
+            _max_size.reset(token)
 
     def _to_string(self) -> str:
-        int_str = "".join(str(d) for d in reversed(self.int_part)).lstrip("0") or "0"
-        if self.frac_part:
-            frac_str = "".join(str(d) for d in self.frac_part).rstrip("0")
+        d = self._digits
+        n = self._int_len
+        int_str = d[n - 1::-1].translate(_TO_ASCII).decode().lstrip("0") or "0"
+        if len(d) > n:
+            frac_str = d[n:].translate(_TO_ASCII).decode().rstrip("0")
             if frac_str:
                 return int_str + "." + frac_str
         return int_str
 
+    def _canonical(self) -> str:
+        s = self._str
+        if s is None:
+            Fraction._cache_misses += 1
+            s = self._str = self._to_string()
+        else:
+            Fraction._cache_hits += 1
+        return s
+
+    def _int_width(self) -> int:
+        # Число значащих цифр целой части (0 для чисел меньше единицы).
+        d = self._digits
+        n = self._int_len
+        while n and not d[n - 1]:
+            n -= 1
+        return n
+
+    def sort_key(self) -> tuple[int, bytes]:
+        """Компактный ключ для sorted(): (длина целой части, цифры без нулей по краям).
+
+        Цифры записаны от старшей к младшей; при равной длине целой части
+        bytes упорядочены лексикографически так же, как числа.
+        """
+        key = self._key
+        if key is None:
+            Fraction._cache_misses += 1
+            d = self._digits
+            n = self._int_width()
+            body = d[n - 1::-1] + d[self._int_len:] if n else d[self._int_len:]
+            key = self._key = (n, bytes(body.rstrip(b"\0")))
+        else:
+            Fraction._cache_hits += 1
+        return key
+
+    def _compare(self, other: "Fraction") -> int:
+        a, b = self._key, other._key
+        if a is None or b is None:
+            n, m = self._int_width(), other._int_width()
+            if n != m:
+                return -1 if n < m else 1
+            a, b = self.sort_key(), other.sort_key()
+        else:
+            Fraction._cache_hits += 2
+        return (a > b) - (a < b)
+
+    def _invalidate(self) -> None:
+        self._str = None
+        self._dec = None
+        self._key = None
+
+    @classmethod
+    def cache_info(cls) -> dict:
+        return {"hits": Fraction._cache_hits, "misses": Fraction._cache_misses}
+
+    @classmethod
+    def reset_cache_info(cls) -> None:
+        Fraction._cache_hits = 0
+        Fraction._cache_misses = 0
+
+    @classmethod
+    def intern(cls, value: "str | Fraction") -> "Fraction":
+        """Общий неизменяемый экземпляр для значения value.
+
+        Равные значения ("1.50" и "1.5") дают один и тот же объект. Кэш
+        ограничен INTERN_SIZE и вытесняет давно не запрошенные значения.
+        """
+        if isinstance(value, str):
+            with _intern_lock:
+                obj = _interned.get(value)
+                if obj is not None:
+                    _interned.move_to_end(value)
+                    Fraction._intern_hits += 1
+                    return obj
+            obj = cls(value)
+        elif isinstance(value, Fraction):
+            obj = cls._from_digits(bytearray(value._digits), value._int_len)
+            obj._size = value._size
+        else:
+            raise TypeError("Ожидается строка или Fraction")
+        key = obj._canonical()
+        with _intern_lock:
+            shared = _interned.get(key)
+            if shared is not None:
+                _interned.move_to_end(key)
+                Fraction._intern_hits += 1
+                return shared
+            Fraction._intern_misses += 1
+            obj._frozen = True
+            _interned[key] = obj
+            while len(_interned) > max(cls.INTERN_SIZE, 0):
+                _interned.popitem(last=False)
+        return obj
+
+    @classmethod
+    def intern_info(cls) -> dict:
+        hits, misses = Fraction._intern_hits, Fraction._intern_misses
+        return {
+            "size": len(_interned),
+            "maxsize": cls.INTERN_SIZE,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+        }
+
+    @classmethod
+    def clear_intern(cls) -> None:
+        with _intern_lock:
+            _interned.clear()
+            Fraction._intern_hits = 0
+            Fraction._intern_misses = 0
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    @classmethod
+    def _from_digits(cls, digits: bytearray, int_len: int) -> "Fraction":
+        if len(digits) > cls.max_size():
+            raise ValueError("Превышен максимальный размер Fraction")
+        obj = cls.__new__(cls)
+        obj._digits = digits
+        obj._int_len = int_len
+        obj._size = len(digits)
+        obj._str = None
+        obj._dec = None
+        obj._key = None
+        obj._frozen = False
+        return obj
+
+    @classmethod
+    def _scan(cls, block: bytes, lineno: int, errors: list | None) -> list:
+        """Проверка блока строк, разделённых b"\\n".
+
+        Возвращает пары ASCII-строк (целая часть, дробная часть) без незначащих
+        нулей. Если весь блок корректен, хватает одного прохода регулярного
+        выражения; иначе блок разбирается построчно с номерами и причинами ошибок.
+        """
+        limit = cls.max_size()
+        parts = _LINES_RE.findall(block)
+        if len(parts) == block.count(b"\n") + 1:
+            res = []
+            for int_b, frac_b in parts:
+                int_b = int_b.lstrip(b"0") or b"0"
+                frac_b = frac_b.rstrip(b"0")
+                if len(int_b) + len(frac_b) > limit:
+                    break
+                res.append((int_b, frac_b))
+            else:
+                return res
+        return cls._scan_lines(block.split(b"\n"), lineno, errors)
+
+    @classmethod
+    def _scan_lines(cls, lines: list, lineno: int, errors: list | None) -> list:
+        limit = cls.max_size()
+        res = []
+        for line in lines:
+            lineno += 1
+            m = _LINE_RE.fullmatch(line)
+            if m is not None:
+                int_b = m.group(1).lstrip(b"0") or b"0"
+                frac_b = (m.group(2) or b"").rstrip(b"0")
+                if len(int_b) + len(frac_b) <= limit:
+                    res.append((int_b, frac_b))
+                    continue
+            # Причину ошибки (или разбор не-ASCII цифр) даёт __init__.
+            try:
+                f = cls(line.decode(errors="replace"))
+            except ValueError as e:
+                if errors is not None:
+                    errors.append((lineno, str(e)))
+            else:
+                int_s, _, frac_s = f._canonical().partition(".")
+                res.append((int_s.encode(), frac_s.encode()))
+        return res
+
+    @classmethod
+    def _from_parts(cls, parts: list) -> list:
+        new = cls.__new__
+        res = []
+        for int_b, frac_b in parts:
+            obj = new(cls)
+            obj._digits = bytearray(int_b[::-1] + frac_b).translate(_FROM_ASCII)
+            obj._int_len = len(int_b)
+            obj._size = len(obj._digits)
+            obj._str = None
+            obj._dec = None
+            obj._key = None
+            obj._frozen = False
+            res.append(obj)
+        return res
+
+    @classmethod
+    def parse_many(
+        cls, values: Iterable[str], errors: list | None = None, as_array: bool = False
+    ) -> "list[Fraction] | FractionArray":
+        """Разбор набора строк; некорректные пропускаются, а в errors
+        (если передан) добавляются пары (номер строки с 1, причина)."""
+        values = [v.strip() for v in values]
+        if any("\n" in v for v in values):
+            parts = cls._scan_lines([v.encode() for v in values], 0, errors)
+        else:
+            parts = cls._scan("\n".join(values).encode(), 0, errors)
+        return FractionArray._from_parts(parts) if as_array else cls._from_parts(parts)
+
+    @classmethod
+    def parse_stream(
+        cls,
+        fileobj: BinaryIO | TextIO,
+        errors: list | None = None,
+        chunk_size: int = 1 << 20,
+        as_array: bool = False,
+    ) -> "Iterator[Fraction] | Iterator[FractionArray]":
+        """Построчный разбор файла блоками по chunk_size, по одному числу в строке.
+
+        Память не зависит от размера файла. Ошибки собираются как в parse_many;
+        при as_array=True выдаётся по одному FractionArray на блок.
+        """
+        lineno = 0
+        tail = b""
+        while True:
+            chunk = fileobj.read(chunk_size)
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            data = tail + chunk
+            if chunk:
+                cut = data.rfind(b"\n")
+                if cut < 0:
+                    tail = data
+                    continue
+                block, tail = data[:cut], data[cut + 1:]
+            elif data:
+                block, tail = data, b""
+            else:
+                break
+            parts = cls._scan(block, lineno, errors)
+            lineno += block.count(b"\n") + 1
+            if as_array:
+                if parts:
+                    yield FractionArray._from_parts(parts)
+            else:
+                yield from cls._from_parts(parts)
+
+    @classmethod
+    def evaluate_batch(
+        cls,
+        ops: Iterable[tuple],
+        workers: int = 1,
+        processes: bool = True,
+        errors: list | None = None,
+    ) -> list:
+        """Вычисление списка кортежей (операция, lhs, rhs) пулом из workers.
+
+        Операции: "+", "-", "*"; операнды — Fraction или строки. Результаты
+        возвращаются в порядке входа и от числа workers не зависят. Без errors
+        первая ошибка (в порядке входа) пробрасывается; с errors на её месте
+        будет None, а в errors — пара (индекс, причина).
+        """
+        ops = list(ops)
+        if workers < 1:
+            raise ValueError("workers должен быть положительным")
+        size = cls.max_size()
+        if workers == 1 or len(ops) < 2:
+            results = _evaluate_chunk(ops, size)
+        else:
+            step = -(-len(ops) // (workers * 4))
+            chunks = [ops[i:i + step] for i in range(0, len(ops), step)]
+            pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+            with pool(max_workers=workers) as executor:
+                results = []
+                for part in executor.map(_evaluate_chunk, chunks, [size] * len(chunks)):
+                    results += part
+        for i, res in enumerate(results):
+            if isinstance(res, Exception):
+                if errors is None:
+                    raise res
+                errors.append((i, str(res)))
+                results[i] = None
+        return results
+
+    def to_bytes(self) -> bytes:
+        d = self._digits
+        header = bytearray()
+        _put_varint(header, self._int_len)
+        _put_varint(header, len(d) - self._int_len)
+        _put_varint(header, self._size)
+        hex_digits = d.translate(_TO_ASCII)
+        if len(d) % 2:
+            hex_digits.append(0x30)
+        return bytes((len(header),)) + header + bytes.fromhex(hex_digits.decode())
+
+    @classmethod
+    def _read_record(cls, buf, pos: int = 0) -> tuple["Fraction", int]:
+        if pos >= len(buf):
+            raise ValueError("Запись Fraction обрезана")
+        start = pos + 1
+        int_len, i = _get_varint(buf, start)
+        frac_len, i = _get_varint(buf, i)
+        size, i = _get_varint(buf, i)
+        if i != start + buf[pos]:
+            raise ValueError("Неверный заголовок записи Fraction")
+        count = int_len + frac_len
+        end = i + (count + 1) // 2
+        if end > len(buf):
+            raise ValueError("Запись Fraction обрезана")
+        if int_len < 1 or size < count:
+            raise ValueError("Неверный заголовок записи Fraction")
+        hex_digits = bytes(buf[i:end]).hex()
+        if not hex_digits.isdecimal():
+            raise ValueError("Запись Fraction содержит не цифры")
+        digits = bytearray(hex_digits[:count], "ascii").translate(_FROM_ASCII)
+        obj = cls._from_digits(digits, int_len)
+        obj._size = size
+        return obj, end
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Fraction":
+        obj, end = cls._read_record(data)
+        if end != len(data):
+            raise ValueError("Лишние байты после записи Fraction")
+        return obj
+
+    def __reduce__(self):
+        return _restore_fraction, (bytes(self._digits), self._int_len, self._size)
+
+    def _frac_len(self) -> int:
+        return len(self._digits) - self._int_len
+
+    def _aligned(self, other: "Fraction") -> tuple[int, int, int]:
+        a, sa = self._to_int()
+        b, sb = other._to_int()
+        if sa < sb:
+            return a * _pow10(sb - sa), b, sb
+        return a, b * _pow10(sa - sb), sa
+
     @staticmethod
     def _normalize_decimal_string(s: str) -> str:
         s = s.strip()
@@ -75,107 +748,1000 @@ class Fraction:
 
     @classmethod
     def from_decimal(cls, dec: Decimal) -> "Fraction":
-        getcontext().prec = cls.MAX_SIZE
         s = format(dec, "f")
         s = cls._normalize_decimal_string(s)
         return cls(s)
 
     def __str__(self) -> str:
-        return self._to_string()
+        return self._canonical()
+
+    def __int__(self) -> int:
+        int_s = self._canonical().partition(".")[0]
+        return int(int_s) if len(int_s) <= _STR_CHUNK else _ascii_to_int(int_s.encode())
+
+    def __float__(self) -> float:
+        # float() от десятичной строки округляется корректно при любой длине.
+        return float(self._canonical())
+
+    def _fixed(self, ndigits: int, rounding: str, shift: int = 0) -> tuple[str, str]:
+        """Целая и дробная части self * 10 ** shift, округлённого до ndigits знаков."""
+        int_s, _, frac_s = self._canonical().partition(".")
+        if shift > 0:
+            int_s = (int_s + frac_s[:shift].ljust(shift, "0")).lstrip("0") or "0"
+            frac_s = frac_s[shift:]
+        elif shift < 0:
+            int_s = int_s.rjust(1 - shift, "0")
+            frac_s = (int_s[shift:] + frac_s).rstrip("0")
+            int_s = int_s[:shift].lstrip("0") or "0"
+        return _round_digits(int_s, frac_s, ndigits, rounding)
+
+    def __round__(self, ndigits: int | None = None) -> "int | Fraction":
+        """Как round() для чисел: ROUND_HALF_EVEN; без ndigits — int."""
+        if ndigits is None:
+            return _ascii_to_int(self._fixed(0, ROUND_HALF_EVEN)[0].encode())
+        ndigits = operator.index(ndigits)
+        if ndigits < 0:
+            int_s, _ = self._fixed(0, ROUND_HALF_EVEN, ndigits)
+            return Fraction(int_s + "0" * -ndigits)
+        int_s, frac_s = self._fixed(ndigits, ROUND_HALF_EVEN)
+        return Fraction(int_s + "." + frac_s if frac_s else int_s)
+
+    def format(self, spec: str = "", rounding: str = ROUND_HALF_EVEN) -> str:
+        """format(f, spec) с явным режимом округления из модуля decimal.
+
+        Без точности выводятся все цифры, как у Decimal; пустой тип с точностью
+        работает как "f".
+        """
+        parsed = _FORMAT_CACHE.get(spec) or _parse_format(spec)
+        fill, align, sign, zero_width, width, sep, precision, shift = parsed
+        int_s, _, frac_s = self._canonical().partition(".")
+        if shift:
+            ndigits = max(len(frac_s) - shift, 0) if precision is None else precision
+            int_s, frac_s = self._fixed(ndigits, rounding, shift)
+        elif precision is not None:
+            int_s, frac_s = _round_digits(int_s, frac_s, precision, rounding)
+        tail = "." + frac_s if frac_s else ""
+        if shift:
+            tail += "%"
+        if sep and len(int_s) > 3:
+            if len(int_s) < _STR_CHUNK:
+                int_s = format(int(int_s), sep)
+            else:
+                int_s = _group_digits(int_s, sep)
+        if zero_width:
+            # Нули дополнения тоже делятся на группы, как у int и Decimal.
+            int_s = self._zero_pad(int_s, zero_width - len(sign) - len(tail), sep)
+        body = sign + int_s + tail
+        pad = width - len(body)
+        if pad <= 0:
+            return body
+        if align == ">":
+            return fill * pad + body
+        if align == "<":
+            return body + fill * pad
+        if align == "=":
+            return sign + fill * pad + int_s + tail
+        return fill * (pad // 2) + body + fill * (pad - pad // 2)
+
+    @staticmethod
+    def _zero_pad(int_s: str, width: int, sep: str | None) -> str:
+        if not sep:
+            return int_s.rjust(width, "0")
+        digits = int_s.replace(sep, "")
+        while len(int_s) < width:
+            digits = "0" + digits
+            int_s = _group_digits(digits, sep)
+        return int_s
+
+    def __format__(self, spec: str) -> str:
+        return self.format(spec)
 
     def __repr__(self) -> str:
-        return f"Fraction('{self._to_string()}', size={self._size})"
+        return f"Fraction('{self._canonical()}', size={self._size})"
 
     def to_decimal(self) -> Decimal:
-        getcontext().prec = Fraction.MAX_SIZE
-        return Decimal(self._to_string())
+        dec = self._dec
+        if dec is None:
+            Fraction._cache_misses += 1
+            dec = self._dec = Decimal(self._canonical())
+        else:
+            Fraction._cache_hits += 1
+        return dec
 
     def size(self) -> int:
         return self._size
 
     def __len__(self) -> int:
-        return self.count
+        return len(self._digits)
 
-    def __getitem__(self, index: int) -> int:
+    def __getitem__(self, index: int | slice) -> "int | FractionView":
+        if isinstance(index, slice):
+            return FractionView(self, index)
         if not isinstance(index, int):
             raise TypeError("Индекс должен быть целым числом")
-        if index < 0 or index >= self.count:
+        if index < 0 or index >= len(self._digits):
             raise IndexError("Индекс вне диапазона")
-        if index < len(self.int_part):
-            return self.int_part[index]
-        j = index - len(self.int_part)
-        return self.frac_part[j]
+        return self._digits[index]
 
-    def __setitem__(self, index: int, value: int) -> None:
+    def __setitem__(self, index: int | slice, value) -> None:
+        self._check_mutable()
+        if isinstance(index, slice):
+            FractionView(self, index)[:] = value
+            return
         if not isinstance(index, int):
             raise TypeError("Индекс должен быть целым числом")
         if not isinstance(value, int) or not (0 <= value <= 9):
             raise ValueError("Значение должно быть цифрой 0..9")
-        if index < 0 or index >= self.count:
+        if index < 0 or index >= len(self._digits):
             raise IndexError("Индекс вне диапазона")
-        if index < len(self.int_part):
-            self.int_part[index] = value
-        else:
-            j = index - len(self.int_part)
-            self.frac_part[j] = value
+        self._digits[index] = value
+        self._invalidate()
 
     def __iter__(self):
-        for d in self.int_part:
-            yield d
-        for d in self.frac_part:
-            yield d
+        return iter(self._digits)
 
     def __bool__(self) -> bool:
-        return any(self.int_part) or any(self.frac_part)
+        return self._digits.count(0) != len(self._digits)
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Fraction):
             return NotImplemented
-        return self.to_decimal() == other.to_decimal()
+        return self._canonical() == other._canonical()
+
+    # Хэш по значению согласован с __eq__. Изменённый через __setitem__ объект
+    # меняет хэш, поэтому ключами словарей и элементами множеств должны быть
+    # неизменяемые экземпляры — из Fraction.intern() — или объекты, которые
+    # после добавления больше не изменяются.
+    def __hash__(self) -> int:
+        return hash(self._canonical())
 
     def __lt__(self, other) -> bool:
         if not isinstance(other, Fraction):
             return NotImplemented
-        return self.to_decimal() < other.to_decimal()
+        return self._compare(other) < 0
 
     def __le__(self, other) -> bool:
         if not isinstance(other, Fraction):
             return NotImplemented
-        return self.to_decimal() <= other.to_decimal()
+        return self._compare(other) <= 0
 
     def __gt__(self, other) -> bool:
         if not isinstance(other, Fraction):
             return NotImplemented
-        return self.to_decimal() > other.to_decimal()
+        return self._compare(other) > 0
 
     def __ge__(self, other) -> bool:
         if not isinstance(other, Fraction):
             return NotImplemented
-        return self.to_decimal() >= other.to_decimal()
+        return self._compare(other) >= 0
 
     def __add__(self, other) -> "Fraction":
         if not isinstance(other, Fraction):
             return NotImplemented
-        res = self.to_decimal() + other.to_decimal()
-        if res < 0:
-            raise ValueError("Результат сложения отрицателен")
-        return Fraction.from_decimal(res)
+        a, b, scale = self._aligned(other)
+        return Fraction._rounded(a + b, scale)
 
     def __sub__(self, other) -> "Fraction":
         if not isinstance(other, Fraction):
             return NotImplemented
-        res = self.to_decimal() - other.to_decimal()
-        if res < 0:
+        a, b, scale = self._aligned(other)
+        if a < b:
             raise ValueError("Результат вычитания отрицателен")
-        return Fraction.from_decimal(res)
+        return Fraction._rounded(a - b, scale)
 
     def __mul__(self, other) -> "Fraction":
         if not isinstance(other, Fraction):
             return NotImplemented
-        res = self.to_decimal() * other.to_decimal()
-        if res < 0:
-            raise ValueError("Результат умножения отрицателен")
-        return Fraction.from_decimal(res)
+        if max(len(self._digits), len(other._digits)) >= Fraction.DECIMAL_MUL_THRESHOLD:
+            precision = Fraction.max_size()
+            ctx = _rounding_context(precision, ROUND_HALF_EVEN)
+            return Fraction._from_context(
+                ctx.multiply(self.to_decimal(), other.to_decimal()), precision
+            )
+        a, sa = self._to_int()
+        b, sb = other._to_int()
+        return Fraction._rounded(a * b, sa + sb)
+
+    # Операторы на месте меняют буфер _digits самого объекта. size() растёт до
+    # числа цифр результата; при ошибке объект остаётся прежним. Для экземпляра
+    # из Fraction.intern() они возвращают NotImplemented: Python выполняет
+    # обычный +, - или * и привязывает имя к новому объекту.
+    def _check_mutable(self) -> None:
+        if self._frozen:
+            raise TypeError("Экземпляр из Fraction.intern() изменять нельзя")
+
+    def _resize(self, index: int, count: int) -> bytearray:
+        # Вставка count нулей перед index; при экспортированном memoryview
+        # (int_part, frac_part) буфер заменяется копией.
+        try:
+            self._digits[index:index] = bytes(count)
+        except BufferError:
+            d = bytearray(self._digits)
+            d[index:index] = bytes(count)
+            self._digits = d
+        return self._digits
+
+    def _assign(self, other: "Fraction") -> None:
+        try:
+            self._digits[:] = other._digits
+        except BufferError:
+            self._digits = bytearray(other._digits)
+        self._int_len = other._int_len
+        self._size = max(self._size, len(self._digits))
+        self._invalidate()
+
+    def _trim(self) -> None:
+        # Приведение к виду, который дают __add__/__sub__: без ведущих нулей
+        # целой части и хвостовых нулей дробной.
+        d = self._digits
+        n = self._int_len
+        end = len(d)
+        while end > n and not d[end - 1]:
+            end -= 1
+        lead = n
+        while lead > 1 and not d[lead - 1]:
+            lead -= 1
+        try:
+            del d[end:]
+            del d[lead:n]
+        except BufferError:
+            d = self._digits = d[:lead] + d[n:end]
+        self._int_len = lead
+        self._size = max(self._size, len(d))
+        self._invalidate()
+
+    def _align_in_place(self, other: "Fraction") -> tuple[bytearray, int] | None:
+        # Дополнение self нулями до разрядов other. None — если результат может
+        # не уместиться в MAX_SIZE: тогда работает обычный путь с округлением.
+        d = self._digits
+        grow_int = other._int_len - self._int_len
+        grow_frac = other._frac_len() - self._frac_len()
+        count = len(d) + max(grow_int, 0) + max(grow_frac, 0)
+        if count + 1 > Fraction.max_size():
+            return None
+        if grow_frac > 0:
+            d = self._resize(len(d), grow_frac)
+        if grow_int > 0:
+            d = self._resize(self._int_len, grow_int)
+            self._int_len += grow_int
+        return d, self._int_len
+
+    def __iadd__(self, other) -> "Fraction":
+        if not isinstance(other, Fraction) or self._frozen:
+            return NotImplemented
+        aligned = self._align_in_place(other)
+        if aligned is None:
+            self._assign(self + other)
+            return self
+        d, n = aligned
+        od, on = other._digits, other._int_len
+        carry = 0
+        for j in range(len(od) - on - 1, -1, -1):
+            v = d[n + j] + od[on + j] + carry
+            carry = v >= 10
+            d[n + j] = v - 10 if carry else v
+        for i in range(on):
+            v = d[i] + od[i] + carry
+            carry = v >= 10
+            d[i] = v - 10 if carry else v
+        i = on
+        while carry and i < n:
+            if d[i] == 9:
+                d[i] = 0
+                i += 1
+            else:
+                d[i] += 1
+                carry = False
+        if carry:
+            d = self._resize(n, 1)
+            d[n] = 1
+            self._int_len = n + 1
+        self._trim()
+        return self
+
+    def __isub__(self, other) -> "Fraction":
+        if not isinstance(other, Fraction) or self._frozen:
+            return NotImplemented
+        if self._compare(other) < 0:
+            raise ValueError("Результат вычитания отрицателен")
+        aligned = self._align_in_place(other)
+        if aligned is None:
+            self._assign(self - other)
+            return self
+        d, n = aligned
+        od, on = other._digits, other._int_len
+        borrow = 0
+        for j in range(len(od) - on - 1, -1, -1):
+            v = d[n + j] - od[on + j] - borrow
+            borrow = v < 0
+            d[n + j] = v + 10 if borrow else v
+        for i in range(on):
+            v = d[i] - od[i] - borrow
+            borrow = v < 0
+            d[i] = v + 10 if borrow else v
+        i = on
+        while borrow:
+            if d[i]:
+                d[i] -= 1
+                borrow = False
+            else:
+                d[i] = 9
+                i += 1
+        self._trim()
+        return self
+
+    def __imul__(self, other) -> "Fraction":
+        # Произведение считается заново; на месте обновляется только буфер.
+        if not isinstance(other, Fraction) or self._frozen:
+            return NotImplemented
+        self._assign(self * other)
+        return self
+
+    # Деление и корень: precision — число цифр результата (как count), по
+    # умолчанию max_size(); rounding — режим из модуля decimal.
+    @classmethod
+    def _precision(cls, precision: int | None) -> int:
+        if precision is None:
+            return cls.max_size()
+        precision = int(precision)
+        if precision <= 0:
+            raise ValueError("precision должен быть положительным")
+        if precision > cls.max_size():
+            raise ValueError("Превышен максимальный размер Fraction")
+        return precision
+
+    def _to_int(self) -> tuple[int, int]:
+        d = self._digits
+        n = self._int_len
+        ascii_digits = (d[n - 1::-1] + d[n:]).translate(_TO_ASCII)
+        return _ascii_to_int(ascii_digits), len(d) - n
+
+    def _magnitude(self) -> int:
+        # Позиция старшей значащей цифры: длина целой части для x >= 1,
+        # минус число нулей после точки для x < 1.
+        n = self._int_width()
+        if n:
+            return n
+        frac = self._digits[self._int_len:]
+        return -(len(frac) - len(frac.lstrip(b"\0")))
+
+    @classmethod
+    def _rounded(cls, value: int, scale: int) -> "Fraction":
+        # Результат +, -, *: округление до max_size() значащих цифр
+        # (ROUND_HALF_EVEN), как в контексте Decimal.
+        precision = cls.max_size()
+        s = _int_to_ascii(value)
+        drop = len(s) - precision
+        if drop > 0:
+            s, rest = s[:precision], s[precision:]
+            # Сравнение по ASCII-кодам: 53 — "5", чётность кода равна
+            # чётности цифры; sticky — за первой отброшенной цифрой есть не ноль.
+            first = rest[0]
+            sticky = len(rest.rstrip(b"0")) > 1
+            if first > 53 or (first == 53 and (sticky or s[-1] % 2)):
+                s = _ascii_increment(s)
+            scale -= drop
+            if scale < 0:
+                s += b"0" * -scale
+                scale = 0
+        return cls._from_ascii(s.rjust(scale + 1, b"0"), scale, precision)
+
+    @classmethod
+    def _from_context(cls, q: Decimal, precision: int) -> "Fraction":
+        # q уже округлён контекстом до precision цифр; запись "f" без экспоненты.
+        int_b, _, frac_b = format(q, "f").encode().partition(b".")
+        s = (int_b + frac_b).rjust(len(frac_b) + 1, b"0")
+        return cls._from_ascii(s, len(frac_b), precision)
+
+    @classmethod
+    def _from_int(cls, value: int, scale: int, precision: int) -> "Fraction":
+        return cls._from_ascii(_int_to_ascii(value, scale + 1), scale, precision)
+
+    @classmethod
+    def _from_ascii(cls, s: bytes, scale: int, precision: int) -> "Fraction":
+        # s — десятичная запись value / 10 ** scale, не короче scale + 1 цифр.
+        int_b = s[:len(s) - scale].lstrip(b"0") or b"0"
+        frac_b = s[len(s) - scale:].rstrip(b"0")
+        # Округление вверх может добавить цифру в целую часть (9.96 -> 10).
+        if len(int_b) + len(frac_b) > precision:
+            raise ValueError("Превышен максимальный размер Fraction")
+        digits = bytearray(int_b[::-1] + frac_b).translate(_FROM_ASCII)
+        return cls._from_digits(digits, len(int_b))
+
+    def divide(
+        self,
+        other: "Fraction",
+        precision: int | None = None,
+        rounding: str = ROUND_HALF_EVEN,
+    ) -> "Fraction":
+        if not isinstance(other, Fraction):
+            raise TypeError("Делитель должен быть Fraction")
+        precision = self._precision(precision)
+        a, b = self.to_decimal(), other.to_decimal()
+        if not b:
+            raise ZeroDivisionError("Деление на ноль")
+        if not a:
+            return Fraction._from_digits(bytearray(1), 1)
+        newton = len(other._digits) >= Fraction.NEWTON_THRESHOLD
+        if a >= b and not newton:
+            # Частное не меньше 1, в нём precision значащих цифр.
+            digits = precision
+        else:
+            # Старшая цифра частного — в разряде e или e - 1, e — разность порядков.
+            e = a.adjusted() - b.adjusted()
+            if a < _EXACT.scaleb(b, e):
+                e -= 1
+            digits = precision + min(e, 0)
+        if digits > 0 and not newton:
+            # libmpdec делит и округляет до digits значащих цифр сам; перенос
+            # при округлении (9.99 -> 10.0) сдвигает старшую цифру q.
+            q = _rounding_context(digits, rounding).divide(a, b)
+            scale = digits - 1 - q.adjusted()
+            if scale < 0:
+                raise ValueError("Превышен максимальный размер Fraction")
+            s = format(_EXACT.scaleb(q, scale), "f").encode()
+            return Fraction._from_ascii(s.rjust(scale + 1, b"0"), scale, precision)
+        scale = precision - max(e + 1, 1)
+        if scale < 0:
+            raise ValueError("Превышен максимальный размер Fraction")
+        # q — целая часть a * 10 ** scale / b, r — остаток.
+        n = _EXACT.scaleb(a, scale)
+        if not newton:
+            q, r = _EXACT.divmod(n, b)
+        else:
+            # Ньютону нужны целые: делимое и делитель сдвигаются на 10 ** k.
+            k = other._frac_len() + max(self._frac_len() - scale, 0)
+            b = _EXACT.scaleb(b, k)
+            q, r = _divmod_newton(_EXACT.scaleb(n, k), b)
+        s = format(q, "f").encode()
+        r2 = _EXACT.add(r, r)
+        half = (r2 > b) - (r2 < b)
+        if _rounds_up(s[-1] - 48, half, bool(r), rounding):
+            s = _ascii_increment(s)
+        return Fraction._from_ascii(s.rjust(scale + 1, b"0"), scale, precision)
+
+    def __truediv__(self, other) -> "Fraction":
+        if not isinstance(other, Fraction):
+            return NotImplemented
+        return self.divide(other)
+
+    def reciprocal(
+        self, precision: int | None = None, rounding: str = ROUND_HALF_EVEN
+    ) -> "Fraction":
+        return Fraction._from_digits(bytearray(b"\1"), 1).divide(
+            self, precision, rounding
+        )
+
+    def sqrt(
+        self, precision: int | None = None, rounding: str = ROUND_HALF_EVEN
+    ) -> "Fraction":
+        # math.isqrt — целочисленный Ньютон с удвоением точности.
+        precision = self._precision(precision)
+        a, sa = self._to_int()
+        if sa % 2:
+            a *= 10
+            sa += 1
+        # В корне из числа с целой частью из e цифр их (e + 1) // 2.
+        scale = precision - max((self._magnitude() + 1) // 2, 1)
+        if scale < 0:
+            raise ValueError("Превышен максимальный размер Fraction")
+        guard = max(scale + 1, sa // 2)
+        s = a * _pow10(2 * guard - sa)
+        root = isqrt(s)
+        root = _round_int(root, guard - scale, root * root != s, rounding)
+        return Fraction._from_int(root, scale, precision)
+
+    @classmethod
+    def sum(cls, values: Iterable["Fraction"]) -> "Fraction":
+        """Сумма values через += в одном накопителе, как functools.reduce(add)."""
+        acc = cls._from_digits(bytearray(1), 1)
+        for value in values:
+            acc += value
+        return acc
+
+
+class FractionView:
+    """Срез цифр Fraction без копирования, как f[2:10].
+
+    Позиции — индексы цифр самого Fraction на момент обращения. Запись идёт
+    через Fraction и сбрасывает его кэш; экспорт буфера — только для чтения.
+    """
+
+    __slots__ = ("_owner", "_range")
+
+    def __init__(self, owner: Fraction, index: slice = slice(None)) -> None:
+        self._owner = owner
+        self._range = range(len(owner._digits))[index]
+
+    def _index(self, i: int) -> int:
+        if not isinstance(i, int):
+            raise TypeError("Индекс должен быть целым числом")
+        try:
+            return self._range[i]
+        except IndexError:
+            raise IndexError("Индекс вне диапазона") from None
+
+    def _check_bounds(self, r: range) -> None:
+        # Fraction мог стать короче после создания среза; проверяются оба
+        # конца, так как при отрицательном шаге дальше от начала r.start.
+        if r and max(r[0], r[-1]) >= len(self._owner._digits):
+            raise IndexError("Срез вне диапазона: Fraction стал короче")
+
+    @property
+    def memory(self) -> memoryview:
+        r = self._range
+        self._check_bounds(r)
+        stop = r.stop if r.stop >= 0 else None
+        return self._owner.digits[r.start:stop:r.step]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.memory
+
+    def __len__(self) -> int:
+        return len(self._range)
+
+    def __getitem__(self, index: int | slice) -> "int | FractionView":
+        if isinstance(index, slice):
+            view = FractionView.__new__(FractionView)
+            view._owner = self._owner
+            view._range = self._range[index]
+            return view
+        return self._owner[self._index(index)]
+
+    def __setitem__(self, index: int | slice, value) -> None:
+        owner = self._owner
+        if not isinstance(index, slice):
+            owner[self._index(index)] = value
+            return
+        owner._check_mutable()
+        r = self._range[index]
+        if isinstance(value, int):
+            raise TypeError("Срезу присваивается последовательность цифр")
+        digits = bytes(value)
+        if len(digits) != len(r):
+            raise ValueError("Число цифр должно совпадать с длиной среза")
+        if max(digits, default=0) > 9:
+            raise ValueError("Значение должно быть цифрой 0..9")
+        self._check_bounds(r)
+        d = owner._digits
+        if r.step == 1:
+            d[r.start:r.stop] = digits
+        else:
+            for i, v in zip(r, digits):
+                d[i] = v
+        owner._invalidate()
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.memory)
+
+    def tobytes(self) -> bytes:
+        return self.memory.tobytes()
+
+    def tolist(self) -> list[int]:
+        return self.memory.tolist()
+
+    def __repr__(self) -> str:
+        return f"FractionView({self.tolist()})"
+
+
+_BATCH_OPS = {"+": operator.add, "-": operator.sub, "*": operator.mul}
+
+
+def _restore_fraction(digits: bytes, int_len: int, size: int) -> Fraction:
+    obj = Fraction._from_digits(bytearray(digits), int_len)
+    obj._size = size
+    return obj
+
+
+def _evaluate_chunk(ops: list, max_size: int) -> list:
+    # Выполняется в рабочем потоке или процессе: предел MAX_SIZE передаётся явно,
+    # так как ContextVar туда не наследуется.
+    res = []
+    with Fraction.local_max_size(max_size):
+        for op, lhs, rhs in ops:
+            try:
+                func = _BATCH_OPS[op]
+            except KeyError:
+                res.append(ValueError(f"Неизвестная операция: {op!r}"))
+                continue
+            try:
+                lhs = lhs if isinstance(lhs, Fraction) else Fraction(lhs)
+                rhs = rhs if isinstance(rhs, Fraction) else Fraction(rhs)
+                res.append(func(lhs, rhs))
+            except ValueError as e:
+                res.append(e)
+    return res
+
+
+# FractionArray хранит числа матрицей лимбов по основанию 10**4 (младший лимб
+# в столбце 0): произведения лимбов и их суммы при умножении помещаются в int64.
+_ARRAY_LIMB = 4
+_ARRAY_BASE = 10 ** _ARRAY_LIMB
+_ARRAY_POW = 10 ** np.arange(_ARRAY_LIMB, dtype=np.int64)
+
+
+def _ceil_limbs(digits: int) -> int:
+    return -(-digits // _ARRAY_LIMB)
+
+
+def _carry_columns(limbs: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Переносы по столбцам; возвращает нормализованные лимбы и перенос из старшего."""
+    carry = np.zeros(len(limbs), dtype=np.int64)
+    for k in range(limbs.shape[1]):
+        col = limbs[:, k] + carry
+        carry = col // _ARRAY_BASE
+        limbs[:, k] = col - carry * _ARRAY_BASE
+    return limbs, carry
+
+
+def _top_digit(digits: np.ndarray) -> np.ndarray:
+    # Номер старшей ненулевой цифры строки (цифры от младшей), -1 для нуля.
+    nonzero = digits != 0
+    top = digits.shape[1] - 1 - nonzero[:, ::-1].argmax(axis=1)
+    return np.where(nonzero.any(axis=1), top, -1)
+
+
+def _round_limbs(limbs: np.ndarray, scale: int) -> tuple[np.ndarray, int]:
+    """Округление строк до max_size() значащих цифр (ROUND_HALF_EVEN), как у Fraction.
+
+    Если целая часть строки длиннее max_size(), — ValueError. Общие для всех
+    строк нулевые младшие лимбы дробной части отбрасываются вместе с масштабом.
+    """
+    precision = Fraction.max_size()
+    n, width = limbs.shape
+    used = width - np.argmax(limbs[:, ::-1] != 0, axis=1) if n else np.zeros(0)
+    if not n or used.max() * _ARRAY_LIMB <= precision:
+        return limbs, scale
+    digits = (limbs[:, :, None] // _ARRAY_POW % 10).reshape(n, width * _ARRAY_LIMB)
+    drop = _top_digit(digits) + 1 - precision
+    rows = np.flatnonzero(drop > 0)
+    if len(rows):
+        d = drop[rows]
+        part = digits[rows]
+        at = np.arange(len(rows))
+        first = part[at, d - 1]
+        # sticky — среди цифр младше первой отброшенной есть ненулевая.
+        sticky = np.cumsum(part != 0, axis=1)[at, d - 1] > (first != 0)
+        up = (first > 5) | ((first == 5) & (sticky | (part[at, d] % 2 == 1)))
+        part[np.arange(part.shape[1]) < d[:, None]] = 0
+        part[at[up], d[up]] += 1
+        digits[rows] = part
+        digits = np.pad(digits, ((0, 0), (0, _ARRAY_LIMB)))
+        limbs = digits.reshape(n, width + 1, _ARRAY_LIMB) @ _ARRAY_POW
+        limbs, _ = _carry_columns(limbs)
+        digits = (limbs[:, :, None] // _ARRAY_POW % 10).reshape(n, -1)
+    if (_top_digit(digits) + 1 - scale > precision).any():
+        raise ValueError("Превышен максимальный размер Fraction")
+    nonzero = np.flatnonzero(limbs.any(axis=0))
+    low = min(nonzero[0] if len(nonzero) else width, scale // _ARRAY_LIMB)
+    return limbs[:, low:], scale - low * _ARRAY_LIMB
+
+
+def _row_index(index) -> np.ndarray:
+    # Одномерный массив номеров строк или булева маска для FractionArray.
+    idx = np.asarray(index)
+    if idx.size == 0:
+        idx = idx.astype(np.intp)
+    if idx.ndim != 1 or idx.dtype.kind not in "iub":
+        raise TypeError("Индекс должен быть целым числом, срезом или массивом номеров")
+    return idx
+
+
+class FractionArray:
+    """Столбец неотрицательных чисел с фиксированной точкой и общим масштабом."""
+
+    __slots__ = ("_limbs", "_scale")
+
+    def __init__(self, values: Iterable = ()) -> None:
+        parts = []
+        for v in values:
+            f = v if isinstance(v, Fraction) else Fraction(v)
+            int_s, _, frac_s = f._canonical().partition(".")
+            parts.append((int_s.encode(), frac_s.encode()))
+        arr = FractionArray._from_parts(parts)
+        self._limbs = arr._limbs
+        self._scale = arr._scale
+
+    @classmethod
+    def _from_parts(cls, parts: list) -> "FractionArray":
+        """Сборка из пар ASCII-строк (целая часть, дробная часть)."""
+        int_len = max((len(p[0]) for p in parts), default=1)
+        scale = max((len(p[1]) for p in parts), default=0)
+        int_len = _ceil_limbs(int_len) * _ARRAY_LIMB
+        scale = _ceil_limbs(scale) * _ARRAY_LIMB
+        text = b"".join(i.rjust(int_len, b"0") + f.ljust(scale, b"0") for i, f in parts)
+        width = (int_len + scale) // _ARRAY_LIMB
+        digits = np.frombuffer(text, dtype=np.uint8).astype(np.int64) - ord("0")
+        # Строки записаны от старшей цифры: разворачиваем к порядку лимбов.
+        digits = digits.reshape(len(parts), width * _ARRAY_LIMB)[:, ::-1]
+        digits = digits.reshape(len(parts), width, _ARRAY_LIMB)
+        return cls._from_limbs(digits @ _ARRAY_POW, scale)
+
+    @classmethod
+    def _from_limbs(cls, limbs: np.ndarray, scale: int) -> "FractionArray":
+        nonzero = np.flatnonzero(limbs.any(axis=0))
+        width = max(nonzero[-1] + 1 if len(nonzero) else 1, scale // _ARRAY_LIMB + 1)
+        obj = cls.__new__(cls)
+        obj._limbs = np.ascontiguousarray(limbs[:, :width])
+        obj._scale = scale
+        return obj
+
+    @property
+    def scale(self) -> int:
+        return self._scale
+
+    def __len__(self) -> int:
+        return len(self._limbs)
+
+    def __getitem__(self, index) -> "Fraction | FractionArray":
+        """Номер — Fraction; срез, массив номеров или маска — FractionArray.
+
+        Номер может быть отрицательным и любого целого типа, например np.int64.
+        """
+        if isinstance(index, slice):
+            return FractionArray._from_limbs(self._limbs[index], self._scale)
+        try:
+            i = operator.index(index)
+        except TypeError:
+            rows = self._limbs[_row_index(index)]
+            return FractionArray._from_limbs(rows, self._scale)
+        n = len(self._limbs)
+        if i < 0:
+            i += n
+        if i < 0 or i >= n:
+            raise IndexError("Индекс вне диапазона")
+        row = FractionArray._from_limbs(self._limbs[i:i + 1], self._scale)
+        return row.tolist()[0]
+
+    def __iter__(self) -> Iterator[Fraction]:
+        return iter(self.tolist())
+
+    def __repr__(self) -> str:
+        return f"FractionArray({[str(f) for f in self.tolist()]})"
+
+    def tolist(self) -> list[Fraction]:
+        n, width = self._limbs.shape
+        digits = self._limbs[:, :, None] // _ARRAY_POW % 10
+        digits = digits.reshape(n, width * _ARRAY_LIMB)
+        scale = self._scale
+        row = digits.shape[1]
+        nonzero = digits != 0
+        # Первая значащая цифра дробной части и старшая значащая — целой.
+        lo = np.full(n, scale)
+        if scale:
+            frac_nz = nonzero[:, :scale]
+            lo = np.where(frac_nz.any(axis=1), frac_nz.argmax(axis=1), scale)
+        int_nz = nonzero[:, :scale - 1 if scale else None:-1]
+        hi = np.where(int_nz.any(axis=1), row - int_nz.argmax(axis=1), scale + 1)
+        raw = digits.astype(np.uint8).tobytes()
+        res = []
+        for i, (a, b) in enumerate(zip(lo.tolist(), hi.tolist())):
+            base = i * row
+            buf = bytearray(raw[base + scale:base + b])
+            int_len = len(buf)
+            buf += raw[base + a:base + scale][::-1]
+            res.append(Fraction._from_digits(buf, int_len))
+        return res
+
+    def _operand(self, other) -> "FractionArray":
+        if isinstance(other, Fraction):
+            return FractionArray([other])
+        if not isinstance(other, FractionArray):
+            return NotImplemented
+        if len(other) != len(self) and len(other) != 1 and len(self) != 1:
+            raise ValueError("Размеры массивов не совпадают")
+        return other
+
+    def _aligned(self, other: "FractionArray") -> tuple[np.ndarray, np.ndarray, int]:
+        scale = max(self._scale, other._scale)
+        width = max(
+            self._limbs.shape[1] - self._scale // _ARRAY_LIMB,
+            other._limbs.shape[1] - other._scale // _ARRAY_LIMB,
+        ) + scale // _ARRAY_LIMB + 1
+
+        def widen(arr: FractionArray) -> np.ndarray:
+            low = (scale - arr._scale) // _ARRAY_LIMB
+            res = np.zeros((len(arr._limbs), width), dtype=np.int64)
+            res[:, low:low + arr._limbs.shape[1]] = arr._limbs
+            return res
+
+        return widen(self), widen(other), scale
+
+    def __add__(self, other) -> "FractionArray":
+        other = self._operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        a, b, scale = self._aligned(other)
+        limbs, _ = _carry_columns(a + b)
+        return FractionArray._from_limbs(*_round_limbs(limbs, scale))
+
+    __radd__ = __add__
+
+    def __sub__(self, other) -> "FractionArray":
+        other = self._operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        a, b, scale = self._aligned(other)
+        limbs, carry = _carry_columns(a - b)
+        if (carry < 0).any():
+            raise ValueError("Результат вычитания отрицателен")
+        return FractionArray._from_limbs(*_round_limbs(limbs, scale))
+
+    def __rsub__(self, other) -> "FractionArray":
+        other = self._operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return other - self
+
+    def __mul__(self, other) -> "FractionArray":
+        other = self._operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        a, b = self._limbs, other._limbs
+        n = max(len(a), len(b))
+        res = np.zeros((n, a.shape[1] + b.shape[1] + 1), dtype=np.int64)
+        for i in range(a.shape[1]):
+            res[:, i:i + b.shape[1]] += a[:, i:i + 1] * b
+        limbs, _ = _carry_columns(res)
+        # Как Fraction.__mul__: произведение округляется до max_size() цифр.
+        return FractionArray._from_limbs(
+            *_round_limbs(limbs, self._scale + other._scale)
+        )
+
+    __rmul__ = __mul__
+
+    def _compare(self, other) -> np.ndarray:
+        """Знак разности поэлементно: -1, 0 или 1."""
+        a, b, _ = self._aligned(other)
+        limbs, carry = _carry_columns(a - b)
+        return np.where(carry < 0, -1, limbs.any(axis=1).astype(np.int64))
+
+    def __eq__(self, other):
+        other = self._operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return self._compare(other) == 0
+
+    def __ne__(self, other):
+        other = self._operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return self._compare(other) != 0
+
+    def __lt__(self, other):
+        other = self._operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return self._compare(other) < 0
+
+    def __le__(self, other):
+        other = self._operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return self._compare(other) <= 0
+
+    def __gt__(self, other):
+        other = self._operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return self._compare(other) > 0
+
+    def __ge__(self, other):
+        other = self._operand(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return self._compare(other) >= 0
+
+    def argsort(self) -> np.ndarray:
+        # np.lexsort сортирует по последнему ключу в первую очередь — это старший лимб.
+        return np.lexsort(self._limbs.T)
+
+    def sorted(self) -> "FractionArray":
+        return FractionArray._from_limbs(self._limbs[self.argsort()], self._scale)
+
+    def sum(self) -> Fraction:
+        extra = len(str(len(self._limbs))) // _ARRAY_LIMB + 1
+        total = np.zeros((1, self._limbs.shape[1] + extra), dtype=np.int64)
+        total[0, :self._limbs.shape[1]] = self._limbs.sum(axis=0)
+        limbs, _ = _carry_columns(total)
+        # Точная сумма округляется до max_size() цифр один раз, в конце.
+        limbs, scale = _round_limbs(limbs, self._scale)
+        return FractionArray._from_limbs(limbs, scale).tolist()[0]
+
+
+class FractionStore:
+    """Файл записей Fraction.to_bytes() с индексом смещений, читаемый через mmap.
+
+    Формат: _STORE_MAGIC, записи, индекс (по uint64 на запись) и хвост
+    "<QQ4s": смещение индекса, число записей, _STORE_MAGIC. Запись k читается
+    по индексу за постоянное время без разбора остального файла.
+    """
+
+    __slots__ = ("_file", "_map", "_index", "_len")
+
+    _STORE_MAGIC = b"FRS1"
+    _FOOTER = struct.Struct("<QQ4s")
+    _OFFSET = struct.Struct("<Q")
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Файл не является FractionStore") from None
+        footer = self._FOOTER
+        m = self._map
+        if (
+            len(m) < len(self._STORE_MAGIC) + footer.size
+            or m[:len(self._STORE_MAGIC)] != self._STORE_MAGIC
+        ):
+            self.close()
+            raise ValueError("Файл не является FractionStore")
+        index, count, magic = footer.unpack_from(m, len(m) - footer.size)
+        if magic != self._STORE_MAGIC or index + 8 * count != len(m) - footer.size:
+            self.close()
+            raise ValueError("Повреждён индекс FractionStore")
+        self._index = index
+        self._len = count
+
+    @classmethod
+    def write(cls, path: str, values: Iterable[Fraction]) -> int:
+        """Записать values в path; возвращает число записей.
+
+        Смещения копятся во временном файле, а не в памяти.
+        """
+        count = 0
+        offsets = array("Q")
+        with open(path, "wb") as out, tempfile.TemporaryFile() as spool:
+            out.write(cls._STORE_MAGIC)
+            pos = len(cls._STORE_MAGIC)
+            for value in values:
+                if not isinstance(value, Fraction):
+                    raise TypeError("FractionStore хранит только Fraction")
+                record = value.to_bytes()
+                out.write(record)
+                offsets.append(pos)
+                pos += len(record)
+                count += 1
+                if len(offsets) >= 1 << 16:
+                    offsets.tofile(spool)
+                    del offsets[:]
+            offsets.tofile(spool)
+            spool.seek(0)
+            shutil.copyfileobj(spool, out)
+            out.write(cls._FOOTER.pack(pos, count, cls._STORE_MAGIC))
+        return count
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "FractionStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, k: int) -> Fraction:
+        if not isinstance(k, int):
+            raise TypeError("Индекс должен быть целым числом")
+        if k < 0:
+            k += self._len
+        if k < 0 or k >= self._len:
+            raise IndexError("Индекс вне диапазона")
+        (pos,) = self._OFFSET.unpack_from(self._map, self._index + 8 * k)
+        return Fraction._read_record(self._map, pos)[0]
+
+    def __iter__(self) -> Iterator[Fraction]:
+        m = self._map
+        pos = len(self._STORE_MAGIC)
+        for _ in range(self._len):
+            value, pos = Fraction._read_record(m, pos)
+            yield value
 
 
 if __name__ == "__main__":
@@ -0,0 +1,917 @@
+import io
+import operator
+import os
+import pickle
+import random
+import sys
+import threading
+from decimal import (
+    ROUND_05UP,
+    ROUND_DOWN,
+    ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP,
+    Decimal,
+    getcontext,
+    localcontext,
+)
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from individ.Zad.zad_2 import (  # noqa: E402
+    Fraction,
+    FractionArray,
+    FractionStore,
+    FractionView,
+)
+
+
+OPS = {"+": operator.add, "-": operator.sub, "*": operator.mul}
+
+
+def decimal_op(op: str, a: Fraction, b: Fraction) -> Fraction:
+    with localcontext(prec=Fraction.max_size()):
+        res = OPS[op](a.to_decimal(), b.to_decimal())
+    if res < 0:
+        raise ValueError("Результат отрицателен")
+    return Fraction.from_decimal(res)
+
+
+def repr_or_none(func, *args) -> str | None:
+    try:
+        return repr(func(*args))
+    except ValueError:
+        return None
+
+
+def random_number(rng: random.Random, digits: str = "0123456789") -> str:
+    int_str = "".join(rng.choice(digits) for _ in range(rng.randint(0, 50)))
+    frac_str = "".join(rng.choice(digits) for _ in range(rng.randint(0, 50)))
+    return f"{int_str}.{frac_str}" if frac_str else int_str or "0"
+
+
+class TestStorage:
+    def test_digits_are_packed(self):
+        f = Fraction("123.45")
+        assert f._digits == bytearray([3, 2, 1, 4, 5])
+        assert f.int_part == bytearray([3, 2, 1])
+        assert f.frac_part == bytearray([4, 5])
+        assert not hasattr(f, "__dict__")
+
+    def test_parts_are_read_only(self):
+        f = Fraction("123.45")
+        with pytest.raises(TypeError):
+            f.int_part[0] = 9
+        with pytest.raises(TypeError):
+            f.frac_part[1] = 0
+
+    def test_sequence_semantics(self):
+        f = Fraction("0012.3400", size=10)
+        assert (len(f), f.count, f.size()) == (4, 4, 10)
+        assert list(f) == [2, 1, 3, 4]
+        assert [f[i] for i in range(len(f))] == [2, 1, 3, 4]
+        f[3] = 9
+        assert str(f) == "12.39"
+        with pytest.raises(ValueError):
+            f[0] = 10
+        with pytest.raises(IndexError):
+            _ = f[4]
+        with pytest.raises(TypeError):
+            _ = f["0"]
+
+    def test_parse_errors(self):
+        for bad in ("", "1.2.3", "-1", "1a", "1.a"):
+            with pytest.raises(ValueError):
+                Fraction(bad)
+
+
+class TestSlicing:
+    def test_slice_is_view(self):
+        f = Fraction("123.4567")
+        view = f[1:5]
+        assert isinstance(view, FractionView)
+        assert view.tolist() == [2, 1, 4, 5] and len(view) == 4
+        assert view[::-1].tolist() == [5, 4, 1, 2]
+        assert view[-1] == 5 and f[::3].tolist() == [3, 4, 7]
+        f[1] = 9
+        assert view.tolist() == [9, 1, 4, 5]
+        with pytest.raises(IndexError):
+            view[4]
+
+    def test_buffer_export_is_zero_copy_and_read_only(self):
+        np = pytest.importorskip("numpy")
+        f = Fraction("123.45")
+        arr = np.frombuffer(f.digits, dtype=np.uint8)
+        window = f[3:].memory
+        f[3] = 9
+        assert arr.tolist() == [3, 2, 1, 9, 5]
+        assert bytes(window) == b"\x09\x05"
+        assert f[:3].tobytes() == bytes(f.int_part)
+        with pytest.raises(TypeError):
+            f.digits[0] = 1
+        assert not arr.flags.writeable
+
+    def test_writes_invalidate_cache(self):
+        f = Fraction("123.45")
+        assert str(f) == "123.45" and f.sort_key() == (3, b"\x01\x02\x03\x04\x05")
+        view = f[3:]
+        view[0] = 0
+        assert str(f) == "123.05"
+        view[:] = [7, 7]
+        assert str(f) == "123.77" and f == Fraction("123.77")
+        f[::-1] = bytes([1, 2, 3, 4, 5])
+        assert repr(f) == "Fraction('345.21', size=5)"
+
+    def test_slice_assignment_validation(self):
+        f = Fraction("12.5")
+        with pytest.raises(ValueError):
+            f[0:2] = [1]
+        with pytest.raises(ValueError):
+            f[0:2] = [1, 10]
+        with pytest.raises(TypeError):
+            f[0:2] = 5
+        assert str(f) == "12.5"
+        frozen = Fraction.intern("12.5")
+        with pytest.raises(TypeError):
+            frozen[1:][0] = 1
+        Fraction.clear_intern()
+
+    def test_view_after_shrink(self):
+        f = Fraction("9.95")
+        view = f[1:]
+        f -= Fraction("0.95")
+        with pytest.raises(IndexError):
+            view.tolist()
+
+    def test_reversed_view_after_shrink(self):
+        f = Fraction("123.45")
+        view = f[::-1]
+        assert view.tolist() == [5, 4, 1, 2, 3]
+        f -= Fraction("0.45")
+        with pytest.raises(IndexError):
+            view.memory
+        with pytest.raises(IndexError):
+            view[:2] = [1, 1]
+        assert f[::-1].tolist() == [1, 2, 3]
+
+
+class TestCanonicalCache:
+    def test_setitem_invalidates_cache(self):
+        f = Fraction("123.45")
+        d = f.to_decimal()
+        assert str(f) == "123.45"
+        f[0] = 9
+        assert str(f) == "129.45"
+        assert f.to_decimal() == Decimal("129.45")
+        assert d == Decimal("123.45")
+        assert f > Fraction("129.4")
+
+    def test_hits_and_misses(self):
+        a = Fraction("1.5")
+        b = Fraction("1.25")
+        Fraction.reset_cache_info()
+        assert a > b
+        first = Fraction.cache_info()
+        assert first["misses"] > 0
+        assert a > b
+        second = Fraction.cache_info()
+        assert second["misses"] == first["misses"]
+        assert second["hits"] > first["hits"]
+        Fraction.reset_cache_info()
+        assert Fraction.cache_info() == {"hits": 0, "misses": 0}
+
+    def test_canonical_string_is_lazy(self):
+        f = Fraction("0012.50")
+        g = f * Fraction("2")
+        assert f._str is None and g._str is None
+        Fraction.reset_cache_info()
+        assert str(f) == "12.5" and str(f) == "12.5"
+        assert Fraction.cache_info() == {"hits": 1, "misses": 1}
+        assert str(g) == "25"
+
+    def test_comparisons(self):
+        assert Fraction("1.50") == Fraction("1.5")
+        assert Fraction("0012") == Fraction("12.000")
+        assert Fraction("9.99") < Fraction("10")
+        assert Fraction("12") < Fraction("12.0001")
+        assert Fraction("12.5") > Fraction("12.45")
+        assert Fraction("0.05") <= Fraction("0.05")
+        assert Fraction("0") >= Fraction("0.0")
+
+    def test_leading_zero_after_setitem_compares_by_value(self):
+        a = Fraction("10.5")
+        a[1] = 0
+        assert a == Fraction("0.5")
+        assert a < Fraction("1")
+
+    def test_sorting_matches_decimal(self):
+        rng = random.Random(11)
+        values = [Fraction(random_number(rng)) for _ in range(500)]
+        expected = sorted(values, key=lambda f: f.to_decimal())
+        assert [str(f) for f in sorted(values)] == [str(f) for f in expected]
+        by_key = sorted(values, key=Fraction.sort_key)
+        assert [str(f) for f in by_key] == [str(f) for f in expected]
+
+    def test_sort_key_orders_like_decimal(self):
+        rng = random.Random(14)
+        values = []
+        for _ in range(300):
+            f = Fraction(random_number(rng, "0019"), size=200)
+            if len(f):
+                f[rng.randrange(len(f))] = 0
+            values.append(f)
+        for a, b in zip(values, values[1:]):
+            x, y = a.to_decimal(), b.to_decimal()
+            assert (a.sort_key() < b.sort_key()) == (x < y)
+            assert (a.sort_key() == b.sort_key()) == (x == y)
+            assert (a < b, a == b, a >= b) == (x < y, x == y, x >= y)
+
+    def test_sort_key_is_compact(self):
+        assert Fraction("012.340").sort_key() == (2, b"\x01\x02\x03\x04")
+        assert Fraction("0.05").sort_key() == (0, b"\x00\x05")
+        assert Fraction("0").sort_key() == (0, b"")
+
+
+class TestArithmetic:
+    def test_addition_with_carry(self):
+        res = Fraction("999.99") + Fraction("0.01")
+        assert str(res) == "1000"
+        assert list(res.int_part) == [0, 0, 0, 1]
+        assert list(res.frac_part) == []
+        assert res.size() == len(res) == 4
+
+    def test_subtraction_with_borrow(self):
+        res = Fraction("1000") - Fraction("0.001")
+        assert str(res) == "999.999"
+
+    def test_subtraction_negative_raises(self):
+        with pytest.raises(ValueError, match="Результат вычитания отрицателен"):
+            _ = Fraction("1.5") - Fraction("1.51")
+
+    def test_subtraction_to_zero(self):
+        res = Fraction("12.5") - Fraction("12.50")
+        assert str(res) == "0"
+        assert res.count == 1
+        assert not res
+
+    def test_multiplication(self):
+        assert str(Fraction("123.45") * Fraction("7.005")) == "864.76725"
+        assert str(Fraction("0.5") * Fraction("0.2")) == "0.1"
+        assert str(Fraction("0") * Fraction("987.65")) == "0"
+
+    def test_leading_zero_after_setitem(self):
+        a = Fraction("10.5")
+        a[1] = 0
+        assert str(a + Fraction("1")) == "1.5"
+        assert str(a * Fraction("4")) == "2"
+
+    @pytest.mark.parametrize("mul_threshold", [1, Fraction.DECIMAL_MUL_THRESHOLD])
+    def test_rounding_matches_decimal_context(self, monkeypatch, mul_threshold):
+        monkeypatch.setattr(Fraction, "DECIMAL_MUL_THRESHOLD", mul_threshold)
+        a = Fraction("1." + "7" * 59)
+        assert str(a * a) == str(decimal_op("*", a, a))
+        assert (a * a).count == Fraction.MAX_SIZE
+
+    @pytest.mark.parametrize("mul_threshold", [1, Fraction.DECIMAL_MUL_THRESHOLD])
+    def test_overflow_matches_decimal_path(self, monkeypatch, mul_threshold):
+        monkeypatch.setattr(Fraction, "DECIMAL_MUL_THRESHOLD", mul_threshold)
+        a = Fraction("9" * 60)
+        with pytest.raises(ValueError, match="Превышен максимальный размер"):
+            _ = a * a
+
+    @pytest.mark.parametrize("mul_threshold", [1, Fraction.DECIMAL_MUL_THRESHOLD])
+    @pytest.mark.parametrize("digits", ["0123456789", "09"])
+    def test_random_operands_match_decimal(self, digits, monkeypatch, mul_threshold):
+        monkeypatch.setattr(Fraction, "DECIMAL_MUL_THRESHOLD", mul_threshold)
+        rng = random.Random(digits)
+        for _ in range(300):
+            a = Fraction(random_number(rng, digits))
+            b = Fraction(random_number(rng, digits))
+            for op, func in OPS.items():
+                expected = repr_or_none(decimal_op, op, a, b)
+                assert repr_or_none(func, a, b) == expected, (op, str(a), str(b))
+
+
+
+class TestInPlace:
+    IOPS = {"+": operator.iadd, "-": operator.isub, "*": operator.imul}
+
+    @pytest.mark.parametrize("max_size", [100, 12])
+    @pytest.mark.parametrize("op", ["+", "-", "*"])
+    def test_matches_binary_operators(self, op, max_size):
+        rng = random.Random(12)
+        with Fraction.local_max_size(max_size):
+            for _ in range(300):
+                sa, sb = random_number(rng, "0129"), random_number(rng, "0129")
+                if len(sa) > max_size or len(sb) > max_size:
+                    continue
+                a, b = Fraction(sa), Fraction(sb)
+                expected = repr_or_none(OPS[op], a, b)
+                target = Fraction(sa)
+                got = repr_or_none(self.IOPS[op], target, b)
+                if expected is None:
+                    assert got is None and str(target) == str(a)
+                else:
+                    assert str(target) == str(OPS[op](a, b))
+                    assert target.count == OPS[op](a, b).count
+
+    def test_updates_same_object(self):
+        acc = Fraction("9.95")
+        buf = acc._digits
+        acc_id = id(acc)
+        acc += Fraction("0.05")
+        assert id(acc) == acc_id and acc._digits is buf
+        assert str(acc) == "10" and acc.size() == 3
+        acc -= Fraction("10")
+        assert str(acc) == "0"
+        acc += acc
+        assert str(acc) == "0"
+
+    def test_negative_result_leaves_object_unchanged(self):
+        a = Fraction("1.5")
+        with pytest.raises(ValueError, match="отрицателен"):
+            a -= Fraction("1.51")
+        assert repr(a) == "Fraction('1.5', size=2)"
+
+    def test_exported_view_survives_growth(self):
+        a = Fraction("9.9")
+        view = a.int_part
+        a += Fraction("0.1")
+        assert str(a) == "10" and len(view) == 1
+
+    def test_frozen_and_cache(self):
+        a = Fraction("1.5")
+        assert str(a) == "1.5"
+        a *= Fraction("2")
+        assert str(a) == "3" and a == Fraction("3")
+        Fraction.clear_intern()
+
+    def test_frozen_rebinds(self):
+        frozen = Fraction.intern("5")
+        total = frozen
+        total += Fraction("1.5")
+        total -= Fraction("0.5")
+        total *= Fraction("2")
+        assert str(total) == "12" and not total.frozen
+        assert total is not frozen and str(frozen) == "5"
+        assert Fraction.intern("5") is frozen
+        with pytest.raises(TypeError):
+            frozen[0] = 1
+        with pytest.raises(TypeError):
+            frozen += 1
+        Fraction.clear_intern()
+
+    def test_sum(self):
+        rng = random.Random(13)
+        values = [Fraction(random_number(rng)) for _ in range(200)]
+        expected = Fraction("0")
+        for v in values:
+            expected = expected + v
+        assert Fraction.sum(values) == expected
+        assert str(Fraction.sum([])) == "0"
+        with pytest.raises(TypeError):
+            Fraction.sum([Fraction("1"), 2])
+
+
+def quantized(value: Decimal, precision: int, rounding: str) -> str | None:
+    # Ожидаемый результат: precision цифр всего, как count у Fraction.
+    width = len(str(int(value))) if value >= 1 else 0
+    scale = precision - max(width, 1)
+    if scale < 0:
+        return None
+    res = Fraction.from_decimal(value.quantize(Decimal(1).scaleb(-scale), rounding))
+    return str(res) if res.count <= precision else None
+
+
+class TestDivision:
+    MODES = [ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_HALF_DOWN, ROUND_DOWN, ROUND_UP]
+
+    @pytest.mark.parametrize("newton_threshold", [1, Fraction.NEWTON_THRESHOLD])
+    def test_matches_decimal(self, monkeypatch, newton_threshold):
+        monkeypatch.setattr(Fraction, "NEWTON_THRESHOLD", newton_threshold)
+        rng = random.Random(15)
+        for _ in range(400):
+            a = Fraction(random_number(rng, "01259")[:20])
+            b = Fraction(random_number(rng, "01259")[:20])
+            mode = rng.choice(self.MODES + [ROUND_05UP])
+            precision = rng.randint(1, 40)
+            with localcontext(prec=300):
+                div = b and quantized(a.to_decimal() / b.to_decimal(), precision, mode)
+                root = quantized(a.to_decimal().sqrt(), precision, mode)
+            if b:
+                assert repr_or_none(a.divide, b, precision, mode) == (
+                    div and repr(Fraction(div))
+                )
+            assert repr_or_none(a.sqrt, precision, mode) == (
+                root and repr(Fraction(root))
+            )
+
+    def test_fills_max_size(self):
+        assert str(Fraction("1") / Fraction("3")) == "0." + "3" * 99
+        assert str(Fraction("200") / Fraction("3")) == "66." + "6" * 97 + "7"
+        assert str(Fraction("1") / Fraction("8")) == "0.125"
+        with Fraction.local_max_size(5):
+            assert str(Fraction("2").sqrt()) == "1.4142"
+            assert str(Fraction("4").reciprocal()) == "0.25"
+
+    @pytest.mark.parametrize(
+        "rounding,expected",
+        [(ROUND_HALF_EVEN, "0.67"), (ROUND_DOWN, "0.66"), (ROUND_UP, "0.67")],
+    )
+    def test_explicit_rounding(self, rounding, expected):
+        assert str(Fraction("2").divide(Fraction("3"), 3, rounding)) == expected
+        one, x = Fraction("1"), Fraction("0.125")
+        assert str(x.divide(one, 3, ROUND_HALF_EVEN)) == "0.12"
+        assert str(x.divide(one, 3, ROUND_HALF_UP)) == "0.13"
+
+    def test_errors(self):
+        with pytest.raises(ZeroDivisionError):
+            Fraction("1") / Fraction("0.0")
+        with pytest.raises(ZeroDivisionError):
+            Fraction("0").reciprocal()
+        with pytest.raises(ValueError, match="режим"):
+            Fraction("1").divide(Fraction("3"), rounding="nearest")
+        with pytest.raises(ValueError):
+            Fraction("1").sqrt(Fraction.MAX_SIZE + 1)
+        with pytest.raises(ValueError):
+            Fraction("12345").divide(Fraction("0.1"), 5)
+        with pytest.raises(ValueError):
+            Fraction("99.6").divide(Fraction("1"), 2, ROUND_UP)
+        with pytest.raises(TypeError):
+            Fraction("1") / 2
+
+    @pytest.mark.parametrize("newton_threshold", [1, Fraction.NEWTON_THRESHOLD])
+    def test_large_precision(self, monkeypatch, newton_threshold):
+        monkeypatch.setattr(Fraction, "NEWTON_THRESHOLD", newton_threshold)
+        with Fraction.local_max_size(6001):
+            a = Fraction("3." + "1" * 5900)
+            b = Fraction("7." + "9" * 4000)
+            with localcontext(prec=6000):
+                quotient = Fraction.from_decimal(a.to_decimal() / b.to_decimal())
+                root = Fraction.from_decimal(a.to_decimal().sqrt())
+            assert a / b == quotient
+            assert a.sqrt(6000) == root
+
+
+class TestConversions:
+    def test_int_float_round_match_decimal(self):
+        rng = random.Random(17)
+        for _ in range(300):
+            s = random_number(rng, "0459")[:20]
+            f, d = Fraction(s), Decimal(s)
+            assert int(f) == int(d)
+            assert float(f) == float(d)
+            assert round(f) == round(d)
+            assert round(f, 2) == Fraction.from_decimal(round(d, 2))
+            assert int(round(f, -1)) == int(round(d, -1))
+
+    def test_float_is_correctly_rounded(self):
+        assert float(Fraction("0.1")) == 0.1
+        assert float(Fraction("9007199254740993")) == 9007199254740992.0
+        assert float(Fraction("0." + "0" * 30 + "1")) == 1e-31
+        with Fraction.local_max_size(400):
+            big = Fraction("9" * 400)
+        assert float(big) == float(Decimal(str(big))) == float("inf")
+
+    def test_long_values(self):
+        with Fraction.local_max_size(2000):
+            f = Fraction("7" * 1500 + ".5")
+            assert int(f) == int("7" * 1500)
+            assert round(f) == int("7" * 1499 + "8")
+            assert f.format(",.0f", ROUND_DOWN) == format(int(f), ",")
+
+    @pytest.mark.parametrize(
+        "spec",
+        [".2f", ",.3f", "+012,.1f", "*^15.2f", ".0f"]
+        + [".1%", "=+10.2F", " .4f", "020,.2f"],
+    )
+    @pytest.mark.parametrize("rounding", [ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_DOWN])
+    def test_format_matches_decimal(self, spec, rounding):
+        rng = random.Random(18)
+        for _ in range(100):
+            s = random_number(rng, "0459")[:20]
+            with localcontext(rounding=rounding):
+                expected = format(Decimal(s), spec)
+            assert Fraction(s).format(spec, rounding) == expected
+
+    def test_format_defaults(self):
+        f = Fraction("1234.5")
+        assert f"{f}" == "1234.5" and f"{f:,}" == "1,234.5"
+        assert f"{f:>10}" == "    1234.5" and f"{f:.0f}" == "1234"
+        assert f"{Fraction('2.5'):.0f}" == "2"
+        assert Fraction("2.5").format(".0f", ROUND_HALF_UP) == "3"
+        assert f"{Fraction('0.125'):%}" == "12.5%"
+        with pytest.raises(ValueError, match="формат"):
+            format(f, "e")
+        with pytest.raises(ValueError, match="режим"):
+            f.format(".0f", "nearest")
+
+
+class TestLargePrecision:
+    def test_local_max_size(self):
+        digits = "1" * 150
+        with pytest.raises(ValueError, match="Превышен максимальный размер"):
+            Fraction(digits)
+        with Fraction.local_max_size(200):
+            assert Fraction.max_size() == 200
+            assert len(Fraction(digits)) == 150
+            with Fraction.local_max_size(120):
+                with pytest.raises(ValueError):
+                    Fraction(digits)
+            assert Fraction.max_size() == 200
+        assert Fraction.max_size() == Fraction.MAX_SIZE
+
+    def test_local_max_size_invalid(self):
+        with pytest.raises(ValueError):
+            with Fraction.local_max_size(0):
+                pass
+
+    def test_local_max_size_is_thread_local(self):
+        seen = []
+        with Fraction.local_max_size(5000):
+            thread = threading.Thread(target=lambda: seen.append(Fraction.max_size()))
+            thread.start()
+            thread.join()
+        assert seen == [Fraction.MAX_SIZE]
+
+    @pytest.mark.parametrize("mul_threshold", [10**9, Fraction.DECIMAL_MUL_THRESHOLD])
+    def test_large_multiplication(self, monkeypatch, mul_threshold):
+        monkeypatch.setattr(Fraction, "DECIMAL_MUL_THRESHOLD", mul_threshold)
+        rng = random.Random(8)
+        int_str = "".join(rng.choice("0123456789") for _ in range(1500))
+        frac_str = "".join(rng.choice("0123456789") for _ in range(1499)) + "7"
+        with Fraction.local_max_size(6000):
+            a = Fraction(int_str + "." + frac_str)
+            res = a * a
+        with localcontext(prec=7000):
+            expected = Decimal(int_str + "." + frac_str) ** 2
+        assert str(res) == format(expected, "f")
+
+    def test_large_multiplication_paths_agree(self, monkeypatch):
+        rng = random.Random(9)
+        with Fraction.local_max_size(1000):
+
+            def operand() -> Fraction:
+                # 400-1000 цифр: рядом с порогом, с округлением и переполнением.
+                tail = "".join(rng.choice("0159") for _ in range(rng.randint(400, 900)))
+                return Fraction(random_number(rng, "0159") + tail)
+
+            for _ in range(40):
+                a, b = operand(), operand()
+                results = []
+                for threshold in (10**9, 1):
+                    monkeypatch.setattr(Fraction, "DECIMAL_MUL_THRESHOLD", threshold)
+                    results.append(repr_or_none(operator.mul, a, b))
+                assert results[0] == results[1], (str(a), str(b))
+
+
+def as_strings(values) -> list[str]:
+    return [str(f) for f in values]
+
+
+class TestFractionArray:
+    @pytest.fixture
+    def operands(self):
+        rng = random.Random(12)
+        a = [Fraction(random_number(rng)[:30]) for _ in range(200)]
+        b = [Fraction(random_number(rng)[:30]) for _ in range(200)]
+        return a, b
+
+    def test_roundtrip(self, operands):
+        a, _ = operands
+        arr = FractionArray(a)
+        assert len(arr) == len(a)
+        assert as_strings(arr.tolist()) == as_strings(a)
+        assert str(arr[5]) == str(a[5])
+        assert as_strings(FractionArray(["1.50", "007", "0.0"])) == ["1.5", "7", "0"]
+
+    def test_arithmetic_matches_fraction(self, operands):
+        a, b = operands
+        x, y = FractionArray(a), FractionArray(b)
+        assert as_strings(x + y) == as_strings(p + q for p, q in zip(a, b))
+        assert as_strings(x * y) == as_strings(p * q for p, q in zip(a, b))
+        hi = FractionArray(max(p, q) for p, q in zip(a, b))
+        lo = FractionArray(min(p, q) for p, q in zip(a, b))
+        expected = [max(p, q) - min(p, q) for p, q in zip(a, b)]
+        assert as_strings(hi - lo) == as_strings(expected)
+
+    def test_negative_result_raises(self):
+        with pytest.raises(ValueError, match="Результат вычитания отрицателен"):
+            _ = FractionArray(["1", "2"]) - FractionArray(["0.5", "2.01"])
+
+    def test_rounds_to_max_size_like_fraction(self):
+        a = "1." + "123456789" * 6
+        values = (a, "1.5", "9" * 40 + "." + "9" * 59, "5." + "7" * 98)
+        near = [Fraction(v) for v in values]
+        x = FractionArray(near)
+        for op in (operator.mul, operator.add):
+            res = op(x, x)
+            assert as_strings(res) == as_strings(op(f, f) for f in near)
+            assert repr(res).startswith("FractionArray")
+            # Сумма точная и округляется один раз.
+            with localcontext(prec=1000):
+                total = sum(f.to_decimal() for f in res)
+            with localcontext(prec=Fraction.MAX_SIZE):
+                assert res.sum() == Fraction.from_decimal(+total)
+        with Fraction.local_max_size(5):
+            y = FractionArray(["1.2345", "99.999", "0.15"])
+            z = FractionArray(["0.0005", "0.0005", "3"])
+            assert as_strings(y * y) == ["1.524", "9999.8", "0.0225"]
+            assert as_strings(y + z) == ["1.235", "100", "3.15"]
+        with pytest.raises(ValueError, match="Превышен максимальный размер"):
+            _ = FractionArray(["9" * 60]) * FractionArray(["9" * 60])
+
+    def test_scalar_broadcast(self):
+        arr = FractionArray(["1.5", "0.25"])
+        assert as_strings(arr + Fraction("1")) == ["2.5", "1.25"]
+        assert as_strings(Fraction("3") * arr) == ["4.5", "0.75"]
+        assert as_strings(Fraction("2") - arr) == ["0.5", "1.75"]
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            _ = FractionArray(["1", "2"]) + FractionArray(["1", "2", "3"])
+
+    def test_comparisons(self, operands):
+        a, b = operands
+        x, y = FractionArray(a), FractionArray(b)
+        assert list(x < y) == [p < q for p, q in zip(a, b)]
+        assert list(x >= y) == [p >= q for p, q in zip(a, b)]
+        assert list(x == FractionArray(a)) == [True] * len(a)
+        assert list(FractionArray(["1.5", "2"]) != Fraction("1.50")) == [False, True]
+
+    def test_argsort_and_sum(self, operands):
+        a, _ = operands
+        arr = FractionArray(a)
+        assert as_strings(a[i] for i in arr.argsort()) == as_strings(sorted(a))
+        assert as_strings(arr.sorted()) == as_strings(sorted(a))
+        total = Fraction("0")
+        for f in a:
+            total = total + f
+        assert str(arr.sum()) == str(total)
+
+    def test_indexing(self, operands):
+        a, _ = operands
+        arr = FractionArray(a)
+        assert str(arr[-1]) == str(a[-1])
+        assert str(arr[np.int64(3)]) == str(a[3])
+        assert str(arr[arr.argsort()[0]]) == str(min(a))
+        assert as_strings(arr[10:20:3]) == as_strings(a[10:20:3])
+        assert as_strings(arr[arr.argsort()]) == as_strings(sorted(a))
+        assert as_strings(arr[[2, -1]]) == as_strings([a[2], a[-1]])
+        mask = arr > Fraction("1")
+        assert as_strings(arr[mask]) == as_strings(f for f in a if f > Fraction("1"))
+        assert len(arr[[]]) == 0
+        for bad in (len(a), -len(a) - 1):
+            with pytest.raises(IndexError):
+                arr[bad]
+        for bad in (1.5, "1", [[0]], [0.5]):
+            with pytest.raises(TypeError):
+                arr[bad]
+
+    def test_empty(self):
+        arr = FractionArray()
+        assert len(arr) == 0
+        assert arr.tolist() == []
+        assert str(arr.sum()) == "0"
+
+
+
+class TestBulkParsing:
+    DATA = (
+        b"1.50\n  +007.250 \r\n\n-3\n1.2.3\nabc\n.\n"
+        + b"9" * 101
+        + "\n\u0663.5\n12".encode()
+    )
+    VALUES = ["1.5", "7.25", "0", "3.5", "12"]
+    ERRORS = [
+        (3, "Строка числа пуста"),
+        (4, "Число должно быть беззнаковым"),
+        (5, "Неверный формат числа"),
+        (6, "Строка должна содержать только цифры и точку"),
+        (8, "Превышен максимальный размер Fraction"),
+    ]
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 1 << 20])
+    def test_parse_stream_collects_errors(self, chunk_size):
+        errors = []
+        stream = io.BytesIO(self.DATA)
+        values = Fraction.parse_stream(stream, errors, chunk_size=chunk_size)
+        assert as_strings(values) == self.VALUES
+        assert errors == self.ERRORS
+
+    def test_parse_stream_text(self):
+        stream = io.StringIO(self.DATA.decode())
+        assert as_strings(Fraction.parse_stream(stream, chunk_size=7)) == self.VALUES
+
+    def test_parse_stream_as_array(self):
+        stream = io.BytesIO(b"1.5\n2.25\n3\n4\n")
+        blocks = list(Fraction.parse_stream(stream, chunk_size=8, as_array=True))
+        assert all(isinstance(block, FractionArray) for block in blocks)
+        assert [str(f) for block in blocks for f in block] == ["1.5", "2.25", "3", "4"]
+
+    def test_parse_stream_is_lazy(self):
+        stream = io.BytesIO(b"1\n2\n3\n" * 1000)
+        values = Fraction.parse_stream(stream, chunk_size=6)
+        assert str(next(values)) == "1"
+        assert stream.tell() < 100
+
+    def test_parsed_values_behave_like_constructed(self):
+        (f,) = Fraction.parse_many(["0012.3400"])
+        assert repr(f) == repr(Fraction("0012.3400"))
+        assert list(f) == list(Fraction("12.34"))
+        f[0] = 5
+        f += Fraction("1")
+        assert str(f) == "16.34"
+
+    def test_parse_many(self):
+        errors = []
+        values = Fraction.parse_many(["1", "x", "2.50"], errors)
+        assert as_strings(values) == ["1", "2.5"]
+        assert errors == [(2, "Строка должна содержать только цифры и точку")]
+        arr = Fraction.parse_many(["1", "2.50"], as_array=True)
+        assert as_strings(arr) == ["1", "2.5"]
+
+
+class TestBatch:
+    OPS = [
+        ("+", "1.5", "2"),
+        ("-", "1", "2"),
+        ("*", Fraction("1.5"), "3"),
+        ("/", "1", "2"),
+    ]
+
+    def test_decimal_context_untouched(self):
+        with localcontext() as ctx:
+            ctx.prec = 7
+            a = Fraction("1." + "3" * 50)
+            Fraction.from_decimal(a.to_decimal())
+            a * a + a
+            assert getcontext().prec == 7
+
+    def test_pickle_roundtrip(self):
+        a = Fraction("0012.340", size=20)
+        b = pickle.loads(pickle.dumps(a))
+        assert repr(b) == repr(a) and b == a
+
+    @pytest.mark.parametrize("workers,processes", [(1, True), (3, False), (2, True)])
+    def test_results_in_input_order(self, workers, processes):
+        rng = random.Random(11)
+        ops = [
+            (rng.choice("+*"), random_number(rng), random_number(rng))
+            for _ in range(50)
+        ]
+        expected = [str(OPS[op](Fraction(a), Fraction(b))) for op, a, b in ops]
+        res = Fraction.evaluate_batch(ops, workers=workers, processes=processes)
+        assert as_strings(res) == expected
+
+    def test_errors_collected(self):
+        errors = []
+        res = Fraction.evaluate_batch(self.OPS, workers=2, errors=errors)
+        assert res[1] is None and res[3] is None
+        assert as_strings(res[::2]) == ["3.5", "4.5"]
+        assert errors == [
+            (1, "Результат вычитания отрицателен"),
+            (3, "Неизвестная операция: '/'"),
+        ]
+        with pytest.raises(ValueError, match="вычитания"):
+            Fraction.evaluate_batch(self.OPS, workers=2, processes=False)
+
+    def test_max_size_reaches_workers(self):
+        ops = [("*", "9" * 6, "9" * 6)] * 4
+        with Fraction.local_max_size(10):
+            errors = []
+            Fraction.evaluate_batch(ops, workers=2, errors=errors)
+        assert [i for i, _ in errors] == [0, 1, 2, 3]
+
+
+class TestHashing:
+    @pytest.fixture(autouse=True)
+    def clean_intern(self):
+        Fraction.clear_intern()
+        yield
+        Fraction.clear_intern()
+
+    def test_hash_consistent_with_eq(self):
+        assert hash(Fraction("1.50")) == hash(Fraction("001.5", size=10))
+        assert len({Fraction("1.50"), Fraction("1.5"), Fraction("2")}) == 2
+        prices = {Fraction("0.10"): "a"}
+        assert prices[Fraction(".1")] == "a"
+
+    def test_hash_follows_mutation(self):
+        f = Fraction("1.5")
+        f[1] = 2
+        assert hash(f) == hash(Fraction("1.2"))
+
+    def test_intern_shares_instance(self):
+        a = Fraction.intern("1.50")
+        assert Fraction.intern("1.5") is a
+        assert Fraction.intern(Fraction("01.5")) is a
+        assert a.frozen and not Fraction("1.5").frozen
+        assert Fraction.intern_info() == {
+            "size": 1,
+            "maxsize": Fraction.INTERN_SIZE,
+            "hits": 2,
+            "misses": 1,
+            "hit_rate": 2 / 3,
+        }
+
+    def test_intern_does_not_freeze_argument(self):
+        f = Fraction("3")
+        assert Fraction.intern(f) is not f
+        f[0] = 4
+        assert str(Fraction.intern("3")) == "3"
+
+    def test_interned_is_immutable(self):
+        a = Fraction.intern("7.25")
+        with pytest.raises(TypeError):
+            a[0] = 1
+        assert str(a) == "7.25"
+        assert not pickle.loads(pickle.dumps(a)).frozen
+
+    def test_intern_lru_eviction(self, monkeypatch):
+        monkeypatch.setattr(Fraction, "INTERN_SIZE", 2)
+        a = Fraction.intern("1")
+        Fraction.intern("2")
+        assert Fraction.intern("1") is a
+        Fraction.intern("3")
+        assert Fraction.intern_info()["size"] == 2
+        assert Fraction.intern("1") is a
+        assert Fraction.intern_info()["misses"] == 3
+        Fraction.intern("2")
+        assert Fraction.intern_info()["misses"] == 4
+
+    def test_intern_rejects_other_types(self):
+        with pytest.raises(TypeError):
+            Fraction.intern(1.5)
+        with pytest.raises(ValueError):
+            Fraction.intern("-1")
+
+
+class TestSerialization:
+    def test_roundtrip(self):
+        rng = random.Random(16)
+        for _ in range(300):
+            f = Fraction(random_number(rng), size=120)
+            g = Fraction.from_bytes(f.to_bytes())
+            assert repr(g) == repr(f) and list(g) == list(f)
+
+    def test_layout_and_compactness(self):
+        data = Fraction("0012.3400", size=10).to_bytes()
+        assert data == bytes.fromhex("0302020a2134")
+        assert len(Fraction("9" * 100).to_bytes()) == 1 + 3 + 50
+
+    def test_keeps_raw_digits(self):
+        f = Fraction("10.5")
+        f[1] = 0
+        g = Fraction.from_bytes(f.to_bytes())
+        assert list(g) == [0, 0, 5] and g == Fraction("0.5")
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"\x03\x01\x01",
+            b"\x03\x01\x01\x02\xff",
+            b"\x03\x00\x01\x02\x12",
+            b"\x02\x01\x01\x02\x12",
+            b"\x03\x01\x01\x02\x12\x00",
+        ],
+    )
+    def test_rejects_malformed(self, data):
+        with pytest.raises(ValueError):
+            Fraction.from_bytes(data)
+
+    def test_store_random_access(self, tmp_path):
+        path = str(tmp_path / "values.frs")
+        values = [Fraction(f"{i}.{i % 7}0") for i in range(5000)]
+        assert FractionStore.write(path, values) == 5000
+        with FractionStore(path) as store:
+            assert len(store) == 5000
+            for k in (0, 1, 2500, 4999, -1):
+                assert repr(store[k]) == repr(values[k])
+            assert as_strings(store) == as_strings(values)
+            with pytest.raises(IndexError):
+                store[5000]
+
+    def test_store_errors(self, tmp_path):
+        path = str(tmp_path / "values.frs")
+        with pytest.raises(TypeError):
+            FractionStore.write(path, ["1.5"])
+        FractionStore.write(path, [])
+        with FractionStore(path) as store:
+            assert len(store) == 0 and list(store) == []
+        with open(path, "r+b") as f:
+            f.seek(-4, os.SEEK_END)
+            f.write(b"XXXX")
+        with pytest.raises(ValueError):
+            FractionStore(path)
+        open(path, "wb").close()
+        with pytest.raises(ValueError):
+            FractionStore(path)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
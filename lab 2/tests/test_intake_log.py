@@ -0,0 +1,78 @@
+import math
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from individ.Zad.intake_log import IntakeLog  # noqa: E402
+from individ.Zad.zad_1 import Kalor  # noqa: E402
+
+
+def brute_force(history, latest, window, bucket):
+    head = math.floor(latest / bucket)
+    span = math.ceil(window / bucket)
+    return sum(p for t, p in history if math.floor(t / bucket) > head - span)
+
+
+class TestIntakeLog:
+    def test_default_windows(self):
+        log = IntakeLog()
+        day = 86400
+        log.add(0, Kalor(250, 0.2))
+        log.add(2 * day, Kalor(100, 0.5))
+        log.add(10 * day, Kalor(300, 0.1))
+        totals = log.totals()
+        assert totals["24h"] == pytest.approx(300)
+        assert totals["7d"] == pytest.approx(300)
+        assert totals["30d"] == pytest.approx(300 + 500 + 500)
+        assert len(log) == 3
+        log.advance(45 * day)
+        assert log.totals() == {"24h": 0.0, "7d": 0.0, "30d": 0.0}
+
+    def test_matches_brute_force(self):
+        rng = random.Random(21)
+        bucket, lateness = 10, 300
+        windows = {"short": 600, "long": 7200}
+        log = IntakeLog(windows, bucket=bucket, lateness=lateness)
+        history = []
+        t = 0.0
+        for i in range(3000):
+            t += rng.choice([0, 1, 25, 400, 9000])
+            ts = t - rng.uniform(0, lateness) if rng.random() < 0.3 else t
+            portion = Kalor(rng.randint(1, 900), rng.uniform(0.01, 1))
+            log.add(ts, portion)
+            history.append((ts, portion.power()))
+            if i % 100 == 0:
+                for name, window in windows.items():
+                    expected = brute_force(history, log.latest, window, bucket)
+                    assert log.total(name) == pytest.approx(expected, abs=1e-6)
+
+    def test_lateness(self):
+        log = IntakeLog({"1h": 3600}, lateness=600)
+        start = datetime(2024, 1, 1, 12)
+        log.add(start, Kalor(100, 1))
+        log.add(start - timedelta(minutes=5), Kalor(100, 1))
+        with pytest.raises(ValueError, match="опоздала"):
+            log.add(start - timedelta(minutes=20), Kalor(100, 1))
+        assert log.total("1h") == pytest.approx(2000)
+
+    def test_extend_collects_errors(self):
+        log = IntakeLog({"1h": 3600}, lateness=0)
+        errors = []
+        entries = [(100, Kalor(100, 1)), (50, Kalor(100, 1)), (200, (100, 1))]
+        log.extend(entries, errors)
+        assert [i for i, _ in errors] == [1, 2]
+        assert len(log) == 1
+        with pytest.raises(ValueError):
+            log.extend(entries)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            IntakeLog({"x": 0})
+        with pytest.raises(ValueError):
+            IntakeLog(bucket=0)
+        with pytest.raises(KeyError):
+            IntakeLog().total("1y")
@@ -4,10 +4,17 @@ import sys
 from io import StringIO
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
-from individ.Zad.zad_1 import Kalor, make_Point  # noqa: E402
+from individ.Zad.zad_1 import (  # noqa: E402
+    Kalor,
+    KalorBatch,
+    KalorIndex,
+    NutrientKalor,
+    make_Point,
+)
 
 
 class TestKalor:
@@ -207,6 +214,285 @@ class TestKalor:
             k.set_values("x", 0.3)
 
 
+class TestKalorMix:
+    values = [Kalor(250, 0.35), Kalor(100, 1.2), Kalor(540, 0.1), Kalor(30, 2.0)]
+
+    def test_mix_rounds_once(self):
+        mixed = Kalor.mix(self.values)
+        total_mass = sum(v.second for v in self.values)
+        total = sum(v.power() for v in self.values)
+        assert math.isclose(mixed.second, total_mass)
+        assert mixed.first == round(total / (total_mass * 10))
+        assert Kalor.mix(self.values[:2]) == self.values[0] + self.values[1]
+
+    def test_mix_generator_and_weights(self):
+        weights = [1, 2, 0.5, 3]
+        expected = Kalor.mix(v * w for v, w in zip(self.values, weights))
+        assert Kalor.mix(iter(self.values), (w for w in weights)) == expected
+        assert Kalor.mix(KalorBatch(self.values), weights) == expected
+        assert Kalor.mix(KalorBatch(self.values)) == Kalor.mix(self.values)
+
+    def test_mix_batch_with_generator_weights(self):
+        weights = [1, 2, 0.5, 3]
+        batch = KalorBatch(self.values)
+        expected = Kalor.mix(self.values, weights)
+        assert Kalor.mix(batch, (w for w in weights)) == expected
+        assert Kalor.mix(batch, iter(weights)) == expected
+        with pytest.raises(ValueError, match="Множитель должен быть положительным."):
+            Kalor.mix(batch, (w for w in [1, 1, 0, 1]))
+        with pytest.raises(TypeError, match="Умножать можно только на число."):
+            Kalor.mix(batch, (w for w in [1, "a", 1, 1]))
+        with pytest.raises(ValueError, match="Длина"):
+            Kalor.mix(batch, (w for w in [1, 1]))
+
+    def test_mix_invalid(self):
+        with pytest.raises(ValueError, match="пуст"):
+            Kalor.mix([])
+        with pytest.raises(TypeError):
+            Kalor.mix([Kalor(100, 1.0), 5])
+        with pytest.raises(ValueError, match="Множитель должен быть положительным."):
+            Kalor.mix(self.values, [1, 1, 0, 1])
+        with pytest.raises(ValueError):
+            Kalor.mix(self.values, [1, 1])
+
+
+class TestKalorBatch:
+    values = [Kalor(250, 0.35), Kalor(100, 1.2), Kalor(540, 0.1), Kalor(30, 2.0)]
+
+    def test_columns(self):
+        batch = KalorBatch(self.values)
+        assert batch.first.dtype == np.int32
+        assert batch.second.dtype == np.float64
+        assert len(batch) == 4
+        assert batch.tolist() == self.values
+        assert batch[1] == Kalor(100, 1.2)
+        with pytest.raises(ValueError):
+            batch.first[0] = 1
+
+    def test_from_columns_invalid(self):
+        with pytest.raises(ValueError, match="Параметры должны быть положительными."):
+            KalorBatch.from_columns([100, 0], [0.5, 0.5])
+        with pytest.raises(ValueError, match="одной длины"):
+            KalorBatch.from_columns([100, 200], [0.5])
+        with pytest.raises(TypeError):
+            KalorBatch([Kalor(100, 0.5), (100, 0.5)])
+
+    def test_power_and_total_match_objects(self):
+        batch = KalorBatch(self.values)
+        expected = [v.power() for v in self.values]
+        assert np.allclose(batch.power(), expected)
+        assert math.isclose(batch.total(), sum(expected))
+
+    def test_add_matches_object_add(self):
+        batch = KalorBatch(self.values)
+        other = KalorBatch(reversed(self.values))
+        assert (batch + other).tolist() == [
+            a + b for a, b in zip(self.values, reversed(self.values))
+        ]
+        assert (batch + Kalor(80, 0.5)).tolist() == [
+            v + Kalor(80, 0.5) for v in self.values
+        ]
+        with pytest.raises(ValueError):
+            batch + batch[:2]
+
+    def test_mix(self):
+        mixed = KalorBatch(self.values).mix()
+        total_mass = sum(v.second for v in self.values)
+        assert math.isclose(mixed.second, total_mass)
+        total = sum(v.power() for v in self.values)
+        assert mixed.first == round(total / (total_mass * 10))
+        assert KalorBatch(self.values[:2]).mix() == self.values[0] + self.values[1]
+        with pytest.raises(ValueError):
+            KalorBatch().mix()
+
+    def test_scaling(self):
+        batch = KalorBatch(self.values)
+        assert (batch * 2).tolist() == [v * 2 for v in self.values]
+        assert (2 * batch).tolist() == [v * 2 for v in self.values]
+        assert (batch / 4).tolist() == [v / 4 for v in self.values]
+        factors = [1, 2, 3, 4]
+        assert (batch * factors).tolist() == [
+            v * f for v, f in zip(self.values, factors)
+        ]
+        with pytest.raises(ValueError, match="Множитель должен быть положительным."):
+            batch * -1
+        with pytest.raises(ValueError, match="Делитель должен быть положительным."):
+            batch / [1, 1, 0, 1]
+        with pytest.raises(TypeError):
+            batch * "2"
+
+    def test_filters_and_sorting(self):
+        batch = KalorBatch(self.values)
+        light = batch[batch < Kalor(100, 1.0)]
+        assert light.tolist() == [v for v in self.values if v < Kalor(100, 1.0)]
+        assert batch.sorted().tolist() == sorted(self.values)
+        assert list(batch.argsort()) == sorted(
+            range(len(self.values)), key=lambda i: self.values[i].power()
+        )
+        assert list(batch == KalorBatch(self.values)) == [True] * 4
+        assert list(batch != batch[::-1]) == [True] * 4
+
+
+class TestKalorIndex:
+    values = [Kalor(250, 0.35), Kalor(100, 1.2), Kalor(540, 0.1), Kalor(30, 2.0)]
+
+    def test_order_and_top_k(self):
+        index = KalorIndex(self.values)
+        assert list(index) == sorted(self.values)
+        assert index.top_k(2) == sorted(self.values, reverse=True)[:2]
+        assert index.top_k(10) == sorted(self.values, reverse=True)
+        assert index.top_k(0) == []
+        assert index.top_k(2, by="density") == [Kalor(540, 0.1), Kalor(250, 0.35)]
+        with pytest.raises(ValueError):
+            index.top_k(1, by="mass")
+
+    def test_between(self):
+        index = KalorIndex(self.values)
+        expected = [v for v in sorted(self.values) if 500 <= v.power() <= 1200]
+        assert index.between(500, 1200) == expected
+        assert index.count_between(500, 1200) == len(expected)
+        assert index.between(5000, 6000) == []
+
+    def test_add_and_remove(self):
+        index = KalorIndex(self.values)
+        extra = Kalor(200, 0.4)
+        index.add(extra)
+        assert extra in index
+        assert list(index) == sorted(self.values + [extra])
+        index.remove(Kalor(100, 1.2))
+        assert Kalor(100, 1.2) not in index
+        assert len(index) == 4
+        with pytest.raises(ValueError, match="не найден"):
+            index.remove(Kalor(100, 1.2))
+        with pytest.raises(TypeError):
+            index.add((100, 1.2))
+
+    def test_from_batch(self):
+        index = KalorIndex(KalorBatch(self.values))
+        assert list(index) == sorted(self.values)
+        assert index.top_k(1, by="density") == [Kalor(540, 0.1)]
+        index.add(Kalor(900, 0.01))
+        assert index.top_k(1, by="density") == [Kalor(900, 0.01)]
+
+
+class TestLoadCsv:
+    text = "kcal,mass\n250,0.35\n100,1.2\n\nx,1\n0,0.5\n540,0.1\n12.5,1\n30,2"
+    valid = [Kalor(250, 0.35), Kalor(100, 1.2), Kalor(540, 0.1), Kalor(30, 2.0)]
+
+    def test_rows_from_stream(self):
+        errors = []
+        values = list(Kalor.load_csv(StringIO(self.text), errors, skip_header=True))
+        assert values == self.valid
+        assert [line for line, _ in errors] == [5, 6, 8]
+        assert errors[1][1] == "Параметры должны быть положительными."
+
+    def test_errors_optional(self):
+        assert list(Kalor.load_csv(StringIO(self.text), skip_header=True)) == self.valid
+
+    def test_batches_from_path(self, tmp_path):
+        path = tmp_path / "products.csv"
+        path.write_text(self.text)
+        errors = []
+        batches = list(
+            KalorBatch.load_csv(path, errors, chunk_size=16, skip_header=True)
+        )
+        assert len(batches) > 1
+        assert [v for b in batches for v in b] == self.valid
+        assert [line for line, _ in errors] == [5, 6, 8]
+
+    def test_columns_and_delimiter(self):
+        text = "хлеб;250;0.35\nмолоко;64;1"
+        values = list(Kalor.load_csv(StringIO(text), delimiter=";", columns=(1, 2)))
+        assert values == [Kalor(250, 0.35), Kalor(64, 1.0)]
+
+    def test_process_pool(self, tmp_path):
+        lines = [f"{i % 900 + 1},{i % 7 + 1}" for i in range(5000)]
+        lines[1234] = "bad,1"
+        path = tmp_path / "big.csv"
+        path.write_text("\n".join(lines))
+        serial, parallel = [], []
+        one = list(Kalor.load_csv(path, serial))
+        many = [
+            v
+            for b in KalorBatch.load_csv(path, parallel, chunk_size=4096, workers=2)
+            for v in b
+        ]
+        assert one == many
+        assert len(one) == 4999
+        assert serial == parallel == [(1235, "Параметры должны быть числами.")]
+        with pytest.raises(TypeError):
+            list(KalorBatch.load_csv(StringIO("1,1"), workers=2))
+
+
+class TestNutrientKalor:
+    bread = NutrientKalor((250, 8, 3, 50), 0.3)
+    milk = NutrientKalor((64, 3.2, 3.6, 4.8), 1.0)
+
+    def test_initialization(self):
+        assert self.bread.first == 250
+        assert list(self.bread.per100) == [250, 8, 3, 50]
+        assert math.isclose(self.bread.power(), Kalor(250, 0.3).power())
+        with pytest.raises(ValueError, match="Параметры должны быть положительными."):
+            NutrientKalor((0, 1, 1, 1), 1)
+        with pytest.raises(ValueError, match="отрицательным"):
+            NutrientKalor((100, -1, 1, 1), 1)
+        with pytest.raises(ValueError):
+            NutrientKalor((100, 1, 1), 1)
+        with pytest.raises(ValueError, match="Параметры должны быть числами."):
+            NutrientKalor((100, 1, 1, "x"), 1)
+        with pytest.raises(ValueError):
+            self.bread.per100[0] = 1
+
+    def test_add_matches_kalor(self):
+        mixed = self.bread + self.milk
+        assert math.isclose(mixed.second, 1.3)
+        assert math.isclose(mixed.power(), self.bread.power() + self.milk.power())
+        assert mixed.to_kalor() == self.bread.to_kalor() + self.milk.to_kalor()
+        expected = (self.bread.totals() + self.milk.totals()) / 13
+        assert np.allclose(mixed.per100, expected)
+        with pytest.raises(TypeError):
+            self.bread + Kalor(250, 0.3)
+
+    def test_add_is_unrounded(self):
+        a = NutrientKalor((250, 0, 0, 0), 0.35)
+        b = NutrientKalor((150, 0, 0, 0), 0.5)
+        rounded = Kalor(250, 0.35) + Kalor(150, 0.5)
+        assert (a + b).power() == pytest.approx(1625.0)
+        assert rounded.power() == pytest.approx(1623.5)
+        assert (a + b).to_kalor() == rounded
+
+    def test_scaling(self):
+        assert (self.bread * 2).second == pytest.approx(0.6)
+        assert (2 * self.bread) == self.bread * 2
+        assert (self.bread / 3).to_kalor() == Kalor(250, 0.3) / 3
+        assert np.allclose((self.bread * 2).totals(), self.bread.totals() * 2)
+        with pytest.raises(ValueError, match="Множитель должен быть положительным."):
+            self.bread * 0
+        with pytest.raises(TypeError):
+            self.bread / object()
+
+    def test_mix_and_comparison(self):
+        values = [self.bread, self.milk, self.bread * 0.5]
+        mixed = NutrientKalor.mix(values)
+        assert mixed == self.bread + self.milk + self.bread * 0.5
+        assert NutrientKalor.mix(values[:2], [2, 1]) == self.bread * 2 + self.milk
+        assert self.milk < self.bread
+        assert self.bread != self.milk
+        with pytest.raises(ValueError):
+            NutrientKalor.mix([])
+
+    def test_aggregate(self):
+        values = [self.bread, self.milk, self.milk * 0.3, self.bread]
+        per100 = np.stack([v.per100 for v in values])
+        masses = [v.second for v in values]
+        vectors, totals = NutrientKalor.aggregate(per100, masses, [0, 0, 2, 2])
+        assert np.allclose(vectors[0], (self.bread + self.milk).per100)
+        assert np.allclose(vectors[2], (self.milk * 0.3 + self.bread).per100)
+        assert totals[1] == 0 and np.isnan(vectors[1]).all()
+        with pytest.raises(ValueError):
+            NutrientKalor.aggregate(per100, masses, [0, 0, 2, 2], count=2)
+
+
 class TestMakePoint:
     def test_make_point_valid(self):
         k = make_Point(250, 0.35)
@@ -0,0 +1,73 @@
+import itertools
+import math
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from individ.Zad.meal_plan import MealPlan, plan_meal  # noqa: E402
+from individ.Zad.zad_1 import Kalor  # noqa: E402
+
+
+def brute_force(products, target, high, step):
+    steps = [range(round(h / step) + 1) for h in high]
+    return min(
+        abs(sum(p.first * u * step * 10 for p, u in zip(products, units)) - target)
+        for units in itertools.product(*steps)
+    )
+
+
+class TestPlanMeal:
+    products = [Kalor(250, 0.3), Kalor(90, 0.5), Kalor(540, 0.1), Kalor(35, 0.4)]
+
+    def test_matches_brute_force(self):
+        for target in (0, 100, 333, 517.5, 2000):
+            plan = plan_meal(self.products, target, step=0.05)
+            assert isinstance(plan, MealPlan)
+            assert plan.method == "dp"
+            best = brute_force(self.products, target, [0.3, 0.5, 0.1, 0.4], 0.05)
+            assert math.isclose(abs(plan.error()), best, abs_tol=1e-6)
+
+    def test_respects_bounds(self):
+        bounds = [(0.1, 0.2), (0, 0.5), (0.05, 0.05), (0, 0.1)]
+        plan = plan_meal(self.products, 600, bounds=bounds, step=0.05)
+        for m, (lo, hi) in zip(plan.masses, bounds):
+            assert lo - 1e-9 <= m <= hi + 1e-9
+        plan = plan_meal(self.products, 10, bounds=(0.2, 1.0), step=0.1)
+        assert all(math.isclose(m, 0.2) for m in plan.masses)
+        assert plan.error() > 0
+
+    def test_items_and_mix(self):
+        plan = plan_meal(self.products, 517.5, step=0.05)
+        items = plan.items
+        assert all(m > 0 for m in (v.second for v in items))
+        assert math.isclose(sum(v.power() for v in items), plan.total())
+        assert math.isclose(plan.mix().second, sum(v.second for v in items))
+
+    def test_greedy_fallback(self):
+        plan = plan_meal(self.products, 517.5, step=0.05, max_cells=10)
+        assert plan.method == "greedy"
+        assert abs(plan.error()) <= 540 * 0.05 * 10
+
+    def test_many_products(self):
+        rng = random.Random(18)
+        products = [
+            Kalor(rng.randint(20, 900), rng.uniform(0.1, 1.0)) for _ in range(1000)
+        ]
+        plan = plan_meal(products, 2345.6)
+        assert plan.method == "dp"
+        assert abs(plan.error()) < 0.05 + 1e-9
+
+    def test_invalid(self):
+        with pytest.raises(TypeError):
+            plan_meal([Kalor(100, 1), (100, 1)], 100)
+        with pytest.raises(ValueError):
+            plan_meal(self.products, 100, step=0)
+        with pytest.raises(ValueError):
+            plan_meal(self.products, -1)
+        with pytest.raises(ValueError):
+            plan_meal(self.products, 100, bounds=[(0, 1)])
+        with pytest.raises(ValueError):
+            plan_meal(self.products, 100, bounds=(0.5, 0.1))